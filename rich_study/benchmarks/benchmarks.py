@@ -0,0 +1,268 @@
+import logging
+from io import StringIO
+from threading import Thread
+
+from rich._wrap import divide_line
+from rich.color import Color, ColorSystem
+from rich.console import Console
+from rich.live import Live
+from rich.logging import RichHandler
+from rich.markdown import Markdown
+from rich.pretty import Pretty
+from rich.progress import Progress
+from rich.progress_bar import ProgressBar
+from rich.style import Style
+from rich.syntax import Syntax
+from rich.table import Table
+from rich.text import Text
+
+from benchmarks import snippets
+
+
+def make_console(**kwargs):
+    """Make a console which writes to a StringIO, with deterministic settings."""
+    kwargs.setdefault("color_system", "truecolor")
+    kwargs.setdefault("width", 100)
+    return Console(
+        file=StringIO(),
+        legacy_windows=False,
+        _environ={},
+        force_terminal=True,
+        **kwargs,
+    )
+
+
+def make_table(rows):
+    table = Table(title="Benchmark", caption="Rows of data")
+    table.add_column("Index", justify="right", style="cyan")
+    table.add_column("Name", style="magenta")
+    table.add_column("Description")
+    table.add_column("Value", justify="right", style="green")
+    for index in range(rows):
+        table.add_row(
+            str(index),
+            f"[bold]row[/bold] {index}",
+            snippets.LOREM_IPSUM[: 20 + index % 80],
+            f"{index * 1.5:.2f}",
+        )
+    return table
+
+
+class ConsolePrintSuite:
+    def setup(self):
+        self.console = make_console()
+        self.table = make_table(500)
+        self.syntax = Syntax(snippets.PYTHON_SNIPPET * 10, "python", line_numbers=True)
+        self.markdown = Markdown(snippets.MARKDOWN * 5)
+        self.pretty = Pretty(snippets.PRETTY_DATA)
+
+    def time_print_table(self):
+        self.console.print(self.table)
+
+    def time_print_syntax(self):
+        self.console.print(self.syntax)
+
+    def time_print_markdown(self):
+        self.console.print(self.markdown)
+
+    def time_print_pretty(self):
+        self.console.print(self.pretty)
+
+    def time_print_markup(self):
+        self.console.print(snippets.MARKUP)
+
+    def peakmem_print_table(self):
+        self.console.print(self.table)
+
+    def peakmem_print_syntax(self):
+        self.console.print(self.syntax)
+
+    def peakmem_print_pretty(self):
+        self.console.print(self.pretty)
+
+
+class TextWrapSuite:
+    params = ["lorem", "cjk", "emoji"]
+    param_names = ["text"]
+
+    def setup(self, text):
+        self.console = make_console()
+        self.plain = {
+            "lorem": snippets.LOREM_IPSUM,
+            "cjk": snippets.CJK_TEXT,
+            "emoji": snippets.EMOJI_TEXT,
+        }[text] * 10
+        self.text = Text(self.plain)
+
+    def time_wrap(self, text):
+        self.text.wrap(self.console, 20)
+
+    def time_wrap_fold(self, text):
+        self.text.wrap(self.console, 7, overflow="fold")
+
+    def time_divide_line(self, text):
+        divide_line(self.plain, 20)
+
+    def peakmem_wrap(self, text):
+        self.text.wrap(self.console, 20)
+
+
+class ProgressSuite:
+    params = [1, 4]
+    param_names = ["threads"]
+
+    def setup(self, threads):
+        self.console = make_console()
+        self.progress = Progress(console=self.console, auto_refresh=False)
+        self.task_ids = [
+            self.progress.add_task(f"task {index}", total=10_000)
+            for index in range(threads)
+        ]
+        for task_id in self.task_ids:
+            for _ in range(1_000):
+                self.progress.advance(task_id)
+
+    def time_update(self, threads):
+        progress = self.progress
+
+        def update(task_id):
+            for _ in range(2_000):
+                progress.update(task_id, advance=1)
+
+        workers = [Thread(target=update, args=(task_id,)) for task_id in self.task_ids]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    def time_speed(self, threads):
+        for task in self.progress.tasks:
+            for _ in range(1_000):
+                task.time_remaining
+
+    def time_refresh(self, threads):
+        progress = self.progress
+        progress.start()
+        try:
+            for _ in range(50):
+                for task_id in self.task_ids:
+                    progress.advance(task_id)
+                progress.refresh()
+        finally:
+            progress.stop()
+
+
+class ProgressPulseSuite:
+    def setup(self):
+        self.console = make_console()
+        self.options = self.console.options
+
+    def time_render_pulse(self):
+        # Progress creates a new bar each time it renders
+        for frame in range(100):
+            bar = ProgressBar(pulse=True, animation_time=frame / 15)
+            list(bar.__rich_console__(self.console, self.options))
+
+
+class LiveSuite:
+    def setup(self):
+        self.console = make_console(height=50)
+        self.table = make_table(40)
+
+    def time_refresh(self):
+        with Live(self.table, console=self.console, auto_refresh=False) as live:
+            for _ in range(20):
+                live.refresh()
+
+    def time_update(self):
+        with Live(console=self.console, auto_refresh=False) as live:
+            for index in range(20):
+                live.update(Text(f"Frame {index} " * 20), refresh=True)
+
+
+class ExportSuite:
+    def setup(self):
+        self.console = make_console(record=True)
+        self.console.print(make_table(100))
+        self.console.print(Syntax(snippets.PYTHON_SNIPPET, "python"))
+
+    def time_export_html(self):
+        self.console.export_html(clear=False)
+
+    def time_export_html_inline_styles(self):
+        self.console.export_html(clear=False, inline_styles=True)
+
+    def time_export_svg(self):
+        self.console.export_svg(clear=False)
+
+    def peakmem_export_svg(self):
+        self.console.export_svg(clear=False)
+
+
+class ColorDowngradeSuite:
+    params = ["eight_bit", "standard", "windows"]
+    param_names = ["system"]
+
+    def setup(self, system):
+        self.system = ColorSystem[system.upper()]
+        # A gradient, with more colors than fit in the downgrade cache
+        self.colors = [
+            Color.from_rgb(red, green, 128)
+            for red in range(0, 256, 4)
+            for green in range(0, 256, 4)
+        ]
+
+    def time_downgrade(self, system):
+        Color.downgrade.cache_clear()
+        for color in self.colors:
+            color.downgrade(self.system)
+
+
+class StyleCombineSuite:
+    def setup(self):
+        # More combinations of styles than fitted in the previous combine cache
+        self.styles = [
+            Style(color=Color.from_ansi(index), bold=bool(index % 2))
+            for index in range(64)
+        ]
+        self.backgrounds = [
+            Style(bgcolor=Color.from_ansi(index)) for index in range(64)
+        ]
+
+    def time_add(self):
+        for style in self.styles:
+            for background in self.backgrounds:
+                style + background
+
+
+class LoggingSuite:
+    def setup(self):
+        self.console = make_console()
+        self.handler = RichHandler(console=self.console)
+        self.record = logging.LogRecord(
+            "benchmark",
+            logging.INFO,
+            __file__,
+            42,
+            "Processed %d items from %s in %.2fs",
+            (1234, "https://textualize.io/data.json", 0.25),
+            None,
+        )
+
+    def time_emit(self):
+        for _ in range(100):
+            self.handler.emit(self.record)
+
+
+class ImportSuite:
+    def timeraw_import_rich(self):
+        return "import rich"
+
+    def timeraw_import_console(self):
+        return "import rich.console"
+
+    def timeraw_import_print(self):
+        return "from rich import print"
+
+    def timeraw_import_logging(self):
+        return "import rich.logging"
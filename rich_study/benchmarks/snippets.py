@@ -0,0 +1,125 @@
+LOREM_IPSUM = """Lorem ipsum dolor sit amet, consectetur adipiscing elit. Quisque in metus sed sapien ultricies pretium a at justo. Maecenas luctus velit et auctor maximus. Donec faucibus vel arcu id pretium. Vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae; Fusce pulvinar varius nibh, nec gravida lectus feugiat quis. In hac habitasse platea dictumst. Mauris varius nec urna et rutrum. Cras malesuada, est sit amet rutrum feugiat, velit lorem tincidunt justo, sit amet ornare eros purus et nisi."""
+
+CJK_TEXT = """日本語のテキストは単語の間にスペースを入れないので、折り返しはセル単位で行われます。中文文本同样没有空格，每个字符占用两个单元格。한국어 텍스트는 공백을 사용하지만 각 글자는 두 칸을 차지합니다。"""
+
+EMOJI_TEXT = """Ship it 🚀 when the build is green ✅ and the reviewers are happy 😀 👍, otherwise roll back 🔙 and investigate 🔍 the logs 📜 before paging 📟 anyone 🙏."""
+
+MARKUP = "\n".join(
+    """[bold]Hello [i]World[/i] [bold magenta]foo [i]bar[/i] baz[/] [blue u]https://textualize.io[/]"""
+    for _ in range(20)
+)
+
+PYTHON_SNIPPET = '''
+def layout_resolve(total: int, edges: Sequence[EdgeProtocol]) -> List[int]:
+    """Divide total space to satisfy size, fraction, and min_size, constraints.
+
+    The returned list of integers should add up to total in most cases, unless it is
+    impossible to satisfy all the constraints. For instance, if there are two edges
+    with a minimum size of 20 each and `total` is 30 then the returned list will be
+    greater than total. In practice, this would mean that a Layout object would
+    clip the rows that would overflow the screen height.
+
+    Args:
+        total (int): Total number of characters.
+        edges (Sequence[Edge]): Edges within total space.
+
+    Returns:
+        list[int]: Number of characters for each edge.
+    """
+    # Size of edge or None for yet to be determined
+    sizes = [(edge.size or None) for edge in edges]
+
+    if None not in sizes:
+        # No flexible edges
+        return cast("list[int]", sizes)
+
+    # Get flexible edges and index to map these back on to sizes list
+    flexible_edges = [
+        (index, edge)
+        for index, (size, edge) in enumerate(zip(sizes, edges))
+        if size is None
+    ]
+    # Remaining space in total
+    remaining = total - sum([size or 0 for size in sizes])
+    if remaining <= 0:
+        # No room for flexible edges
+        return [
+            ((edge.min_size or 1) if size is None else size)
+            for size, edge in zip(sizes, edges)
+        ]
+
+    # Get the total fraction value for all flexible edges
+    total_flexible = sum([(edge.fraction or 1) for _, edge in flexible_edges])
+    while True:
+        portion = Fraction(remaining, total_flexible)
+
+        # If any edges will be less than their minimum, replace size with the minimum
+        for flexible_index, (index, edge) in enumerate(flexible_edges):
+            if portion * edge.fraction < edge.min_size:
+                # This flexible edge will be smaller than its minimum size
+                # We need to fix the size and redistribute the outstanding space
+                sizes[index] = edge.min_size
+                remaining -= edge.min_size
+                total_flexible -= edge.fraction or 1
+                del flexible_edges[flexible_index]
+                # New fixed size will invalidate calculations, so we need to repeat the process
+                break
+        else:
+            # Distribute flexible space and compensate for rounding error
+            # Since edge sizes can only be integers we need to add the remainder
+            # to the following line
+            remainder = Fraction(0)
+            for index, edge in flexible_edges:
+                sizes[index], remainder = divmod(portion * edge.fraction + remainder, 1)
+            break
+
+    # Sizes now contains integers only
+    return cast("list[int]", sizes)
+'''
+
+MARKDOWN = """\
+# Rich
+
+Rich is a Python library for *rich* text and **beautiful** formatting in the terminal.
+
+The [Rich API](https://rich.readthedocs.io/en/latest/) makes it easy to add color and style to terminal output.
+
+## Features
+
+- Tables, progress bars, markdown, syntax highlighted source code, tracebacks, and more
+- Works on Linux, macOS, and Windows
+- Truecolor / emoji support
+
+> Rich can also render pretty tracebacks which are easier to read and show more code than standard Python tracebacks.
+
+```python
+from rich.console import Console
+
+console = Console()
+console.print("Hello", "World!", style="bold red")
+```
+
+1. First item
+2. Second item
+3. Third item
+
+| Name | Description |
+| ---- | ----------- |
+| Rich | Rich text   |
+| Text | Styled text |
+"""
+
+PRETTY_DATA = {
+    "users": [
+        {
+            "id": index,
+            "name": f"user{index}",
+            "email": f"user{index}@example.com",
+            "roles": ["admin", "editor"] if index % 3 == 0 else ["viewer"],
+            "active": index % 2 == 0,
+            "scores": [index * 1.5, index * 2.25, None],
+        }
+        for index in range(200)
+    ],
+    "meta": {"total": 200, "page": 1, "tags": {"a", "b", "c"}},
+}
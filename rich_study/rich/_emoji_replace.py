@@ -1,32 +1,67 @@
-from typing import Callable, Match, Optional
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, List, Match, Optional, Tuple
 import re
 
-from ._emoji_codes import EMOJI
-
 
 _ReStringMatch = Match[str]  # regex match object
 _ReSubCallable = Callable[[_ReStringMatch], str]  # Callable invoked by re.sub
 _EmojiSubMethod = Callable[[_ReSubCallable, str], str]  # Sub method of a compiled re
 
 
+@lru_cache(maxsize=None)
+def _get_emoji_index() -> Tuple[List[str], List[str]]:
+    """Load the emoji table, on first use.
+
+    Returns:
+        Tuple[List[str], List[str]]: A sorted list of emoji names, and a list of corresponding emoji.
+    """
+    from ._emoji_codes import EMOJI_TABLE
+
+    fields = EMOJI_TABLE.split()
+    return fields[::2], fields[1::2]
+
+
+def get_emoji(name: str) -> str:
+    """Get an emoji from its name.
+
+    Args:
+        name (str): Name of emoji, e.g. "smiley".
+
+    Raises:
+        KeyError: If there is no emoji with that name.
+
+    Returns:
+        str: The emoji character(s).
+    """
+    names, emoji = _get_emoji_index()
+    index = bisect_left(names, name)
+    if index < len(names) and names[index] == name:
+        return emoji[index]
+    raise KeyError(name)
+
+
 def _emoji_replace(
     text: str,
     default_variant: Optional[str] = None,
     _emoji_sub: _EmojiSubMethod = re.compile(r"(:(\S*?)(?:(?:\-)(emoji|text))?:)").sub,
 ) -> str:
     """Replace emoji code in text."""
-    get_emoji = EMOJI.__getitem__
+    if ":" not in text:
+        # Can't contain an emoji code
+        return text
+    names, emoji = _get_emoji_index()
+    names_count = len(names)
     variants = {"text": "\uFE0E", "emoji": "\uFE0F"}
     get_variant = variants.get
     default_variant_code = variants.get(default_variant, "") if default_variant else ""
 
     def do_replace(match: Match[str]) -> str:
         emoji_code, emoji_name, variant = match.groups()
-        try:
-            return get_emoji(emoji_name.lower()) + get_variant(
-                variant, default_variant_code
-            )
-        except KeyError:
-            return emoji_code
+        emoji_name = emoji_name.lower()
+        index = bisect_left(names, emoji_name)
+        if index < names_count and names[index] == emoji_name:
+            return emoji[index] + get_variant(variant, default_variant_code)
+        return emoji_code
 
     return _emoji_sub(do_replace, text)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable
+from array import array
+from typing import Iterable, Tuple
 
 from ._loop import loop_last
 from .cells import cell_len, chop_cells
@@ -23,6 +24,39 @@ def words(text: str) -> Iterable[tuple[int, int, str]]:
         word_match = re_word.match(text, end)
 
 
+WordMeasures = Tuple["array[int]", "array[int]", "array[int]", "array[int]"]
+"""Start offsets, end offsets, cell lengths without trailing whitespace, and cell lengths of words."""
+
+
+def measure_words(text: str) -> WordMeasures:
+    """Find the words in the text, and measure their cell lengths.
+
+    Measurements don't depend on the width, so may be reused to divide the
+    same text at different widths with :func:`divide_words`.
+
+    Args:
+        text: The text to examine.
+
+    Returns:
+        Arrays of start offsets, end offsets, cell lengths excluding trailing whitespace,
+        and cell lengths including trailing whitespace.
+    """
+    starts: array[int] = array("I")
+    ends: array[int] = array("I")
+    word_lengths: array[int] = array("I")
+    cell_lengths: array[int] = array("I")
+    _cell_len = cell_len
+    # Words are contiguous, so finditer finds the same words as words()
+    for word_match in re_word.finditer(text):
+        start, end = word_match.span()
+        word = word_match.group()
+        starts.append(start)
+        ends.append(end)
+        word_lengths.append(_cell_len(word.rstrip()))
+        cell_lengths.append(_cell_len(word))
+    return starts, ends, word_lengths, cell_lengths
+
+
 def divide_line(text: str, width: int, fold: bool = True) -> list[int]:
     """Given a string of text, and a width (measured in cells), return a list
     of cell offsets which the string should be split at in order for it to fit
@@ -33,6 +67,23 @@ def divide_line(text: str, width: int, fold: bool = True) -> list[int]:
         width: The available cell width.
         fold: If True, words longer than `width` will be folded onto a new line.
 
+    Returns:
+        A list of indices to break the line at.
+    """
+    return divide_words(text, measure_words(text), width, fold)
+
+
+def divide_words(
+    text: str, word_measures: WordMeasures, width: int, fold: bool = True
+) -> list[int]:
+    """Divide text in to lines, given the measurements of its words.
+
+    Args:
+        text: The text to examine.
+        word_measures: Measurements of the words in `text`, from :func:`measure_words`.
+        width: The available cell width.
+        fold: If True, words longer than `width` will be folded onto a new line.
+
     Returns:
         A list of indices to break the line at.
     """
@@ -41,14 +92,13 @@ def divide_line(text: str, width: int, fold: bool = True) -> list[int]:
     cell_offset = 0
     _cell_len = cell_len
 
-    for start, _end, word in words(text):
-        word_length = _cell_len(word.rstrip())
+    for start, end, word_length, word_cell_length in zip(*word_measures):
         remaining_space = width - cell_offset
         word_fits_remaining_space = remaining_space >= word_length
 
         if word_fits_remaining_space:
             # Simplest case - the word fits within the remaining width for this line.
-            cell_offset += _cell_len(word)
+            cell_offset += word_cell_length
         else:
             # Not enough space remaining for this word on the current line.
             if word_length > width:
@@ -56,7 +106,7 @@ def divide_line(text: str, width: int, fold: bool = True) -> list[int]:
                 # place it on the next line...
                 if fold:
                     # Fold the word across multiple lines.
-                    folded_word = chop_cells(word, width=width)
+                    folded_word = chop_cells(text[start:end], width=width)
                     for last, line in loop_last(folded_word):
                         if start:
                             append(start)
@@ -68,12 +118,12 @@ def divide_line(text: str, width: int, fold: bool = True) -> list[int]:
                     # Folding isn't allowed, so crop the word.
                     if start:
                         append(start)
-                    cell_offset = _cell_len(word)
+                    cell_offset = word_cell_length
             elif cell_offset and start:
                 # The word doesn't fit within the remaining space on the current
                 # line, but it *can* fit on to the next (empty) line.
                 append(start)
-                cell_offset = _cell_len(word)
+                cell_offset = word_cell_length
 
     return break_positions
 
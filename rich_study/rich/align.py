@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Iterable, Optional, Literal
 from .constrain import Constrain
 from .jupyter import JupyterMixin
 from .measure import Measurement
-from .segment import Segment
+from .segment import LineBlock, Segment
 from .style import StyleType
 
 if TYPE_CHECKING:
@@ -137,9 +137,9 @@ class Align(JupyterMixin):
             ),
             options.update(height=None),
         )
-        lines = list(Segment.split_lines(rendered))
-        width, height = Segment.get_shape(lines)
-        lines = Segment.set_shape(lines, width, height)
+        block = LineBlock.from_segments(rendered)
+        width, height = block.shape
+        lines = block.set_shape(width, height)
         new_line = Segment.line()
         excess_space = options.max_width - width
         style = console.get_style(self.style) if self.style is not None else None
@@ -252,10 +252,10 @@ class VerticalCenter(JupyterMixin):
         self, console: "Console", options: "ConsoleOptions"
     ) -> "RenderResult":
         style = console.get_style(self.style) if self.style is not None else None
-        lines = console.render_lines(
+        lines = console.render_line_block(
             self.renderable, options.update(height=None), pad=False
         )
-        width, _height = Segment.get_shape(lines)
+        width, _height = lines.shape
         new_line = Segment.line()
         height = options.height or options.size.height
         top_space = (height - len(lines)) // 2
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from array import array
 from functools import lru_cache
-from typing import Callable
+from itertools import accumulate
+from typing import Callable, Sequence
 
 from ._cell_widths import CELL_WIDTHS
 
@@ -93,6 +95,32 @@ def get_character_cell_size(character: str) -> int:
     return 1
 
 
+_CELL_OFFSETS_CACHE_SIZE = 4096
+"""Maximum number of strings in the cache used by :func:`_get_cell_offsets`."""
+
+# Maps strings on to the cell offsets of their characters
+_cell_offsets_cache: dict[str, array[int]] = {}
+
+
+def _get_cell_offsets(text: str) -> Sequence[int]:
+    """Get the cell offset of each character in a string.
+
+    Args:
+        text (str): Text to index.
+
+    Returns:
+        Sequence[int]: The cell offset where each character starts, followed by the cell
+            length of the text.
+    """
+    offsets = _cell_offsets_cache.get(text)
+    if offsets is None:
+        offsets = array("L", accumulate(map(get_character_cell_size, text), initial=0))
+        if len(_cell_offsets_cache) >= _CELL_OFFSETS_CACHE_SIZE:
+            _cell_offsets_cache.clear()
+        _cell_offsets_cache[text] = offsets
+    return offsets
+
+
 def set_cell_size(text: str, total: int) -> str:
     """Set the length of a string to fit within given number of cells."""
 
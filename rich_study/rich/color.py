@@ -1,9 +1,8 @@
 import re
 import sys
-from colorsys import rgb_to_hls
 from enum import IntEnum
 from functools import lru_cache
-from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 from ._palettes import EIGHT_BIT_PALETTE, STANDARD_PALETTE, WINDOWS_PALETTE
 from .color_triplet import ColorTriplet
@@ -518,7 +517,19 @@ class Color(NamedTuple):
         # Convert to 8-bit color from truecolor color
         if system == ColorSystem.EIGHT_BIT and self.system == ColorSystem.TRUECOLOR:
             assert self.triplet is not None
-            _h, l, s = rgb_to_hls(*self.triplet.normalized)
+            red, green, blue = self.triplet
+            # Lightness and saturation, calculated as colorsys.rgb_to_hls does
+            max_component = max(red, green, blue) / 255.0
+            min_component = min(red, green, blue) / 255.0
+            l = (max_component + min_component) / 2.0
+            if max_component == min_component:
+                s = 0.0
+            elif l <= 0.5:
+                s = (max_component - min_component) / (max_component + min_component)
+            else:
+                s = (max_component - min_component) / (
+                    2.0 - max_component - min_component
+                )
             # If saturation is under 15% assume it is grayscale
             if s < 0.15:
                 gray = round(l * 25.0)
@@ -530,13 +541,11 @@ class Color(NamedTuple):
                     color_number = 231 + gray
                 return Color(self.name, ColorType.EIGHT_BIT, number=color_number)
 
-            red, green, blue = self.triplet
-            six_red = red / 95 if red < 95 else 1 + (red - 95) / 40
-            six_green = green / 95 if green < 95 else 1 + (green - 95) / 40
-            six_blue = blue / 95 if blue < 95 else 1 + (blue - 95) / 40
-
             color_number = (
-                16 + 36 * round(six_red) + 6 * round(six_green) + round(six_blue)
+                16
+                + 36 * _CUBE_LEVELS[red]
+                + 6 * _CUBE_LEVELS[green]
+                + _CUBE_LEVELS[blue]
             )
             return Color(self.name, ColorType.EIGHT_BIT, number=color_number)
 
@@ -568,6 +577,12 @@ class Color(NamedTuple):
         return self
 
 
+_CUBE_LEVELS = bytes(
+    round(value / 95 if value < 95 else 1 + (value - 95) / 40) for value in range(256)
+)
+"""Maps a color component on to the nearest of the 6 levels in the 8-bit color cube."""
+
+
 def parse_rgb_hex(hex_color: str) -> ColorTriplet:
     """Parse six hex characters in to RGB triplet."""
     assert len(hex_color) == 6, "must be 6 characters"
@@ -591,6 +606,79 @@ def blend_rgb(
     return new_color
 
 
+def blend_rgb_many(
+    color1: ColorTriplet, color2: ColorTriplet, cross_fades: Iterable[float]
+) -> List[ColorTriplet]:
+    """Blend one RGB color in to another, by a number of amounts.
+
+    Args:
+        color1 (ColorTriplet): Color to blend from.
+        color2 (ColorTriplet): Color to blend to.
+        cross_fades (Iterable[float]): Amounts of the second color, from 0 to 1.
+
+    Returns:
+        List[ColorTriplet]: A blended color for each cross fade.
+    """
+    r1, g1, b1 = color1
+    r2, g2, b2 = color2
+    red, green, blue = r2 - r1, g2 - g1, b2 - b1
+    _ColorTriplet = ColorTriplet
+    return [
+        _ColorTriplet(
+            int(r1 + red * cross_fade),
+            int(g1 + green * cross_fade),
+            int(b1 + blue * cross_fade),
+        )
+        for cross_fade in cross_fades
+    ]
+
+
+def gradient_rgb(
+    colors: Sequence[ColorTriplet], positions: Iterable[float]
+) -> List[ColorTriplet]:
+    """Get colors along a gradient, which passes through each color at evenly spaced intervals.
+
+    Args:
+        colors (Sequence[ColorTriplet]): Colors in the gradient.
+        positions (Iterable[float]): Positions along the gradient, from 0 (the first color)
+            to 1 (the last color).
+
+    Returns:
+        List[ColorTriplet]: A color for each position.
+    """
+    if not colors:
+        raise ValueError("colors must not be empty")
+    first_color = colors[0]
+    last_color = colors[-1]
+    stop_count = len(colors) - 1
+    # Start of each section of the gradient, and the change in color across it
+    sections = [
+        (r1, g1, b1, r2 - r1, g2 - g1, b2 - b1)
+        for (r1, g1, b1), (r2, g2, b2) in zip(colors, colors[1:])
+    ]
+    _ColorTriplet = ColorTriplet
+    gradient: List[ColorTriplet] = []
+    append = gradient.append
+    for position in positions:
+        offset = position * stop_count
+        if offset <= 0:
+            append(first_color)
+        elif offset >= stop_count:
+            append(last_color)
+        else:
+            index = int(offset)
+            cross_fade = offset - index
+            r1, g1, b1, red, green, blue = sections[index]
+            append(
+                _ColorTriplet(
+                    int(r1 + red * cross_fade),
+                    int(g1 + green * cross_fade),
+                    int(b1 + blue * cross_fade),
+                )
+            )
+    return gradient
+
+
 if __name__ == "__main__":  # pragma: no cover
     from .console import Console
     from .table import Table
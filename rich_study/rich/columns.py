@@ -1,7 +1,6 @@
-from collections import defaultdict
-from itertools import chain
+from itertools import accumulate, chain
 from operator import itemgetter
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from .align import Align, AlignMethod
 from .console import Console, ConsoleOptions, RenderableType, RenderResult
@@ -26,6 +25,8 @@ class Columns(JupyterMixin):
         right_to_left (bool, optional): Start column from right hand side. Defaults to False.
         align (str, optional): Align value ("left", "right", or "center") or None for default. Defaults to None.
         title (TextType, optional): Optional title for Columns.
+        stream (bool, optional): Render each row as soon as it is laid out, rather than in a single
+            table. Defaults to False.
     """
 
     def __init__(
@@ -40,6 +41,7 @@ class Columns(JupyterMixin):
         right_to_left: bool = False,
         align: Optional[AlignMethod] = None,
         title: Optional[TextType] = None,
+        stream: bool = False,
     ) -> None:
         self.renderables = list(renderables or [])
         self.width = width
@@ -50,6 +52,7 @@ class Columns(JupyterMixin):
         self.right_to_left = right_to_left
         self.align: Optional[AlignMethod] = align
         self.title = title
+        self.stream = stream
 
     def add_renderable(self, renderable: RenderableType) -> None:
         """Add a renderable to the columns.
@@ -59,6 +62,62 @@ class Columns(JupyterMixin):
         """
         self.renderables.append(renderable)
 
+    def _get_column_count(
+        self, renderable_widths: List[int], max_width: int, padding: int
+    ) -> int:
+        """Get the number of columns which fit within the available width.
+
+        Args:
+            renderable_widths (List[int]): Maximum width of each renderable.
+            max_width (int): Available width.
+            padding (int): Padding between columns.
+
+        Returns:
+            int: Number of columns.
+        """
+        item_count = len(renderable_widths)
+        column_count = item_count
+        while column_count > 1:
+            if self.column_first:
+                column_lengths = self._get_column_lengths(item_count, column_count)
+                column_starts = list(accumulate(column_lengths, initial=0))
+                first_row = [renderable_widths[start] for start in column_starts[:-1]]
+            else:
+                first_row = renderable_widths[:column_count]
+
+            # Renderables in the first row each start a column
+            for column_no, total_width in enumerate(accumulate(first_row)):
+                if total_width + padding * column_no > max_width:
+                    break
+            else:
+                column_no = column_count
+            if column_no < column_count:
+                column_count = column_no
+                continue
+
+            if self.column_first:
+                column_widths = [
+                    max(renderable_widths[start:end])
+                    for start, end in zip(column_starts, column_starts[1:])
+                ]
+            else:
+                column_widths = [
+                    max(renderable_widths[column_no::column_count])
+                    for column_no in range(column_count)
+                ]
+            if sum(column_widths) + padding * (column_count - 1) <= max_width:
+                break
+            column_count -= 1
+        return column_count
+
+    @classmethod
+    def _get_column_lengths(cls, item_count: int, column_count: int) -> List[int]:
+        """Get the number of renderables in each column, when arranged column first."""
+        column_lengths = [item_count // column_count] * column_count
+        for column_no in range(item_count % column_count):
+            column_lengths[column_no] += 1
+        return column_lengths
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
@@ -69,30 +128,27 @@ class Columns(JupyterMixin):
         ]
         if not renderables:
             return
-        _top, right, _bottom, left = Padding.unpack(self.padding)
+        top, right, bottom, left = Padding.unpack(self.padding)
         width_padding = max(left, right)
         max_width = options.max_width
-        widths: Dict[int, int] = defaultdict(int)
-        column_count = len(renderables)
 
         get_measurement = Measurement.get
         renderable_widths = [
             get_measurement(console, options, renderable).maximum
             for renderable in renderables
         ]
+        measured_widths = renderable_widths
         if self.equal:
             renderable_widths = [max(renderable_widths)] * len(renderable_widths)
 
         def iter_renderables(
-            column_count: int,
+            column_count: int, renderable_widths: List[int] = renderable_widths
         ) -> Iterable[Tuple[int, Optional[RenderableType]]]:
             item_count = len(renderables)
             if self.column_first:
                 width_renderables = list(zip(renderable_widths, renderables))
 
-                column_lengths: List[int] = [item_count // column_count] * column_count
-                for col_no in range(item_count % column_count):
-                    column_lengths[col_no] += 1
+                column_lengths = self._get_column_lengths(item_count, column_count)
 
                 row_count = (item_count + column_count - 1) // column_count
                 cells = [[-1] * column_count for _ in range(row_count)]
@@ -116,35 +172,17 @@ class Columns(JupyterMixin):
                 for _ in range(column_count - (item_count % column_count)):
                     yield 0, None
 
-        table = Table.grid(padding=self.padding, collapse_padding=True, pad_edge=False)
-        table.expand = self.expand
-        table.title = self.title
-
         if self.width is not None:
             column_count = (max_width) // (self.width + width_padding)
-            for _ in range(column_count):
-                table.add_column(width=self.width)
         else:
-            while column_count > 1:
-                widths.clear()
-                column_no = 0
-                for renderable_width, _ in iter_renderables(column_count):
-                    widths[column_no] = max(widths[column_no], renderable_width)
-                    total_width = sum(widths.values()) + width_padding * (
-                        len(widths) - 1
-                    )
-                    if total_width > max_width:
-                        column_count = len(widths) - 1
-                        break
-                    else:
-                        column_no = (column_no + 1) % column_count
-                else:
-                    break
+            column_count = self._get_column_count(
+                renderable_widths, max_width, width_padding
+            )
 
         get_renderable = itemgetter(1)
+        width_renderables = list(iter_renderables(column_count))
         _renderables = [
-            get_renderable(_renderable)
-            for _renderable in iter_renderables(column_count)
+            get_renderable(_renderable) for _renderable in width_renderables
         ]
         if self.equal:
             _renderables = [
@@ -161,13 +199,55 @@ class Columns(JupyterMixin):
                 for renderable in _renderables
             ]
 
+        if self.width is not None:
+            column_widths = [self.width] * column_count
+        else:
+            # Fix the width of each column from the measurements, so the table doesn't
+            # measure the renderables again (and rows in separate tables line up)
+            cell_widths = [
+                width for width, _ in iter_renderables(column_count, measured_widths)
+            ]
+            column_widths = [
+                max(cell_widths[column_no::column_count])
+                for column_no in range(column_count)
+            ]
+            if self.right_to_left:
+                column_widths.reverse()
+            # Tables add padding to the width of fixed width columns, but there is no
+            # padding on the outside edges of the grid
+            column_widths[0] -= left
+            column_widths[-1] -= right
+
+        def make_table() -> Table:
+            table = Table.grid(
+                padding=self.padding, collapse_padding=True, pad_edge=False
+            )
+            table.expand = self.expand
+            for width in column_widths:
+                table.add_column(width=width)
+            return table
+
+        # Rows in separate tables don't have the padding between rows of a single table
+        row_gap = max(0, top - bottom) + top
+
+        table = make_table()
+        table.title = self.title
         right_to_left = self.right_to_left
-        add_row = table.add_row
         for start in range(0, len(_renderables), column_count):
             row = _renderables[start : start + column_count]
+            if self.stream and table.row_count:
+                yield table
+                table = make_table()
+                if row_gap:
+                    row = [
+                        None
+                        if renderable is None
+                        else Padding(renderable, (row_gap, 0, 0, 0))
+                        for renderable in row
+                    ]
             if right_to_left:
                 row = row[::-1]
-            add_row(*row)
+            table.add_row(*row)
         yield table
 
 
@@ -10,7 +10,7 @@ from functools import wraps
 from getpass import getpass
 from html import escape
 from inspect import isclass
-from itertools import islice
+from itertools import chain, islice
 from math import ceil
 from time import monotonic
 from types import FrameType, ModuleType, TracebackType
@@ -21,12 +21,14 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
     NamedTuple,
     Optional,
     Protocol,
+    Sequence,
     TextIO,
     Tuple,
     Type,
@@ -39,7 +41,6 @@ from rich._null_file import NULL_FILE
 
 from . import errors, themes
 from ._emoji_replace import _emoji_replace
-from ._export_format import CONSOLE_HTML_FORMAT, CONSOLE_SVG_FORMAT
 from ._fileno import get_fileno
 from ._log_render import FormatTimeCallable, LogRender
 from .align import Align, AlignMethod
@@ -47,25 +48,24 @@ from .color import ColorSystem, blend_rgb
 from .control import Control
 from .emoji import EmojiVariant
 from .highlighter import NullHighlighter, ReprHighlighter
-from .markup import render as render_markup
 from .measure import Measurement, measure_renderables
-from .pager import Pager, SystemPager
-from .pretty import Pretty, is_expandable
 from .protocol import rich_cast
 from .region import Region
-from .scope import render_scope
 from .screen import Screen
-from .segment import Segment
+from .segment import LineBlock, Segment
 from .style import Style, StyleType
 from .styled import Styled
-from .terminal_theme import DEFAULT_TERMINAL_THEME, SVG_EXPORT_THEME, TerminalTheme
 from .text import Text, TextType
 from .theme import Theme, ThemeStack
 
 if TYPE_CHECKING:
     from ._windows import WindowsConsoleFeatures
     from .live import Live
+    from .pager import Pager
+    from .pretty import Pretty
+    from .profiler import RenderProfiler
     from .status import Status
+    from .terminal_theme import TerminalTheme
 
 JUPYTER_DEFAULT_COLUMNS = 115
 JUPYTER_DEFAULT_LINES = 100
@@ -373,10 +373,12 @@ class PagerContext:
     def __init__(
         self,
         console: "Console",
-        pager: Optional[Pager] = None,
+        pager: Optional["Pager"] = None,
         styles: bool = False,
         links: bool = False,
     ) -> None:
+        from .pager import SystemPager
+
         self._console = console
         self.pager = SystemPager() if pager is None else pager
         self.styles = styles
@@ -508,6 +510,88 @@ def group(fit: bool = True) -> Callable[..., Callable[..., Group]]:
     return decorator
 
 
+def _insert_new_line_start(segments: Iterable[Segment]) -> Iterable[Segment]:
+    """Insert a new line before segments, if they contain more than one line.
+
+    Segments are only held back until a second line is found.
+
+    Args:
+        segments (Iterable[Segment]): Segments to print.
+
+    Returns:
+        Iterable[Segment]: Segments, possibly preceded by a new line.
+    """
+    pending: List[Segment] = []
+    # Line break at the end of the text so far, which is a single line
+    line_end = ""
+    iter_segments = iter(segments)
+    for segment in iter_segments:
+        pending.append(segment)
+        if not segment.text:
+            continue
+        # Only the new text is split, with a placeholder for the first line
+        text = f"_{line_end}{segment.text}"
+        lines = text.splitlines()
+        line_end = text[len(lines[0]) :]
+        if len(lines) > 1:
+            yield Segment.line()
+            yield from pending
+            yield from iter_segments
+            return
+    yield from pending
+
+
+def _iter_write_batches(text: str, max_size: int) -> Iterator[Tuple[int, int]]:
+    """Divide text in to batches of whole lines, which are no longer than a maximum size
+    unless they contain a single long line.
+
+    Args:
+        text (str): Text to divide.
+        max_size (int): Maximum size of batch.
+
+    Returns:
+        Iterator[Tuple[int, int]]: Start and end offsets of batches.
+    """
+    start = 0
+    text_length = len(text)
+    while start < text_length:
+        end = start + max_size
+        if end >= text_length:
+            end = text_length
+        else:
+            line_end = text.rfind("\n", start, end) + 1
+            if line_end > start:
+                end = line_end
+            else:
+                # Batch contains a single line longer than the maximum
+                end = text.find("\n", end) + 1 or text_length
+        yield start, end
+        start = end
+
+
+# Loaded on first use, then kept so later calls don't run an import statement
+_render_markup: Optional[Callable[..., Text]] = None
+_pretty: Optional[Tuple[Type["Pretty"], Callable[[object], bool]]] = None
+
+
+def _load_render_markup() -> Callable[..., Text]:
+    """Import the markup renderer used by :meth:`Console.render_str`."""
+    global _render_markup
+    from .markup import render
+
+    _render_markup = render
+    return render
+
+
+def _load_pretty() -> Tuple[Type["Pretty"], Callable[[object], bool]]:
+    """Import the pretty printer used to print containers."""
+    global _pretty
+    from .pretty import Pretty, is_expandable
+
+    _pretty = (Pretty, is_expandable)
+    return _pretty
+
+
 def _is_jupyter() -> bool:  # pragma: no cover
     """Check if we're running in a Jupyter notebook."""
     try:
@@ -621,6 +705,14 @@ class Console:
     """
 
     _environ: Mapping[str, str] = os.environ
+    _STYLE_CODES_SIZE = 4096
+    """Maximum number of styles in the cache of codes used to render styles."""
+    _STYLE_CACHE_SIZE = 4096
+    """Maximum number of style names and definitions in the cache used by :meth:`get_style`."""
+    _STREAM_BUFFER_SIZE = 4096
+    """Number of segments to buffer before writing, when printing with ``stream=True``."""
+    _LINES_CACHE_SIZE = 4096
+    """Maximum number of lines, from all renders, cached by :meth:`render_lines_cached`."""
 
     def __init__(
         self,
@@ -755,6 +847,19 @@ class Console:
         self._render_hooks: List[RenderHook] = []
         self._live_stack: List[Live] = []
         self._is_alt_screen = False
+        self._render_profiler: Optional[RenderProfiler] = None
+        # Maps styles on to the codes written before and after text in that style
+        self._style_codes: Dict[Style, Tuple[str, str]] = {}
+        # Theme stack version, and the styles resolved with that version of the theme stack
+        self._style_cache: Tuple[int, Dict[str, Style]] = (-1, {})
+        # Maps a renderable (or its id) and render dimensions on to the renderable, the state
+        # it was rendered in, and the rendered lines (least recently used first)
+        self._lines_cache: Dict[
+            Tuple[Any, ...], Tuple[Any, Tuple[Any, ...], List[List[Segment]]]
+        ] = {}
+        self._lines_cache_size = 0
+        # Guards the lines cache, which may be used by renders in other threads
+        self._lines_cache_lock = threading.Lock()
 
     def __repr__(self) -> str:
         return f"<console width={self.width} {self._color_system!s}>"
@@ -1117,7 +1222,7 @@ class Console:
         return capture
 
     def pager(
-        self, pager: Optional[Pager] = None, styles: bool = False, links: bool = False
+        self, pager: Optional["Pager"] = None, styles: bool = False, links: bool = False
     ) -> PagerContext:
         """A context manager to display anything printed within a "pager". The pager application
         is defined by the system and will typically support at least pressing a key to scroll.
@@ -1318,16 +1423,42 @@ class Console:
         if _options.max_width < 1:
             # No space to render anything. This prevents potential recursion errors.
             return
+        if self._render_profiler is not None:
+            yield from self._render_profiler.render(renderable, _options)
+            return
+
+        iter_render = self._render_iter(renderable, _options)
+        _Segment = Segment
+        _options = _options.reset_height()
+        for render_output in iter_render:
+            if isinstance(render_output, _Segment):
+                yield render_output
+            else:
+                yield from self.render(render_output, _options)
+
+    def _render_iter(
+        self, renderable: RenderableType, options: ConsoleOptions
+    ) -> Iterator[Union[RenderableType, Segment]]:
+        """Get an iterator over the output of a renderable's ``__rich_console__`` method.
+
+        Args:
+            renderable (RenderableType): An object supporting the console protocol, or
+                an object that may be converted to a string.
+            options (ConsoleOptions): Options to render with.
+
+        Returns:
+            Iterator[Union[RenderableType, Segment]]: Segments, and renderables to be rendered.
+        """
         render_iterable: RenderResult
 
         renderable = rich_cast(renderable)
         if hasattr(renderable, "__rich_console__") and not isclass(renderable):
-            render_iterable = renderable.__rich_console__(self, _options)
+            render_iterable = renderable.__rich_console__(self, options)
         elif isinstance(renderable, str):
             text_renderable = self.render_str(
-                renderable, highlight=_options.highlight, markup=_options.markup
+                renderable, highlight=options.highlight, markup=options.markup
             )
-            render_iterable = text_renderable.__rich_console__(self, _options)
+            render_iterable = text_renderable.__rich_console__(self, options)
         else:
             raise errors.NotRenderableError(
                 f"Unable to render {renderable!r}; "
@@ -1335,18 +1466,35 @@ class Console:
             )
 
         try:
-            iter_render = iter(render_iterable)
+            return iter(render_iterable)
         except TypeError:
             raise errors.NotRenderableError(
                 f"object {render_iterable!r} is not renderable"
             )
-        _Segment = Segment
-        _options = _options.reset_height()
-        for render_output in iter_render:
-            if isinstance(render_output, _Segment):
-                yield render_output
-            else:
-                yield from self.render(render_output, _options)
+
+    def profile(
+        self, *, dump: Optional[Literal["table", "json"]] = None
+    ) -> "RenderProfiler":
+        """A context manager that records how long each type of renderable takes to render.
+
+        Statistics are recorded for each renderable type at each position in the render tree,
+        so nested renderables are reported separately from their parents. There is almost no
+        overhead when not profiling.
+
+        Example:
+            >>> with console.profile(dump="table"):
+            ...     console.print(Panel(table))
+
+        Args:
+            dump (str, optional): Print the results when profiling ends, either as a "table" or as
+                "json", or None to not print them. Defaults to None.
+
+        Returns:
+            RenderProfiler: A render profiler, with the recorded statistics.
+        """
+        from .profiler import RenderProfiler
+
+        return RenderProfiler(self, dump=dump)
 
     def render_lines(
         self,
@@ -1372,45 +1520,160 @@ class Console:
         Returns:
             List[List[Segment]]: A list of lines, where a line is a list of Segment objects.
         """
-        with self._lock:
-            render_options = options or self.options
-            _rendered = self.render(renderable, render_options)
-            if style:
-                _rendered = Segment.apply_style(_rendered, style)
-
-            render_height = render_options.height
-            if render_height is not None:
-                render_height = max(0, render_height)
-
-            lines = list(
-                islice(
-                    Segment.split_and_crop_lines(
-                        _rendered,
-                        render_options.max_width,
-                        include_new_lines=new_lines,
-                        pad=pad,
-                        style=style,
-                    ),
-                    None,
-                    render_height,
-                )
-            )
-            if render_options.height is not None:
-                extra_lines = render_options.height - len(lines)
-                if extra_lines > 0:
-                    pad_line = [
-                        (
-                            [
-                                Segment(" " * render_options.max_width, style),
-                                Segment("\n"),
-                            ]
-                            if new_lines
-                            else [Segment(" " * render_options.max_width, style)]
-                        )
-                    ]
-                    lines.extend(pad_line * extra_lines)
+        return self.render_line_block(
+            renderable, options, style=style, pad=pad, new_lines=new_lines
+        ).lines
+
+    def render_line_block(
+        self,
+        renderable: RenderableType,
+        options: Optional[ConsoleOptions] = None,
+        *,
+        style: Optional[Style] = None,
+        pad: bool = True,
+        new_lines: bool = False,
+    ) -> LineBlock:
+        """Render objects in to a block of lines, which stores the cell length of each line.
 
-            return lines
+        Args:
+            renderable (RenderableType): Any object renderable in the console.
+            options (Optional[ConsoleOptions], optional): Console options, or None to use self.options. Default to ``None``.
+            style (Style, optional): Optional style to apply to renderables. Defaults to ``None``.
+            pad (bool, optional): Pad lines shorter than render width. Defaults to ``True``.
+            new_lines (bool, optional): Include "\n" characters at end of lines.
+
+        Returns:
+            LineBlock: A block of lines, which may be shaped without measuring segments again.
+        """
+        # Rendering doesn't hold the console lock, which allows renderables (such as Layout) to
+        # render lines in other threads. The caches used while rendering are safe to share
+        # between threads, and the lines cache has its own lock.
+        render_options = options or self.options
+        _rendered = self.render(renderable, render_options)
+        if style:
+            _rendered = Segment.apply_style(_rendered, style)
+
+        render_height = render_options.height
+        if render_height is not None:
+            render_height = max(0, render_height)
+
+        max_width = render_options.max_width
+        lines: List[List[Segment]] = []
+        widths: List[int] = []
+        append_line = lines.append
+        append_width = widths.append
+        for line, width in islice(
+            Segment._split_and_crop_lines(_rendered, max_width, style, pad, new_lines),
+            None,
+            render_height,
+        ):
+            append_line(line)
+            append_width(width)
+
+        if render_options.height is not None:
+            extra_lines = render_options.height - len(lines)
+            if extra_lines > 0:
+                pad_line = [
+                    (
+                        [
+                            Segment(" " * max_width, style),
+                            Segment("\n"),
+                        ]
+                        if new_lines
+                        else [Segment(" " * max_width, style)]
+                    )
+                ]
+                lines.extend(pad_line * extra_lines)
+                widths.extend([max_width] * extra_lines)
+
+        return LineBlock(lines, widths)
+
+    def render_lines_cached(
+        self,
+        renderable: RenderableType,
+        options: Optional[ConsoleOptions] = None,
+        *,
+        style: Optional[Style] = None,
+        pad: bool = True,
+    ) -> Sequence[Sequence[Segment]]:
+        """Render objects in to lines, reusing the previous render of strings and of objects
+        which opt in to caching.
+
+        Strings (i.e. console markup) are cached by value. Other objects are only cached if they
+        have a ``__rich_version__`` method, which should return a hashable value that changes
+        whenever the object's render would change. Rich's own renderables are mutable and
+        have no version, so they are rendered with :meth:`render_lines` on every call.
+
+        Args:
+            renderable (RenderableType): Any object renderable in the console.
+            options (Optional[ConsoleOptions], optional): Console options, or None to use self.options. Default to ``None``.
+            style (Style, optional): Optional style to apply to renderables. Defaults to ``None``.
+            pad (bool, optional): Pad lines shorter than render width. Defaults to ``True``.
+
+        Returns:
+            Sequence[Sequence[Segment]]: A sequence of lines, which may be shared with other callers
+                and must not be modified.
+        """
+        return self._render_lines_cached(renderable, options, style=style, pad=pad)
+
+    def _render_lines_cached(
+        self,
+        renderable: RenderableType,
+        options: Optional[ConsoleOptions] = None,
+        *,
+        style: Optional[Style] = None,
+        pad: bool = True,
+    ) -> List[List[Segment]]:
+        """Render lines as :meth:`render_lines_cached`, for renderables which compose the lines
+        without modifying them.
+
+        Returns:
+            List[List[Segment]]: A list of lines, which may be shared with the cache.
+        """
+        render_options = options or self.options
+        if self._render_profiler is not None:
+            # Renders must be repeated to be profiled
+            return self.render_lines(renderable, render_options, style=style, pad=pad)
+        if isinstance(renderable, str):
+            key: Tuple[Any, ...] = (renderable,)
+            version: Any = (self.highlighter, self._emoji, self._emoji_variant)
+        elif hasattr(renderable, "__rich_version__") and not isclass(renderable):
+            key = (id(renderable),)
+            version = getattr(renderable, "__rich_version__")()
+        else:
+            return self.render_lines(renderable, render_options, style=style, pad=pad)
+
+        key += (render_options.max_width, render_options.height, style, pad)
+        state = (version, self._theme_stack.version, render_options)
+        lines_cache = self._lines_cache
+        # The lock is held while updating the cache, but not while rendering
+        with self._lines_cache_lock:
+            # Removed, and added again if still valid, to keep the most recently used renders last
+            cached = lines_cache.pop(key, None)
+            if cached is not None:
+                cached_renderable, cached_state, cached_lines = cached
+                # The cache holds a reference to the renderable, so its id can't be reused while cached
+                if (
+                    cached_renderable is renderable or isinstance(renderable, str)
+                ) and cached_state == state:
+                    lines_cache[key] = cached
+                    return cached_lines
+                self._lines_cache_size -= max(1, len(cached_lines))
+        lines = self.render_lines(renderable, render_options, style=style, pad=pad)
+        size = max(1, len(lines))
+        if size <= self._LINES_CACHE_SIZE:
+            with self._lines_cache_lock:
+                # Another thread may have cached the same render in the meantime
+                replaced = lines_cache.pop(key, None)
+                if replaced is not None:
+                    self._lines_cache_size -= max(1, len(replaced[2]))
+                self._lines_cache_size += size
+                while self._lines_cache_size > self._LINES_CACHE_SIZE and lines_cache:
+                    # Discard the least recently used renders
+                    _, _, discard_lines = lines_cache.pop(next(iter(lines_cache)))
+                    self._lines_cache_size -= max(1, len(discard_lines))
+                lines_cache[key] = (renderable, state, lines)
+        return lines
 
     def render_str(
         self,
@@ -1445,6 +1708,7 @@ class Console:
         highlight_enabled = highlight or (highlight is None and self._highlight)
 
         if markup_enabled:
+            render_markup = _render_markup or _load_render_markup()
             rich_text = render_markup(
                 text,
                 style=style,
@@ -1491,17 +1755,65 @@ class Console:
         if isinstance(name, Style):
             return name
 
-        try:
-            style = self._theme_stack.get(name)
-            if style is None:
-                style = Style.parse(name)
-            return style.copy() if style.link else style
-        except errors.StyleSyntaxError as error:
-            if default is not None:
-                return self.get_style(default)
-            raise errors.MissingStyle(
-                f"Failed to get style {name!r}; {error}"
-            ) from None
+        styles = self._get_style_cache()
+        style = styles.get(name)
+        if style is None:
+            try:
+                style = self._theme_stack.get(name)
+                if style is None:
+                    style = Style.parse(name)
+            except errors.StyleSyntaxError as error:
+                if default is not None:
+                    return self.get_style(default)
+                raise errors.MissingStyle(
+                    f"Failed to get style {name!r}; {error}"
+                ) from None
+            if len(styles) >= self._STYLE_CACHE_SIZE:
+                styles.clear()
+            styles[name] = style
+        return style.copy() if style._link else style
+
+    def get_styles(
+        self,
+        names: Iterable[Union[str, Style]],
+        *,
+        default: Optional[Union[Style, str]] = None,
+    ) -> List[Style]:
+        """Get Style instances for a number of theme names or style definitions.
+
+        Args:
+            names (Iterable[Union[str, Style]]): Names of styles or style definitions.
+            default (Union[Style, str], optional): Style to use for names which aren't valid styles,
+                or None to raise an error. Defaults to None.
+
+        Returns:
+            List[Style]: A Style object for each name.
+
+        Raises:
+            MissingStyle: If no style could be parsed from a name, and there is no default.
+        """
+        get_cached_style = self._get_style_cache().get
+        get_style = self.get_style
+        resolved_styles: List[Style] = []
+        append = resolved_styles.append
+        for name in names:
+            if isinstance(name, Style):
+                append(name)
+                continue
+            style = get_cached_style(name)
+            if style is None or style._link:
+                style = get_style(name, default=default)
+            append(style)
+        return resolved_styles
+
+    def _get_style_cache(self) -> Dict[str, Style]:
+        """Get the resolved styles for the current theme stack."""
+        version = self._theme_stack.version
+        cache_version, styles = self._style_cache
+        if cache_version != version:
+            styles = {}
+            self._style_cache = (version, styles)
+        return styles
 
     def _collect_renderables(
         self,
@@ -1568,11 +1880,13 @@ class Console:
             elif isinstance(renderable, ConsoleRenderable):
                 check_text()
                 append(renderable)
-            elif is_expandable(renderable):
-                check_text()
-                append(Pretty(renderable, highlighter=_highlighter))
             else:
-                append_text(_highlighter(str(renderable)))
+                Pretty, is_expandable = _pretty or _load_pretty()
+                if is_expandable(renderable):
+                    check_text()
+                    append(Pretty(renderable, highlighter=_highlighter))
+                else:
+                    append_text(_highlighter(str(renderable)))
 
         check_text()
 
@@ -1662,6 +1976,7 @@ class Console:
         crop: bool = True,
         soft_wrap: Optional[bool] = None,
         new_line_start: bool = False,
+        stream: bool = False,
     ) -> None:
         """Print to the console.
 
@@ -1681,6 +1996,9 @@ class Console:
             soft_wrap (bool, optional): Enable soft wrap mode which disables word wrapping and cropping of text or ``None`` for
                 Console default. Defaults to ``None``.
             new_line_start (bool, False): Insert a new line at the start if the output contains more than one line. Defaults to ``False``.
+            stream (bool, optional): Write output in batches as it is rendered, rather than once everything has been rendered,
+                so that memory use doesn't grow with the size of the output. Has no effect within a ``with console:`` block.
+                Defaults to ``False``.
         """
         if not objects:
             objects = (NewLine(),)
@@ -1716,6 +2034,12 @@ class Console:
                 highlight=highlight,
             )
 
+            if stream:
+                self._print_stream(
+                    renderables, render_options, style, crop, new_line_start
+                )
+                return
+
             new_segments: List[Segment] = []
             extend = new_segments.extend
             render = self.render
@@ -1744,6 +2068,51 @@ class Console:
             else:
                 self._buffer.extend(new_segments)
 
+    def _print_stream(
+        self,
+        renderables: Iterable[RenderableType],
+        options: ConsoleOptions,
+        style: Optional[Union[str, Style]],
+        crop: bool,
+        new_line_start: bool,
+    ) -> None:
+        """Render and write renderables a batch of segments at a time. Called by :meth:`print`
+        within its buffer context.
+
+        Args:
+            renderables (Iterable[RenderableType]): Renderables to print.
+            options (ConsoleOptions): Options to render with.
+            style (Union[str, Style], optional): A style to apply to output.
+            crop (bool): Crop output to the width of the console.
+            new_line_start (bool): Insert a new line at the start if the output contains more than one line.
+        """
+        render = self.render
+        segments: Iterable[Segment] = chain.from_iterable(
+            render(renderable, options) for renderable in renderables
+        )
+        if style is not None:
+            segments = Segment.apply_style(segments, self.get_style(style))
+        if new_line_start:
+            segments = _insert_new_line_start(segments)
+        if crop:
+            segments = chain.from_iterable(
+                Segment.split_and_crop_lines(segments, self.width, pad=False)
+            )
+
+        buffer = self._buffer
+        append = buffer.append
+        stream_buffer_size = self._STREAM_BUFFER_SIZE
+        # Only write if the print's own context is the only buffer context
+        can_write = self._buffer_index == 1
+        for segment in segments:
+            append(segment)
+            if can_write and len(buffer) >= stream_buffer_size:
+                self._buffer_index = 0
+                try:
+                    self._check_buffer()
+                finally:
+                    self._buffer_index = 1
+
     def print_json(
         self,
         json: Optional[str] = None,
@@ -1979,6 +2348,8 @@ class Console:
             link_path = None if filename.startswith("<") else os.path.abspath(filename)
             path = filename.rpartition(os.sep)[-1]
             if log_locals:
+                from .scope import render_scope
+
                 locals_map = {
                     key: value
                     for key, value in locals.items()
@@ -2082,22 +2453,15 @@ class Console:
                             # Worse case scenario, every character is 4 bytes of utf-8
                             MAX_WRITE = 32 * 1024 // 4
                             try:
-                                if len(text) <= MAX_WRITE:
+                                isatty = getattr(self.file, "isatty", None)
+                                if len(text) <= MAX_WRITE or not (isatty and isatty()):
+                                    # The bug only affects writes to the Windows console
                                     write(text)
                                 else:
-                                    batch: List[str] = []
-                                    batch_append = batch.append
-                                    size = 0
-                                    for line in text.splitlines(True):
-                                        if size + len(line) > MAX_WRITE and batch:
-                                            write("".join(batch))
-                                            batch.clear()
-                                            size = 0
-                                        batch_append(line)
-                                        size += len(line)
-                                    if batch:
-                                        write("".join(batch))
-                                        batch.clear()
+                                    for start, end in _iter_write_batches(
+                                        text, MAX_WRITE
+                                    ):
+                                        write(text[start:end])
                             except UnicodeEncodeError as error:
                                 error.reason = f"{error.reason}\n*** You may need to add PYTHONIOENCODING=utf-8 to your environment ***"
                                 raise
@@ -2121,15 +2485,35 @@ class Console:
         not_terminal = not self.is_terminal
         if self.no_color and color_system:
             buffer = Segment.remove_color(buffer)
+        style_codes = self._style_codes
+        get_style_codes = style_codes.get
         for text, style, control in buffer:
             if style:
-                append(
-                    style.render(
-                        text,
-                        color_system=color_system,
-                        legacy_windows=legacy_windows,
+                if not text:
+                    continue
+                codes = get_style_codes(style)
+                if codes is None:
+                    if style._link or color_system is None:
+                        # Links have an id which may differ between equal styles
+                        append(
+                            style.render(
+                                text,
+                                color_system=color_system,
+                                legacy_windows=legacy_windows,
+                            )
+                        )
+                        continue
+                    attributes = style._make_ansi_codes(color_system)
+                    codes = (
+                        (f"\x1b[{attributes}m", "\x1b[0m") if attributes else ("", "")
                     )
-                )
+                    if len(style_codes) >= self._STYLE_CODES_SIZE:
+                        style_codes.clear()
+                    style_codes[style] = codes
+                start_codes, end_codes = codes
+                append(start_codes)
+                append(text)
+                append(end_codes)
             elif not (not_terminal and control):
                 append(text)
 
@@ -2219,7 +2603,7 @@ class Console:
     def export_html(
         self,
         *,
-        theme: Optional[TerminalTheme] = None,
+        theme: Optional["TerminalTheme"] = None,
         clear: bool = True,
         code_format: Optional[str] = None,
         inline_styles: bool = False,
@@ -2229,8 +2613,8 @@ class Console:
         Args:
             theme (TerminalTheme, optional): TerminalTheme object containing console colors.
             clear (bool, optional): Clear record buffer after exporting. Defaults to ``True``.
-            code_format (str, optional): Format string to render HTML. In addition to '{foreground}',
-                '{background}', and '{code}', should contain '{stylesheet}' if inline_styles is ``False``.
+            code_format (str, optional): Format string to render HTML, or ``None`` for the default. In addition to
+                '{foreground}', '{background}', and '{code}', should contain '{stylesheet}' if inline_styles is ``False``.
             inline_styles (bool, optional): If ``True`` styles will be inlined in to spans, which makes files
                 larger but easier to cut and paste markup. If ``False``, styles will be embedded in a style tag.
                 Defaults to False.
@@ -2241,6 +2625,9 @@ class Console:
         assert (
             self.record
         ), "To export console contents set record=True in the constructor or instance"
+        from ._export_format import CONSOLE_HTML_FORMAT
+        from .terminal_theme import DEFAULT_TERMINAL_THEME
+
         fragments: List[str] = []
         append = fragments.append
         _theme = theme or DEFAULT_TERMINAL_THEME
@@ -2295,9 +2682,9 @@ class Console:
         self,
         path: str,
         *,
-        theme: Optional[TerminalTheme] = None,
+        theme: Optional["TerminalTheme"] = None,
         clear: bool = True,
-        code_format: str = CONSOLE_HTML_FORMAT,
+        code_format: Optional[str] = None,
         inline_styles: bool = False,
     ) -> None:
         """Generate HTML from console contents and write to a file (requires record=True argument in constructor).
@@ -2306,8 +2693,8 @@ class Console:
             path (str): Path to write html file.
             theme (TerminalTheme, optional): TerminalTheme object containing console colors.
             clear (bool, optional): Clear record buffer after exporting. Defaults to ``True``.
-            code_format (str, optional): Format string to render HTML. In addition to '{foreground}',
-                '{background}', and '{code}', should contain '{stylesheet}' if inline_styles is ``False``.
+            code_format (str, optional): Format string to render HTML, or ``None`` for the default. In addition to
+                '{foreground}', '{background}', and '{code}', should contain '{stylesheet}' if inline_styles is ``False``.
             inline_styles (bool, optional): If ``True`` styles will be inlined in to spans, which makes files
                 larger but easier to cut and paste markup. If ``False``, styles will be embedded in a style tag.
                 Defaults to False.
@@ -2326,9 +2713,9 @@ class Console:
         self,
         *,
         title: str = "Rich",
-        theme: Optional[TerminalTheme] = None,
+        theme: Optional["TerminalTheme"] = None,
         clear: bool = True,
-        code_format: str = CONSOLE_SVG_FORMAT,
+        code_format: Optional[str] = None,
         font_aspect_ratio: float = 0.61,
         unique_id: Optional[str] = None,
     ) -> str:
@@ -2342,6 +2729,7 @@ class Console:
             code_format (str, optional): Format string used to generate the SVG. Rich will inject a number of variables
                 into the string in order to form the final SVG output. The default template used and the variables
                 injected by Rich can be found by inspecting the ``console.CONSOLE_SVG_FORMAT`` variable.
+                Defaults to ``None`` for the default template.
             font_aspect_ratio (float, optional): The width to height ratio of the font used in the ``code_format``
                 string. Defaults to 0.61, which is the width to height ratio of Fira Code (the default font).
                 If you aren't specifying a different font inside ``code_format``, you probably don't need this.
@@ -2351,6 +2739,9 @@ class Console:
 
         from rich.cells import cell_len
 
+        from ._export_format import CONSOLE_SVG_FORMAT
+        from .terminal_theme import SVG_EXPORT_THEME
+
         style_cache: Dict[Style, str] = {}
 
         def get_svg_style(style: Style) -> str:
@@ -2554,6 +2945,8 @@ class Console:
             </g>
         """
 
+        if code_format is None:
+            code_format = CONSOLE_SVG_FORMAT
         svg = code_format.format(
             unique_id=unique_id,
             char_width=char_width,
@@ -2578,9 +2971,9 @@ class Console:
         path: str,
         *,
         title: str = "Rich",
-        theme: Optional[TerminalTheme] = None,
+        theme: Optional["TerminalTheme"] = None,
         clear: bool = True,
-        code_format: str = CONSOLE_SVG_FORMAT,
+        code_format: Optional[str] = None,
         font_aspect_ratio: float = 0.61,
         unique_id: Optional[str] = None,
     ) -> None:
@@ -2594,6 +2987,7 @@ class Console:
             code_format (str, optional): Format string used to generate the SVG. Rich will inject a number of variables
                 into the string in order to form the final SVG output. The default template used and the variables
                 injected by Rich can be found by inspecting the ``console.CONSOLE_SVG_FORMAT`` variable.
+                Defaults to ``None`` for the default template.
             font_aspect_ratio (float, optional): The width to height ratio of the font used in the ``code_format``
                 string. Defaults to 0.61, which is the width to height ratio of Fira Code (the default font).
                 If you aren't specifying a different font inside ``code_format``, you probably don't need this.
@@ -2624,6 +3018,35 @@ def _svg_hash(svg_main_code: str) -> str:
     return str(zlib.adler32(svg_main_code.encode()))
 
 
+# Names that used to be imported at module level, and are now loaded on first use
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "CONSOLE_HTML_FORMAT": ("._export_format", "CONSOLE_HTML_FORMAT"),
+    "CONSOLE_SVG_FORMAT": ("._export_format", "CONSOLE_SVG_FORMAT"),
+    "DEFAULT_TERMINAL_THEME": (".terminal_theme", "DEFAULT_TERMINAL_THEME"),
+    "SVG_EXPORT_THEME": (".terminal_theme", "SVG_EXPORT_THEME"),
+    "TerminalTheme": (".terminal_theme", "TerminalTheme"),
+    "Pager": (".pager", "Pager"),
+    "SystemPager": (".pager", "SystemPager"),
+    "Pretty": (".pretty", "Pretty"),
+    "is_expandable": (".pretty", "is_expandable"),
+    "render_markup": (".markup", "render"),
+    "render_scope": (".scope", "render_scope"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import names on first access, to keep the cost of importing this module down."""
+    try:
+        module_name, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __package__), attribute)
+    globals()[name] = value
+    return value
+
+
 if __name__ == "__main__":  # pragma: no cover
     console = Console(record=True)
 
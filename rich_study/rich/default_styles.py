@@ -139,6 +139,7 @@ DEFAULT_STYLES: Dict[str, Style] = {
     "status.spinner": Style(color="green"),
     "tree": Style(),
     "tree.line": Style(),
+    "tree.ellipsis": Style(dim=True),
     "markdown.paragraph": Style(),
     "markdown.text": Style(),
     "markdown.em": Style(italic=True),
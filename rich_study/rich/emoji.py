@@ -4,8 +4,7 @@ from typing import TYPE_CHECKING, Optional, Union, Literal
 from .jupyter import JupyterMixin
 from .segment import Segment
 from .style import Style
-from ._emoji_codes import EMOJI
-from ._emoji_replace import _emoji_replace
+from ._emoji_replace import _emoji_replace, get_emoji
 
 
 if TYPE_CHECKING:
@@ -43,7 +42,7 @@ class Emoji(JupyterMixin):
         self.style = style
         self.variant = variant
         try:
-            self._char = EMOJI[name]
+            self._char = get_emoji(name)
         except KeyError:
             raise NoEmoji(f"No emoji called {name!r}")
         if variant is not None:
@@ -76,13 +75,14 @@ class Emoji(JupyterMixin):
 if __name__ == "__main__":  # pragma: no cover
     import sys
 
+    from rich._emoji_replace import _get_emoji_index
     from rich.columns import Columns
     from rich.console import Console
 
     console = Console(record=True)
 
     columns = Columns(
-        (f":{name}: {name}" for name in sorted(EMOJI.keys()) if "\u200D" not in name),
+        (f":{name}: {name}" for name in _get_emoji_index()[0] if "\u200D" not in name),
         column_first=True,
     )
 
@@ -1,5 +1,7 @@
 import io
-from typing import IO, TYPE_CHECKING, Any, List
+from threading import Lock, Timer
+from time import monotonic
+from typing import IO, TYPE_CHECKING, Any, List, Optional
 
 from .ansi import AnsiDecoder
 from .text import Text
@@ -8,20 +10,125 @@ if TYPE_CHECKING:
     from .console import Console
 
 
+def _print_lines(console: "Console", decoder: AnsiDecoder, lines: List[str]) -> None:
+    """Print lines to the console, as a single renderable."""
+    output = Text("\n").join(decoder.decode_line(line) for line in lines)
+    console.print(output)
+
+
+class _PendingLines:
+    """Complete lines held back by coalescing, which may be shared by file proxies so that
+    lines are printed in the order they were written.
+
+    Args:
+        console (Console): Console to print to.
+        max_latency (float): Maximum time in seconds that lines are held back.
+    """
+
+    def __init__(self, console: "Console", max_latency: float) -> None:
+        self.console = console
+        self.max_latency = max_latency
+        self._lines: List[str] = []
+        self._time = 0.0
+        self._timer: Optional[Timer] = None
+        self._flushing = False
+        self._lock = Lock()
+        self._ansi_decoder = AnsiDecoder()
+
+    def add(self, lines: List[str]) -> None:
+        """Hold back lines, which are printed within ``max_latency`` seconds.
+
+        Args:
+            lines (List[str]): Complete lines, without new line characters.
+        """
+        with self._lock:
+            if not self._lines:
+                self._time = monotonic()
+            self._lines.extend(lines)
+            expired = monotonic() - self._time >= self.max_latency
+            if not expired and self._timer is None:
+                # Print the lines on time, even if nothing else is written or flushed
+                timer = self._timer = Timer(self.max_latency, self.flush)
+                timer.daemon = True
+                timer.start()
+        if expired:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Print lines which have been held back.
+
+        Returns:
+            bool: True if lines were printed, otherwise False.
+        """
+        with self._lock:
+            timer = self._timer
+            self._timer = None
+            if self._flushing:
+                # The thread which is printing lines will also print these, in order
+                return bool(self._lines)
+            self._flushing = True
+        if timer is not None:
+            timer.cancel()
+        printed = False
+        try:
+            while True:
+                with self._lock:
+                    lines = self._lines[:]
+                    self._lines.clear()
+                    if not lines:
+                        self._flushing = False
+                        return printed
+                # No lock is held while printing, as the console may call a live display's render hook
+                _print_lines(self.console, self._ansi_decoder, lines)
+                printed = True
+        except BaseException:
+            with self._lock:
+                self._flushing = False
+            raise
+
+
 class FileProxy(io.TextIOBase):
-    """Wraps a file (e.g. sys.stdout) and redirects writes to a console."""
+    """Wraps a file (e.g. sys.stdout) and redirects writes to a console.
+
+    Args:
+        console (Console): Console to write to.
+        file (IO[str]): The file being proxied.
+        max_latency (float, optional): Enables coalescing, where complete lines are held back and printed
+            in a single batch by :meth:`flush_lines`, or once they have waited this many seconds.
+            Defaults to None, which prints lines as soon as they are written.
+        coalesce_with (FileProxy, optional): Another coalescing file proxy to share held back lines with, so that
+            lines written to either file are printed in the order they were written. Defaults to None.
+    """
 
-    def __init__(self, console: "Console", file: IO[str]) -> None:
+    def __init__(
+        self,
+        console: "Console",
+        file: IO[str],
+        max_latency: Optional[float] = None,
+        coalesce_with: Optional["FileProxy"] = None,
+    ) -> None:
         self.__console = console
         self.__file = file
         self.__buffer: List[str] = []
         self.__ansi_decoder = AnsiDecoder()
+        self.__max_latency = max_latency
+        self.__pending: Optional[_PendingLines] = None
+        if max_latency is not None:
+            if coalesce_with is not None and coalesce_with.__pending is not None:
+                self.__pending = coalesce_with.__pending
+            else:
+                self.__pending = _PendingLines(console, max_latency)
 
     @property
     def rich_proxied_file(self) -> IO[str]:
         """Get proxied file."""
         return self.__file
 
+    @property
+    def max_latency(self) -> Optional[float]:
+        """Maximum time in seconds that lines may be held back, or None if not coalescing."""
+        return self.__max_latency
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self.__file, name)
 
@@ -39,15 +146,25 @@ class FileProxy(io.TextIOBase):
                 buffer.append(line)
                 break
         if lines:
-            console = self.__console
-            with console:
-                output = Text("\n").join(
-                    self.__ansi_decoder.decode_line(line) for line in lines
-                )
-                console.print(output)
+            if self.__pending is None:
+                with self.__console:
+                    _print_lines(self.__console, self.__ansi_decoder, lines)
+            else:
+                self.__pending.add(lines)
         return len(text)
 
+    def flush_lines(self) -> bool:
+        """Print any complete lines held back by coalescing.
+
+        Returns:
+            bool: True if lines were printed, otherwise False.
+        """
+        if self.__pending is None:
+            return False
+        return self.__pending.flush()
+
     def flush(self) -> None:
+        self.flush_lines()
         output = "".join(self.__buffer)
         if output:
             self.__console.print(output)
@@ -5,7 +5,6 @@ if TYPE_CHECKING:
 
 from . import get_console
 from .segment import Segment
-from .terminal_theme import DEFAULT_TERMINAL_THEME
 
 if TYPE_CHECKING:
     from rich.console import ConsoleRenderable
@@ -61,6 +60,8 @@ def _render_segments(segments: Iterable[Segment]) -> str:
         """Escape html."""
         return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
+    from .terminal_theme import DEFAULT_TERMINAL_THEME
+
     fragments: List[str] = []
     append_fragment = fragments.append
     theme = DEFAULT_TERMINAL_THEME
@@ -2,8 +2,10 @@ from abc import ABC, abstractmethod
 from itertools import islice
 from operator import itemgetter
 from threading import RLock
+from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Iterable,
     List,
@@ -11,6 +13,7 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    Type,
     Union,
 )
 
@@ -26,6 +29,8 @@ from .segment import Segment
 from .style import StyleType
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     from rich.tree import Tree
 
 
@@ -149,6 +154,10 @@ class Layout:
         minimum_size (int, optional): Minimum size of layout. Defaults to 1.
         ratio (int, optional): Optional ratio for flexible layout. Defaults to 1.
         visible (bool, optional): Visibility of layout. Defaults to True.
+        render_workers (int, optional): Number of threads used to render the leaf layouts concurrently, or None to
+            render them one at a time. Only the root layout (the one that is printed) uses this. Defaults to None.
+        cache_renders (bool, optional): Reuse the previous render of leaf layouts which haven't changed (see
+            :meth:`invalidate`). Only the root layout uses this. Defaults to False.
     """
 
     splitters = {"row": RowSplitter, "column": ColumnSplitter}
@@ -162,6 +171,8 @@ class Layout:
         minimum_size: int = 1,
         ratio: int = 1,
         visible: bool = True,
+        render_workers: Optional[int] = None,
+        cache_renders: bool = False,
     ) -> None:
         self._renderable = renderable or _Placeholder(self)
         self.size = size
@@ -173,6 +184,12 @@ class Layout:
         self._children: List[Layout] = []
         self._render_map: RenderMap = {}
         self._lock = RLock()
+        self.render_workers = render_workers
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._executor_workers = 0
+        self.cache_renders = cache_renders
+        self._version = 0
+        self._render_cache: Optional[Tuple[Tuple[Any, ...], LayoutRender]] = None
 
     def __rich_repr__(self) -> Result:
         yield "name", self.name, None
@@ -324,6 +341,14 @@ class Layout:
         """
         with self._lock:
             self._renderable = renderable
+            self._version += 1
+
+    def invalidate(self) -> None:
+        """Mark the layout as changed, so that it is rendered again when the root layout has
+        ``cache_renders`` enabled. Call this if the renderable was modified in place.
+        """
+        with self._lock:
+            self._version += 1
 
     def refresh_screen(self, console: "Console", layout_name: str) -> None:
         """Refresh a sub-layout.
@@ -342,6 +367,38 @@ class Layout:
             self._render_map[layout] = LayoutRender(region, lines)
             console.update_screen_lines(lines, x, y)
 
+    def refresh_changed(self, console: "Console") -> List["Layout"]:
+        """Refresh only the sub-layouts that have changed since the last render.
+
+        Layouts are considered changed if they were updated (or invalidated), or if their
+        region of the screen changed. The console must be in alt screen mode.
+
+        Args:
+            console (Console): Console instance where Layout is to be rendered.
+
+        Returns:
+            List[Layout]: Layouts that were refreshed.
+        """
+        with self._lock:
+            previous_map = self._render_map
+            options = console.options
+            render_map = self._render(
+                console,
+                options.update_dimensions(
+                    options.max_width, options.height or console.height
+                ),
+                cache_renders=True,
+            )
+            self._render_map = render_map
+            refreshed: List[Layout] = []
+            for layout, layout_render in render_map.items():
+                if previous_map.get(layout) is layout_render:
+                    continue
+                x, y, _width, _height = layout_render.region
+                console.update_screen_lines(layout_render.render, x, y)
+                refreshed.append(layout)
+            return refreshed
+
     def _make_region_map(self, width: int, height: int) -> RegionMap:
         """Create a dict that maps layout on to Region."""
         stack: List[Tuple[Layout, Region]] = [(self, Region(0, 0, width, height))]
@@ -370,6 +427,21 @@ class Layout:
             console (Console): Console instance.
             options (ConsoleOptions): Console options.
 
+        Returns:
+            RenderMap: A dict that maps Layout on to a tuple of Region, lines
+        """
+        return self._render(console, options, cache_renders=self.cache_renders)
+
+    def _render(
+        self, console: Console, options: ConsoleOptions, cache_renders: bool
+    ) -> RenderMap:
+        """Render the sub_layouts.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+            cache_renders (bool): Reuse renders of sub-layouts that haven't changed.
+
         Returns:
             RenderMap: A dict that maps Layout on to a tuple of Region, lines
         """
@@ -381,17 +453,115 @@ class Layout:
             for layout, region in region_map.items()
             if not layout.children
         ]
-        render_map: Dict["Layout", "LayoutRender"] = {}
         render_lines = console.render_lines
         update_dimensions = options.update_dimensions
 
-        for layout, region in layout_regions:
-            lines = render_lines(
-                layout.renderable, update_dimensions(region.width, region.height)
-            )
-            render_map[layout] = LayoutRender(region, lines)
+        layout_renders: List[Optional[LayoutRender]] = []
+        pending: List[Tuple[int, Layout, Region, ConsoleOptions, int]] = []
+        for index, (layout, region) in enumerate(layout_regions):
+            render_options = update_dimensions(region.width, region.height)
+            if cache_renders:
+                layout_render = layout._get_cached_render(
+                    console, region, render_options
+                )
+                if layout_render is not None:
+                    layout_renders.append(layout_render)
+                    continue
+            layout_renders.append(None)
+            pending.append((index, layout, region, render_options, layout._version))
+
+        if self.render_workers and len(pending) > 1:
+            executor = self._get_executor(self.render_workers)
+            futures = [
+                executor.submit(render_lines, layout.renderable, render_options)
+                for _index, layout, _region, render_options, _version in pending
+            ]
+            rendered_lines = [future.result() for future in futures]
+        else:
+            rendered_lines = [
+                render_lines(layout.renderable, render_options)
+                for _index, layout, _region, render_options, _version in pending
+            ]
+
+        for (index, layout, region, render_options, version), lines in zip(
+            pending, rendered_lines
+        ):
+            layout_render = layout_renders[index] = LayoutRender(region, lines)
+            if cache_renders:
+                # Version from before rendering, in case of concurrent updates
+                layout._render_cache = (
+                    (version, console, region, render_options),
+                    layout_render,
+                )
+
+        render_map: RenderMap = {}
+        for (layout, _region), layout_render in zip(layout_regions, layout_renders):
+            assert layout_render is not None
+            render_map[layout] = layout_render
         return render_map
 
+    def _get_cached_render(
+        self, console: Console, region: Region, options: ConsoleOptions
+    ) -> Optional[LayoutRender]:
+        """Get the previous render of this layout, if it is still valid.
+
+        Args:
+            console (Console): Console instance.
+            region (Region): Region of the screen the layout will be rendered in to.
+            options (ConsoleOptions): Console options used to render the layout.
+
+        Returns:
+            Optional[LayoutRender]: The previous render, or None if the layout must be rendered again.
+        """
+        if self._render_cache is None:
+            return None
+        key, layout_render = self._render_cache
+        if key == (self._version, console, region, options):
+            return layout_render
+        return None
+
+    def _get_executor(self, max_workers: int) -> "ThreadPoolExecutor":
+        """Get a thread pool to render leaf layouts, which is created on first use.
+
+        Args:
+            max_workers (int): Number of threads in the pool.
+
+        Returns:
+            ThreadPoolExecutor: A thread pool executor.
+        """
+        executor = self._executor
+        if executor is None or self._executor_workers != max_workers:
+            from concurrent.futures import ThreadPoolExecutor
+
+            if executor is not None:
+                executor.shutdown(wait=False)
+            executor = self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="rich-layout"
+            )
+            self._executor_workers = max_workers
+        return executor
+
+    def close(self) -> None:
+        """Shut down the threads used to render with ``render_workers``. The layout may still be
+        rendered after it is closed, and will start new threads if required."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._executor_workers = 0
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "Layout":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
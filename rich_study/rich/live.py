@@ -1,9 +1,22 @@
 from __future__ import annotations
 
 import sys
-from threading import Event, RLock, Thread
+from collections import deque
+from threading import Event, Lock, RLock, Thread
+from time import perf_counter
 from types import TracebackType
-from typing import IO, TYPE_CHECKING, Any, Callable, List, Optional, TextIO, Type, cast
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    List,
+    Optional,
+    TextIO,
+    Type,
+    cast,
+)
 
 from . import get_console
 from .console import Console, ConsoleRenderable, Group, RenderableType, RenderHook
@@ -19,8 +32,16 @@ if TYPE_CHECKING:
     from typing_extensions import Self  # pragma: no cover
 
 
+IDLE_REFRESH_INTERVAL = 1.0
+"""Maximum time (in seconds) between refreshes with adaptive refresh, so that animations continue when nothing changes."""
+
+RENDER_TIME_FACTOR = 2.0
+"""With adaptive refresh, the refresh interval is at least this multiple of the average render time."""
+
+
 class _RefreshThread(Thread):
-    """A thread that calls refresh() at regular intervals."""
+    """A thread that calls refresh() at regular intervals, or when
+    a refresh is requested if the live display uses adaptive refresh."""
 
     def __init__(self, live: "Live", refresh_per_second: float) -> None:
         self.live = live
@@ -30,13 +51,139 @@ class _RefreshThread(Thread):
 
     def stop(self) -> None:
         self.done.set()
+        # Wake the thread if it is waiting for a refresh request
+        self.live._refresh_requested.set()
 
     def run(self) -> None:
+        if self.live.adaptive_refresh:
+            self._run_adaptive()
+            return
         while not self.done.wait(1 / self.refresh_per_second):
             with self.live._lock:
                 if not self.done.is_set():
                     self.live.refresh()
 
+    def _run_adaptive(self) -> None:
+        live = self.live
+        done = self.done
+        requested = live._refresh_requested
+        while not done.is_set():
+            requested.wait(IDLE_REFRESH_INTERVAL)
+            with live._lock:
+                if done.is_set():
+                    break
+                requested.clear()
+                live.refresh()
+            # Cap the refresh rate, and give the application time to run when rendering is slow
+            if done.wait(live.get_refresh_interval()):
+                break
+
+
+class RefreshDriver:
+    """Refreshes any number of live displays from a single thread.
+
+    Live displays created with ``shared_refresh=True`` register with the process-wide driver
+    (see :func:`get_refresh_driver`) rather than starting a thread each. On every tick, the driver
+    refreshes the displays which are due, each with a single write to its console.
+    The thread is started when the first display is registered, and exits when the last is removed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._wake = Event()
+        self._lives: List["Live"] = []
+        self._thread: Optional[Thread] = None
+
+    @property
+    def lives(self) -> List["Live"]:
+        """The registered live displays."""
+        with self._lock:
+            return self._lives[:]
+
+    def register(self, live: "Live") -> None:
+        """Add a live display, to refresh until it is unregistered.
+
+        Args:
+            live (Live): A started live display.
+        """
+        with self._lock:
+            if live not in self._lives:
+                self._lives.append(live)
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="rich-refresh", daemon=True
+                )
+                self._thread.start()
+        self.wake()
+
+    def unregister(self, live: "Live") -> None:
+        """Remove a live display.
+
+        Args:
+            live (Live): A registered live display.
+        """
+        with self._lock:
+            if live in self._lives:
+                self._lives.remove(live)
+        self.wake()
+
+    def wake(self) -> None:
+        """Wake the driver thread, to reschedule refreshes."""
+        self._wake.set()
+
+    def _run(self) -> None:
+        wake = self._wake
+        while True:
+            wake.clear()
+            with self._lock:
+                if not self._lives:
+                    self._thread = None
+                    return
+                lives = self._lives[:]
+            now = perf_counter()
+            next_time = now + IDLE_REFRESH_INTERVAL
+            due: List["Live"] = []
+            for live in lives:
+                refresh_time = live._get_next_refresh_time()
+                if refresh_time <= now:
+                    due.append(live)
+                else:
+                    next_time = min(next_time, refresh_time)
+            if due:
+                self._refresh(due)
+            else:
+                wake.wait(next_time - now)
+
+    def _refresh(self, lives: List["Live"]) -> None:
+        """Refresh live displays which are due."""
+        for live in lives:
+            with live._lock:
+                if live._refresh_driver is not self:
+                    continue
+                live._refresh_requested.clear()
+                try:
+                    live.refresh()
+                except Exception:
+                    # Stop refreshing this display, without affecting the others
+                    self.unregister(live)
+                    live._refresh_driver = None
+                    sys.excepthook(*sys.exc_info())
+
+
+_refresh_driver: Optional[RefreshDriver] = None
+
+
+def get_refresh_driver() -> RefreshDriver:
+    """Get the process-wide refresh driver, used by live displays with ``shared_refresh=True``.
+
+    Returns:
+        RefreshDriver: A RefreshDriver instance.
+    """
+    global _refresh_driver
+    if _refresh_driver is None:
+        _refresh_driver = RefreshDriver()
+    return _refresh_driver
+
 
 class Live(JupyterMixin, RenderHook):
     """Renders an auto-updating live display of any given renderable.
@@ -50,8 +197,14 @@ class Live(JupyterMixin, RenderHook):
         transient (bool, optional): Clear the renderable on exit (has no effect when screen=True). Defaults to False.
         redirect_stdout (bool, optional): Enable redirection of stdout, so ``print`` may be used. Defaults to True.
         redirect_stderr (bool, optional): Enable redirection of stderr. Defaults to True.
+        redirect_max_latency (float, optional): Coalesce redirected output, so that lines are printed in a single batch
+            on each refresh, or when they have been waiting for this many seconds. Defaults to None, which prints lines as they are written.
         vertical_overflow (VerticalOverflowMethod, optional): How to handle renderable when it is too tall for the console. Defaults to "ellipsis".
         get_renderable (Callable[[], RenderableType], optional): Optional callable to get renderable. Defaults to None.
+        adaptive_refresh (bool, optional): Only auto refresh when a refresh is requested (e.g. by ``update``), at up to
+            ``refresh_per_second``, and reduce the refresh rate when rendering is slow. Defaults to False.
+        shared_refresh (bool, optional): Auto refresh from a thread shared with other live displays, rather than
+            starting a thread for this display. Defaults to False.
     """
 
     def __init__(
@@ -65,8 +218,11 @@ class Live(JupyterMixin, RenderHook):
         transient: bool = False,
         redirect_stdout: bool = True,
         redirect_stderr: bool = True,
+        redirect_max_latency: Optional[float] = None,
         vertical_overflow: VerticalOverflowMethod = "ellipsis",
         get_renderable: Optional[Callable[[], RenderableType]] = None,
+        adaptive_refresh: bool = False,
+        shared_refresh: bool = False,
     ) -> None:
         assert refresh_per_second > 0, "refresh_per_second must be > 0"
         self._renderable = renderable
@@ -76,6 +232,8 @@ class Live(JupyterMixin, RenderHook):
 
         self._redirect_stdout = redirect_stdout
         self._redirect_stderr = redirect_stderr
+        self._redirect_max_latency = redirect_max_latency
+        self._file_proxies: List[FileProxy] = []
         self._restore_stdout: Optional[IO[str]] = None
         self._restore_stderr: Optional[IO[str]] = None
 
@@ -87,6 +245,12 @@ class Live(JupyterMixin, RenderHook):
 
         self._refresh_thread: Optional[_RefreshThread] = None
         self.refresh_per_second = refresh_per_second
+        self.adaptive_refresh = adaptive_refresh
+        self._refresh_requested = Event()
+        self._render_time = 0.0
+        self._refresh_times: Deque[float] = deque(maxlen=20)
+        self.shared_refresh = shared_refresh
+        self._refresh_driver: Optional[RefreshDriver] = None
 
         self.vertical_overflow = vertical_overflow
         self._get_renderable = get_renderable
@@ -100,6 +264,58 @@ class Live(JupyterMixin, RenderHook):
         """Check if live display has been started."""
         return self._started
 
+    @property
+    def fps(self) -> float:
+        """The number of refreshes per second, averaged over recent refreshes."""
+        refresh_times = self._refresh_times
+        if len(refresh_times) < 2:
+            return 0.0
+        elapsed = refresh_times[-1] - refresh_times[0]
+        return (len(refresh_times) - 1) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def render_time(self) -> float:
+        """The average time (in seconds) taken to refresh the display."""
+        return self._render_time
+
+    def get_refresh_interval(self) -> float:
+        """Get the minimum time between automatic refreshes.
+
+        Returns:
+            float: Time in seconds.
+        """
+        interval = 1 / self.refresh_per_second
+        if self.adaptive_refresh:
+            interval = max(interval, self._render_time * RENDER_TIME_FACTOR)
+        return interval
+
+    def request_refresh(self) -> None:
+        """Notify the live display that its renderable has changed. With adaptive refresh,
+        the display is refreshed by the refresh thread once the refresh interval allows.
+        """
+        if self._nested:
+            # The first live display renders nested live displays
+            live_stack = self.console._live_stack
+            if live_stack and live_stack[0] is not self:
+                live_stack[0].request_refresh()
+            return
+        refresh_requested = self._refresh_requested
+        if not refresh_requested.is_set():
+            refresh_requested.set()
+            refresh_driver = self._refresh_driver
+            if refresh_driver is not None:
+                refresh_driver.wake()
+
+    def _get_next_refresh_time(self) -> float:
+        """Get the time (from :func:`time.perf_counter`) of the next automatic refresh."""
+        refresh_times = self._refresh_times
+        if not refresh_times:
+            return 0.0
+        last_refresh_time = refresh_times[-1]
+        if self.adaptive_refresh and not self._refresh_requested.is_set():
+            return last_refresh_time + IDLE_REFRESH_INTERVAL
+        return last_refresh_time + self.get_refresh_interval()
+
     def get_renderable(self) -> RenderableType:
         renderable = (
             self._get_renderable()
@@ -139,8 +355,12 @@ class Live(JupyterMixin, RenderHook):
                     self.stop()
                     raise
             if self.auto_refresh:
-                self._refresh_thread = _RefreshThread(self, self.refresh_per_second)
-                self._refresh_thread.start()
+                if self.shared_refresh:
+                    self._refresh_driver = get_refresh_driver()
+                    self._refresh_driver.register(self)
+                else:
+                    self._refresh_thread = _RefreshThread(self, self.refresh_per_second)
+                    self._refresh_thread.start()
 
     def stop(self) -> None:
         """Stop live rendering display."""
@@ -157,6 +377,9 @@ class Live(JupyterMixin, RenderHook):
             if self.auto_refresh and self._refresh_thread is not None:
                 self._refresh_thread.stop()
                 self._refresh_thread = None
+            if self._refresh_driver is not None:
+                self._refresh_driver.unregister(self)
+                self._refresh_driver = None
             # allow it to fully render on the last even if overflow
             self.vertical_overflow = "visible"
             with self.console:
@@ -191,15 +414,28 @@ class Live(JupyterMixin, RenderHook):
     def _enable_redirect_io(self) -> None:
         """Enable redirecting of stdout / stderr."""
         if self.console.is_terminal or self.console.is_jupyter:
+            max_latency = self._redirect_max_latency
             if self._redirect_stdout and not isinstance(sys.stdout, FileProxy):
                 self._restore_stdout = sys.stdout
-                sys.stdout = cast("TextIO", FileProxy(self.console, sys.stdout))
+                stdout_proxy = FileProxy(self.console, sys.stdout, max_latency)
+                self._file_proxies.append(stdout_proxy)
+                sys.stdout = cast("TextIO", stdout_proxy)
             if self._redirect_stderr and not isinstance(sys.stderr, FileProxy):
                 self._restore_stderr = sys.stderr
-                sys.stderr = cast("TextIO", FileProxy(self.console, sys.stderr))
+                # Shares held back lines with stdout, to keep the order they were written in
+                stderr_proxy = FileProxy(
+                    self.console,
+                    sys.stderr,
+                    max_latency,
+                    coalesce_with=self._file_proxies[0] if self._file_proxies else None,
+                )
+                self._file_proxies.append(stderr_proxy)
+                sys.stderr = cast("TextIO", stderr_proxy)
 
     def _disable_redirect_io(self) -> None:
         """Disable redirecting of stdout / stderr."""
+        self._flush_redirected()
+        self._file_proxies.clear()
         if self._restore_stdout:
             sys.stdout = cast("TextIO", self._restore_stdout)
             self._restore_stdout = None
@@ -207,6 +443,18 @@ class Live(JupyterMixin, RenderHook):
             sys.stderr = cast("TextIO", self._restore_stderr)
             self._restore_stderr = None
 
+    def _flush_redirected(self) -> bool:
+        """Print lines held back by coalescing redirected output.
+
+        Returns:
+            bool: True if any lines were printed.
+        """
+        flushed = False
+        for file_proxy in self._file_proxies:
+            if file_proxy.flush_lines():
+                flushed = True
+        return flushed
+
     @property
     def renderable(self) -> RenderableType:
         """Get the renderable that is being displayed
@@ -236,40 +484,60 @@ class Live(JupyterMixin, RenderHook):
             self._renderable = renderable
             if refresh:
                 self.refresh()
+            else:
+                self.request_refresh()
 
     def refresh(self) -> None:
         """Update the display of the Live Render."""
         with self._lock:
-            self._live_render.set_renderable(self.renderable)
-            if self._nested:
-                if self.console._live_stack:
-                    self.console._live_stack[0].refresh()
-                return
-
-            if self.console.is_jupyter:  # pragma: no cover
-                try:
-                    from IPython.display import display
-                    from ipywidgets import Output
-                except ImportError:
-                    import warnings
-
-                    warnings.warn('install "ipywidgets" for Jupyter support')
-                else:
-                    if self.ipy_widget is None:
-                        self.ipy_widget = Output()
-                        display(self.ipy_widget)
-
-                    with self.ipy_widget:
-                        self.ipy_widget.clear_output(wait=True)
-                        self.console.print(self._live_render.renderable)
-            elif self.console.is_terminal and not self.console.is_dumb_terminal:
-                with self.console:
-                    self.console.print(Control())
-            elif (
-                not self._started and not self.transient
-            ):  # if it is finished allow files or dumb-terminals to see final result
-                with self.console:
+            start_time = perf_counter()
+            try:
+                self._refresh()
+            finally:
+                end_time = perf_counter()
+                render_time = end_time - start_time
+                # Exponential moving average, to smooth out occasional slow renders
+                self._render_time = (
+                    render_time
+                    if not self._refresh_times
+                    else self._render_time * 0.8 + render_time * 0.2
+                )
+                self._refresh_times.append(end_time)
+
+    def _refresh(self) -> None:
+        self._live_render.set_renderable(self.renderable)
+        if self._nested:
+            if self.console._live_stack:
+                self.console._live_stack[0].refresh()
+            return
+
+        if self.console.is_jupyter:  # pragma: no cover
+            try:
+                from IPython.display import display
+                from ipywidgets import Output
+            except ImportError:
+                import warnings
+
+                warnings.warn('install "ipywidgets" for Jupyter support')
+            else:
+                if self.ipy_widget is None:
+                    self.ipy_widget = Output()
+                    display(self.ipy_widget)
+
+                self._flush_redirected()
+                with self.ipy_widget:
+                    self.ipy_widget.clear_output(wait=True)
+                    self.console.print(self._live_render.renderable)
+        elif self.console.is_terminal and not self.console.is_dumb_terminal:
+            with self.console:
+                # Printing redirected lines also redraws the live display
+                if not self._flush_redirected():
                     self.console.print(Control())
+        elif (
+            not self._started and not self.transient
+        ):  # if it is finished allow files or dumb-terminals to see final result
+            with self.console:
+                self.console.print(Control())
 
     def process_renderables(
         self, renderables: List[ConsoleRenderable]
@@ -78,16 +78,16 @@ class LiveRender:
     ) -> RenderResult:
         renderable = self.renderable
         style = console.get_style(self.style)
-        lines = console.render_lines(renderable, options, style=style, pad=False)
-        shape = Segment.get_shape(lines)
+        lines = console.render_line_block(renderable, options, style=style, pad=False)
+        shape = lines.shape
 
         _, height = shape
         if height > options.size.height:
             if self.vertical_overflow == "crop":
-                lines = lines[: options.size.height]
-                shape = Segment.get_shape(lines)
+                lines = lines.crop_height(options.size.height)
+                shape = lines.shape
             elif self.vertical_overflow == "ellipsis":
-                lines = lines[: (options.size.height - 1)]
+                lines = lines.crop_height(options.size.height - 1)
                 overflow_text = Text(
                     "...",
                     overflow="crop",
@@ -96,7 +96,7 @@ class LiveRender:
                     style="live.ellipsis",
                 )
                 lines.append(list(console.render(overflow_text)))
-                shape = Segment.get_shape(lines)
+                shape = lines.shape
         self._shape = shape
 
         new_line = Segment.line()
@@ -3,7 +3,7 @@ from datetime import datetime
 from logging import Handler, LogRecord
 from pathlib import Path
 from types import ModuleType
-from typing import ClassVar, Iterable, List, Optional, Type, Union
+from typing import TYPE_CHECKING, ClassVar, Iterable, List, Optional, Type, Union
 
 from rich._null_file import NullFile
 
@@ -12,7 +12,9 @@ from ._log_render import FormatTimeCallable, LogRender
 from .console import Console, ConsoleRenderable
 from .highlighter import Highlighter, ReprHighlighter
 from .text import Text
-from .traceback import Traceback
+
+if TYPE_CHECKING:
+    from .traceback import Traceback
 
 
 class RichHandler(Handler):
@@ -141,6 +143,8 @@ class RichHandler(Handler):
             exc_type, exc_value, exc_traceback = record.exc_info
             assert exc_type is not None
             assert exc_value is not None
+            from .traceback import Traceback
+
             traceback = Traceback.from_exception(
                 exc_type,
                 exc_value,
@@ -208,7 +212,7 @@ class RichHandler(Handler):
         self,
         *,
         record: LogRecord,
-        traceback: Optional[Traceback],
+        traceback: Optional["Traceback"],
         message_renderable: "ConsoleRenderable",
     ) -> "ConsoleRenderable":
         """Render log for display.
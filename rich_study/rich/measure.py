@@ -105,11 +105,13 @@ class Measurement(NamedTuple):
                 Callable[["Console", "ConsoleOptions"], "Measurement"]
             ] = getattr(renderable, "__rich_measure__", None)
             if get_console_width is not None:
+                profiler = console._render_profiler
                 render_width = (
                     get_console_width(console, options)
-                    .normalize()
-                    .with_maximum(_max_width)
+                    if profiler is None
+                    else profiler.measure(renderable, get_console_width, options)
                 )
+                render_width = render_width.normalize().with_maximum(_max_width)
                 if render_width.maximum < 1:
                     return Measurement(0, 0)
                 return render_width.normalize()
@@ -94,7 +94,7 @@ class Padding(JupyterMixin):
             render_options = render_options.update_height(
                 height=render_options.height - self.top - self.bottom
             )
-        lines = console.render_lines(
+        lines = console.render_lines_cached(
             self.renderable, render_options, style=style, pad=True
         )
         _Segment = Segment
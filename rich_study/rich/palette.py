@@ -1,18 +1,29 @@
 from math import sqrt
-from functools import lru_cache
-from typing import Sequence, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from .color_triplet import ColorTriplet
 
 if TYPE_CHECKING:
     from rich.table import Table
 
+_CELL_UNKNOWN = 255
+"""Marks a cell in the lookup table that has not yet been calculated."""
+_CELL_AMBIGUOUS = 254
+"""Marks a cell in the lookup table that contains colors with different matches."""
+_CELL_DISTANCE_BOUND = 22.5
+"""Maximum difference between the distance from a color to a palette color, and the distance from
+the center of the color's cell. The distance changes by at most 2.1, 2, and 1.75 per unit of red,
+green, and blue, colors are within 3.5 units of the center, and the integer arithmetic in
+Palette._match_colors adds less than 1.7."""
+
 
 class Palette:
     """A palette of available colors."""
 
     def __init__(self, colors: Sequence[Tuple[int, int, int]]):
         self._colors = colors
+        self._lookup: Optional[bytearray] = None
+        self._candidates: Dict[int, List[int]] = {}
 
     def __getitem__(self, number: int) -> ColorTriplet:
         return ColorTriplet(*self._colors[number])
@@ -40,14 +51,80 @@ class Palette:
             )
         return table
 
-    # This is somewhat inefficient and needs caching
-    @lru_cache(maxsize=1024)
     def match(self, color: Tuple[int, int, int]) -> int:
         """Find a color from a palette that most closely matches a given color.
 
         Args:
             color (Tuple[int, int, int]): RGB components in range 0 > 255.
 
+        Returns:
+            int: Index of closes matching color.
+        """
+        red, green, blue = color
+        if (red | green | blue) >> 8:
+            # Out of range for the lookup table
+            return self._match_colors(color, range(len(self._colors)))
+        cell = (red >> 3) << 10 | (green >> 3) << 5 | blue >> 3
+        lookup = self._lookup
+        if lookup is None:
+            if len(self._colors) >= _CELL_AMBIGUOUS:
+                return self._match_colors(color, range(len(self._colors)))
+            lookup = self._lookup = bytearray([_CELL_UNKNOWN]) * (32 * 32 * 32)
+        index = lookup[cell]
+        if index == _CELL_UNKNOWN:
+            index = lookup[cell] = self._build_cell(cell)
+        if index == _CELL_AMBIGUOUS:
+            return self._match_colors(color, self._candidates[cell])
+        return index
+
+    def _build_cell(self, cell: int) -> int:
+        """Find the palette colors which may be closest to colors in a cell of the lookup table.
+
+        The lookup table divides the RGB cube in to 32x32x32 cells. The distance from
+        any color in a cell to a palette color is within _CELL_DISTANCE_BOUND of the
+        distance from the center of the cell, so a palette color which is nearer to the
+        center than all others by twice that bound is the closest match for the whole cell.
+
+        Args:
+            cell (int): Index of cell in lookup table.
+
+        Returns:
+            int: Index of the closest palette color, or _CELL_AMBIGUOUS if there are several candidates.
+        """
+        red1 = (cell >> 10) * 8 + 3.5
+        green1 = ((cell >> 5) & 31) * 8 + 3.5
+        blue1 = (cell & 31) * 8 + 3.5
+        distances: List[float] = []
+        for red2, green2, blue2 in self._colors:
+            red_mean = (red1 + red2) / 2
+            red = red1 - red2
+            green = green1 - green2
+            blue = blue1 - blue2
+            distances.append(
+                sqrt(
+                    (512 + red_mean) * red * red / 256
+                    + 4 * green * green
+                    + (767 - red_mean) * blue * blue / 256
+                )
+            )
+        cutoff = min(distances) + 2 * _CELL_DISTANCE_BOUND
+        candidates = [
+            index for index, distance in enumerate(distances) if distance <= cutoff
+        ]
+        if len(candidates) == 1:
+            return candidates[0]
+        self._candidates[cell] = candidates
+        return _CELL_AMBIGUOUS
+
+    def _match_colors(
+        self, color: Tuple[int, int, int], candidates: Iterable[int]
+    ) -> int:
+        """Find the closest match from candidate palette colors.
+
+        Args:
+            color (Tuple[int, int, int]): RGB components in range 0 > 255.
+            candidates (Iterable[int]): Palette indices to consider, in ascending order.
+
         Returns:
             int: Index of closes matching color.
         """
@@ -68,7 +145,7 @@ class Palette:
                 + (((767 - red_mean) * blue * blue) >> 8)
             )
 
-        min_index = min(range(len(self._colors)), key=get_color_distance)
+        min_index = min(candidates, key=get_color_distance)
         return min_index
 
 
@@ -226,7 +226,7 @@ class Panel(JupyterMixin):
         child_options = options.update(
             width=child_width, height=child_height, highlight=self.highlight
         )
-        lines = console.render_lines(renderable, child_options, style=style)
+        lines = console.render_lines_cached(renderable, child_options, style=style)
 
         line_start = Segment(box.mid_left, border_style)
         line_end = Segment(f"{box.mid_right}", border_style)
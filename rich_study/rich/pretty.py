@@ -7,7 +7,7 @@ import reprlib
 import sys
 from array import array
 from collections import Counter, UserDict, UserList, defaultdict, deque
-from dataclasses import dataclass, fields, is_dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
 from inspect import isclass
 from itertools import islice
 from types import MappingProxyType
@@ -19,6 +19,7 @@ from typing import (
     Deque,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -265,6 +266,8 @@ class Pretty(JupyterMixin):
             Defaults to None.
         max_string (int, optional): Maximum length of string before truncating, or None to disable. Defaults to None.
         max_depth (int, optional): Maximum depth of nested data structures, or None for no maximum. Defaults to None.
+        max_nodes (int, optional): Maximum number of values to pretty print before abbreviating, or None for no maximum.
+            Defaults to None.
         expand_all (bool, optional): Expand all containers. Defaults to False.
         margin (int, optional): Subtrace a margin from width to force containers to expand earlier. Defaults to 0.
         insert_line (bool, optional): Insert a new line if the output has multiple new lines. Defaults to False.
@@ -283,6 +286,7 @@ class Pretty(JupyterMixin):
         max_length: Optional[int] = None,
         max_string: Optional[int] = None,
         max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
         expand_all: bool = False,
         margin: int = 0,
         insert_line: bool = False,
@@ -297,6 +301,7 @@ class Pretty(JupyterMixin):
         self.max_length = max_length
         self.max_string = max_string
         self.max_depth = max_depth
+        self.max_nodes = max_nodes
         self.expand_all = expand_all
         self.margin = margin
         self.insert_line = insert_line
@@ -311,6 +316,7 @@ class Pretty(JupyterMixin):
             max_length=self.max_length,
             max_string=self.max_string,
             max_depth=self.max_depth,
+            max_nodes=self.max_nodes,
             expand_all=self.expand_all,
         )
         pretty_text = Text.from_ansi(
@@ -346,6 +352,7 @@ class Pretty(JupyterMixin):
             max_length=self.max_length,
             max_string=self.max_string,
             max_depth=self.max_depth,
+            max_nodes=self.max_nodes,
             expand_all=self.expand_all,
         )
         text_width = (
@@ -420,9 +427,10 @@ class Node:
     children: Optional[List["Node"]] = None
     key_separator: str = ": "
     separator: str = ", "
+    _value_length: Optional[int] = field(default=None, repr=False, compare=False)
 
-    def iter_tokens(self) -> Iterable[str]:
-        """Generate tokens for this node."""
+    def _iter_parts(self) -> Iterator[Union[str, "Node"]]:
+        """Generate tokens for this node, and child nodes in place of their tokens."""
         if self.key_repr:
             yield self.key_repr
             yield self.key_separator
@@ -432,17 +440,31 @@ class Node:
             if self.children:
                 yield self.open_brace
                 if self.is_tuple and not self.is_namedtuple and len(self.children) == 1:
-                    yield from self.children[0].iter_tokens()
+                    yield self.children[0]
                     yield ","
                 else:
                     for child in self.children:
-                        yield from child.iter_tokens()
+                        yield child
                         if not child.last:
                             yield self.separator
                 yield self.close_brace
             else:
                 yield self.empty
 
+    def iter_tokens(self) -> Iterable[str]:
+        """Generate tokens for this node."""
+        stack = [self._iter_parts()]
+        push = stack.append
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, str):
+                    yield part
+                else:
+                    push(part._iter_parts())
+                    break
+            else:
+                stack.pop()
+
     def check_length(self, start_length: int, max_length: int) -> bool:
         """Check the length fits within a limit.
 
@@ -453,6 +475,13 @@ class Node:
         Returns:
             bool: True if the node can be rendered within max length, otherwise False.
         """
+        if self._value_length is not None:
+            key_length = (
+                cell_len(self.key_repr) + cell_len(self.key_separator)
+                if self.key_repr
+                else 0
+            )
+            return start_length + key_length + self._value_length <= max_length
         total_length = start_length
         for token in self.iter_tokens():
             total_length += cell_len(token)
@@ -460,6 +489,40 @@ class Node:
                 return False
         return True
 
+    def _measure(self) -> None:
+        """Store the length of the value, so that :meth:`check_length` doesn't need
+        to walk the tree. Should be called after the children have been measured."""
+
+        def get_length(node: Node) -> int:
+            if node._value_length is None:
+                return sum(cell_len(token) for token in node.iter_tokens())
+            if node.key_repr:
+                return (
+                    cell_len(node.key_repr)
+                    + cell_len(node.key_separator)
+                    + node._value_length
+                )
+            return node._value_length
+
+        if self.value_repr:
+            value_length = cell_len(self.value_repr)
+        elif self.children is None:
+            value_length = 0
+        elif not self.children:
+            value_length = cell_len(self.empty)
+        else:
+            children = self.children
+            value_length = cell_len(self.open_brace) + cell_len(self.close_brace)
+            if self.is_tuple and not self.is_namedtuple and len(children) == 1:
+                value_length += get_length(children[0]) + 1
+            else:
+                separator_length = cell_len(self.separator)
+                for child in children:
+                    value_length += get_length(child)
+                    if not child.last:
+                        value_length += separator_length
+        self._value_length = value_length
+
     def __str__(self) -> str:
         repr_text = "".join(self.iter_tokens())
         return repr_text
@@ -477,14 +540,21 @@ class Node:
         Returns:
             str: A repr string of the original object.
         """
-        lines = [_Line(node=self, is_root=True)]
-        line_no = 0
-        while line_no < len(lines):
-            line = lines[line_no]
-            if line.expandable and not line.expanded:
-                if expand_all or not line.check_length(max_width):
-                    lines[line_no : line_no + 1] = line.expand(indent_size)
-            line_no += 1
+        lines: List[_Line] = []
+        append_line = lines.append
+        # Lines still to be checked, in reverse order
+        pending = [_Line(node=self, is_root=True)]
+        pop_pending = pending.pop
+        while pending:
+            line = pop_pending()
+            if (
+                line.expandable
+                and not line.expanded
+                and (expand_all or not line.check_length(max_width))
+            ):
+                pending.extend(reversed(list(line.expand(indent_size))))
+            else:
+                append_line(line)
 
         repr_str = "\n".join(str(line) for line in lines)
         return repr_str
@@ -558,6 +628,10 @@ class _Line:
             )
 
 
+_ChildItem = Union[Node, Tuple[Any, str, str, bool]]
+"""A child node, or a tuple of (object, key repr, key separator, last) to be traversed."""
+
+
 def _is_namedtuple(obj: Any) -> bool:
     """Checks if an object is most likely a namedtuple. It is possible
     to craft an object that passes this check and isn't a namedtuple, but
@@ -582,6 +656,7 @@ def traverse(
     max_length: Optional[int] = None,
     max_string: Optional[int] = None,
     max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
 ) -> Node:
     """Traverse object and generate a tree.
 
@@ -593,6 +668,8 @@ def traverse(
             Defaults to None.
         max_depth (int, optional): Maximum depth of data structures, or None for no maximum.
             Defaults to None.
+        max_nodes (int, optional): Maximum number of nodes to generate before abbreviating the remaining
+            contents of every container, or None for no maximum. Defaults to None.
 
     Returns:
         Node: The root of a tree structure which can be used to render a pretty repr.
@@ -617,35 +694,52 @@ def traverse(
     visited_ids: Set[int] = set()
     push_visited = visited_ids.add
     pop_visited = visited_ids.remove
-
-    def _traverse(obj: Any, root: bool = False, depth: int = 0) -> Node:
-        """Walk the object depth first."""
+    node_count = 0
+
+    def out_of_budget() -> bool:
+        """Check if the node budget has been used up."""
+        return max_nodes is not None and node_count >= max_nodes
+
+    def iter_rich_args(rich_args: Any) -> Iterable[Union[Any, Tuple[str, Any]]]:
+        for arg in rich_args:
+            if _safe_isinstance(arg, tuple):
+                if len(arg) == 3:
+                    key, child, default = arg
+                    if default == child:
+                        continue
+                    yield key, child
+                elif len(arg) == 2:
+                    key, child = arg
+                    yield key, child
+                elif len(arg) == 1:
+                    yield arg[0]
+            else:
+                yield arg
+
+    def iter_keyed(
+        items: Iterable[Tuple[str, Any]], key_separator: str = "="
+    ) -> Iterator[_ChildItem]:
+        """Generate children with keys, stopping early if the budget runs out."""
+        for last, (key, child) in loop_last(items):
+            if out_of_budget():
+                yield Node(value_repr="...", last=True)
+                break
+            yield (child, key, key_separator, last)
+
+    def _traverse(
+        obj: Any, root: bool = False, depth: int = 0
+    ) -> Tuple[Node, Optional[Iterator[_ChildItem]]]:
+        """Create the node for an object, and an iterator of its children (if any)."""
 
         obj_id = id(obj)
         if obj_id in visited_ids:
             # Recursion detected
-            return Node(value_repr="...")
+            return Node(value_repr="..."), None
 
         obj_type = type(obj)
-        children: List[Node]
+        children: Optional[Iterator[_ChildItem]] = None
         reached_max_depth = max_depth is not None and depth >= max_depth
 
-        def iter_rich_args(rich_args: Any) -> Iterable[Union[Any, Tuple[str, Any]]]:
-            for arg in rich_args:
-                if _safe_isinstance(arg, tuple):
-                    if len(arg) == 3:
-                        key, child, default = arg
-                        if default == child:
-                            continue
-                        yield key, child
-                    elif len(arg) == 2:
-                        key, child = arg
-                        yield key, child
-                    elif len(arg) == 1:
-                        yield arg[0]
-                else:
-                    yield arg
-
         try:
             fake_attributes = hasattr(
                 obj, "awehoi234_wdfjwljet234_234wdfoijsdfmmnxpi492"
@@ -662,15 +756,11 @@ def traverse(
                 pass
 
         if rich_repr_result is not None:
-            push_visited(obj_id)
             angular = getattr(obj.__rich_repr__, "angular", False)
             args = list(iter_rich_args(rich_repr_result))
             class_name = obj.__class__.__name__
 
             if args:
-                children = []
-                append = children.append
-
                 if reached_max_depth:
                     if angular:
                         node = Node(value_repr=f"<{class_name}...>")
@@ -681,7 +771,7 @@ def traverse(
                         node = Node(
                             open_brace=f"<{class_name} ",
                             close_brace=">",
-                            children=children,
+                            children=[],
                             last=root,
                             separator=" ",
                         )
@@ -689,33 +779,29 @@ def traverse(
                         node = Node(
                             open_brace=f"{class_name}(",
                             close_brace=")",
-                            children=children,
+                            children=[],
                             last=root,
                         )
-                    for last, arg in loop_last(args):
-                        if _safe_isinstance(arg, tuple):
-                            key, child = arg
-                            child_node = _traverse(child, depth=depth + 1)
-                            child_node.last = last
-                            child_node.key_repr = key
-                            child_node.key_separator = "="
-                            append(child_node)
-                        else:
-                            child_node = _traverse(arg, depth=depth + 1)
-                            child_node.last = last
-                            append(child_node)
+
+                    def iter_args() -> Iterator[_ChildItem]:
+                        for last, arg in loop_last(args):
+                            if out_of_budget():
+                                yield Node(value_repr="...", last=True)
+                                break
+                            if _safe_isinstance(arg, tuple):
+                                key, child = arg
+                                yield (child, key, "=", last)
+                            else:
+                                yield (arg, "", "", last)
+
+                    children = iter_args()
             else:
                 node = Node(
                     value_repr=f"<{class_name}>" if angular else f"{class_name}()",
                     children=[],
                     last=root,
                 )
-            pop_visited(obj_id)
         elif _is_attr_object(obj) and not fake_attributes:
-            push_visited(obj_id)
-            children = []
-            append = children.append
-
             attr_fields = _get_attr_fields(obj)
             if attr_fields:
                 if reached_max_depth:
@@ -724,7 +810,7 @@ def traverse(
                     node = Node(
                         open_brace=f"{obj.__class__.__name__}(",
                         close_brace=")",
-                        children=children,
+                        children=[],
                         last=root,
                     )
 
@@ -746,54 +832,50 @@ def traverse(
                                         attr.repr if callable(attr.repr) else None,
                                     )
 
-                    for last, (name, value, repr_callable) in loop_last(iter_attrs()):
-                        if repr_callable:
-                            child_node = Node(value_repr=str(repr_callable(value)))
-                        else:
-                            child_node = _traverse(value, depth=depth + 1)
-                        child_node.last = last
-                        child_node.key_repr = name
-                        child_node.key_separator = "="
-                        append(child_node)
+                    def iter_attr_children() -> Iterator[_ChildItem]:
+                        for last, (name, value, repr_callable) in loop_last(
+                            iter_attrs()
+                        ):
+                            if out_of_budget():
+                                yield Node(value_repr="...", last=True)
+                                break
+                            if repr_callable:
+                                yield Node(
+                                    key_repr=name,
+                                    value_repr=str(repr_callable(value)),
+                                    last=last,
+                                    key_separator="=",
+                                )
+                            else:
+                                yield (value, name, "=", last)
+
+                    children = iter_attr_children()
             else:
                 node = Node(
                     value_repr=f"{obj.__class__.__name__}()", children=[], last=root
                 )
-            pop_visited(obj_id)
         elif (
             is_dataclass(obj)
             and not _safe_isinstance(obj, type)
             and not fake_attributes
             and _is_dataclass_repr(obj)
         ):
-            push_visited(obj_id)
-            children = []
-            append = children.append
             if reached_max_depth:
                 node = Node(value_repr=f"{obj.__class__.__name__}(...)")
             else:
                 node = Node(
                     open_brace=f"{obj.__class__.__name__}(",
                     close_brace=")",
-                    children=children,
+                    children=[],
                     last=root,
                     empty=f"{obj.__class__.__name__}()",
                 )
-
-                for last, field in loop_last(
-                    field
+                children = iter_keyed(
+                    (field.name, getattr(obj, field.name))
                     for field in fields(obj)
                     if field.repr and hasattr(obj, field.name)
-                ):
-                    child_node = _traverse(getattr(obj, field.name), depth=depth + 1)
-                    child_node.key_repr = field.name
-                    child_node.last = last
-                    child_node.key_separator = "="
-                    append(child_node)
-
-            pop_visited(obj_id)
+                )
         elif _is_namedtuple(obj) and _has_default_namedtuple_repr(obj):
-            push_visited(obj_id)
             class_name = obj.__class__.__name__
             if reached_max_depth:
                 # If we've reached the max depth, we still show the class name, but not its contents
@@ -801,29 +883,19 @@ def traverse(
                     value_repr=f"{class_name}(...)",
                 )
             else:
-                children = []
-                append = children.append
                 node = Node(
                     open_brace=f"{class_name}(",
                     close_brace=")",
-                    children=children,
+                    children=[],
                     empty=f"{class_name}()",
                 )
-                for last, (key, value) in loop_last(obj._asdict().items()):
-                    child_node = _traverse(value, depth=depth + 1)
-                    child_node.key_repr = key
-                    child_node.last = last
-                    child_node.key_separator = "="
-                    append(child_node)
-            pop_visited(obj_id)
+                children = iter_keyed(obj._asdict().items())
         elif _safe_isinstance(obj, _CONTAINERS):
             for container_type in _CONTAINERS:
                 if _safe_isinstance(obj, container_type):
                     obj_type = container_type
                     break
 
-            push_visited(obj_id)
-
             open_brace, close_brace, empty = _BRACES[obj_type](obj)
 
             if reached_max_depth:
@@ -831,48 +903,83 @@ def traverse(
             elif obj_type.__repr__ != type(obj).__repr__:
                 node = Node(value_repr=to_repr(obj), last=root)
             elif obj:
-                children = []
                 node = Node(
                     open_brace=open_brace,
                     close_brace=close_brace,
-                    children=children,
+                    children=[],
                     last=root,
                 )
-                append = children.append
-                num_items = len(obj)
-                last_item_index = num_items - 1
 
-                if _safe_isinstance(obj, _MAPPING_CONTAINERS):
-                    iter_items = iter(obj.items())
+                def iter_container() -> Iterator[_ChildItem]:
+                    num_items = len(obj)
+                    last_item_index = num_items - 1
+
+                    if _safe_isinstance(obj, _MAPPING_CONTAINERS):
+                        iter_items: Iterable[Tuple[Any, Any]] = iter(obj.items())
+                    else:
+                        iter_items = ((None, value) for value in obj)
                     if max_length is not None:
                         iter_items = islice(iter_items, max_length)
                     for index, (key, child) in enumerate(iter_items):
-                        child_node = _traverse(child, depth=depth + 1)
-                        child_node.key_repr = to_repr(key)
-                        child_node.last = index == last_item_index
-                        append(child_node)
-                else:
-                    iter_values = iter(obj)
-                    if max_length is not None:
-                        iter_values = islice(iter_values, max_length)
-                    for index, child in enumerate(iter_values):
-                        child_node = _traverse(child, depth=depth + 1)
-                        child_node.last = index == last_item_index
-                        append(child_node)
-                if max_length is not None and num_items > max_length:
-                    append(Node(value_repr=f"... +{num_items - max_length}", last=True))
+                        if out_of_budget():
+                            yield Node(
+                                value_repr=f"... +{num_items - index}", last=True
+                            )
+                            return
+                        key_repr = "" if key is None else to_repr(key)
+                        yield (child, key_repr, ": ", index == last_item_index)
+                    if max_length is not None and num_items > max_length:
+                        yield Node(
+                            value_repr=f"... +{num_items - max_length}", last=True
+                        )
+
+                children = iter_container()
             else:
                 node = Node(empty=empty, children=[], last=root)
-
-            pop_visited(obj_id)
         else:
             node = Node(value_repr=to_repr(obj), last=root)
         node.is_tuple = type(obj) == tuple
         node.is_namedtuple = _is_namedtuple(obj)
-        return node
-
-    node = _traverse(_object, root=True)
-    return node
+        return node, children
+
+    # Walk the object depth first, with an explicit stack rather than recursion
+    root_node, root_children = _traverse(_object, root=True)
+    node_count += 1
+    if root_children is None:
+        root_node._measure()
+        return root_node
+    push_visited(id(_object))
+    stack: List[Tuple[Node, Iterator[_ChildItem], int, int]] = [
+        (root_node, root_children, id(_object), 0)
+    ]
+    while stack:
+        node, children, obj_id, depth = stack[-1]
+        assert node.children is not None
+        append = node.children.append
+        for child in children:
+            if isinstance(child, Node):
+                child._measure()
+                append(child)
+                continue
+            child_object, key_repr, key_separator, last = child
+            child_node, grand_children = _traverse(child_object, depth=depth + 1)
+            node_count += 1
+            child_node.last = last
+            if key_repr:
+                child_node.key_repr = key_repr
+                child_node.key_separator = key_separator
+            append(child_node)
+            if grand_children is not None:
+                child_id = id(child_object)
+                push_visited(child_id)
+                stack.append((child_node, grand_children, child_id, depth + 1))
+                break
+            child_node._measure()
+        else:
+            stack.pop()
+            pop_visited(obj_id)
+            node._measure()
+    return root_node
 
 
 def pretty_repr(
@@ -883,6 +990,7 @@ def pretty_repr(
     max_length: Optional[int] = None,
     max_string: Optional[int] = None,
     max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
     expand_all: bool = False,
 ) -> str:
     """Prettify repr string by expanding on to new lines to fit within a given width.
@@ -897,6 +1005,8 @@ def pretty_repr(
             Defaults to None.
         max_depth (int, optional): Maximum depth of nested data structure, or None for no depth.
             Defaults to None.
+        max_nodes (int, optional): Maximum number of values to traverse before abbreviating, or None for no maximum.
+            Defaults to None.
         expand_all (bool, optional): Expand all containers regardless of available width. Defaults to False.
 
     Returns:
@@ -907,7 +1017,11 @@ def pretty_repr(
         node = _object
     else:
         node = traverse(
-            _object, max_length=max_length, max_string=max_string, max_depth=max_depth
+            _object,
+            max_length=max_length,
+            max_string=max_string,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
         )
     repr_str: str = node.render(
         max_width=max_width, indent_size=indent_size, expand_all=expand_all
@@ -923,6 +1037,7 @@ def pprint(
     max_length: Optional[int] = None,
     max_string: Optional[int] = None,
     max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
     expand_all: bool = False,
 ) -> None:
     """A convenience function for pretty printing.
@@ -934,6 +1049,8 @@ def pprint(
             Defaults to None.
         max_string (int, optional): Maximum length of strings before truncating, or None to disable. Defaults to None.
         max_depth (int, optional): Maximum depth for nested data structures, or None for unlimited depth. Defaults to None.
+        max_nodes (int, optional): Maximum number of values to print before abbreviating, or None for no maximum.
+            Defaults to None.
         indent_guides (bool, optional): Enable indentation guides. Defaults to True.
         expand_all (bool, optional): Expand all containers. Defaults to False.
     """
@@ -944,6 +1061,7 @@ def pprint(
             max_length=max_length,
             max_string=max_string,
             max_depth=max_depth,
+            max_nodes=max_nodes,
             indent_guides=indent_guides,
             expand_all=expand_all,
             overflow="ignore",
@@ -0,0 +1,324 @@
+import json
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from .segment import Segment
+
+if TYPE_CHECKING:
+    from .console import Console, ConsoleOptions, RenderableType
+    from .measure import Measurement
+    from .table import Table
+
+ProfilePath = Tuple[str, ...]
+"""The names of renderable types, from the root of a render to a nested renderable."""
+
+
+@dataclass
+class RenderStats:
+    """Render statistics for one type of renderable, at one position in the render tree."""
+
+    path: ProfilePath
+    """Names of renderable types from the root renderable to this one."""
+    calls: int = 0
+    """Number of times the renderable was rendered."""
+    time: float = 0.0
+    """Cumulative time spent rendering, in seconds (including nested renderables)."""
+    child_time: float = 0.0
+    """Time spent rendering nested renderables, in seconds."""
+    segments: int = 0
+    """Number of segments produced (including those from nested renderables)."""
+    measure_calls: int = 0
+    """Number of times the renderable was measured."""
+    measure_time: float = 0.0
+    """Time spent measuring, in seconds."""
+
+    @property
+    def name(self) -> str:
+        """Name of the renderable type."""
+        return self.path[-1]
+
+    @property
+    def self_time(self) -> float:
+        """Time spent rendering, excluding nested renderables."""
+        return max(0.0, self.time - self.child_time)
+
+
+@dataclass
+class _Frame:
+    """A renderable in the process of being rendered or measured."""
+
+    path: ProfilePath
+    parent: Optional["_Frame"] = None
+    yielded: bool = False
+    """True if the renderable was yielded by the parent, False if rendered within the parent's code."""
+    time: float = 0.0
+    child_time: float = 0.0
+    segments: int = 0
+
+
+@dataclass
+class _ThreadStack(threading.local):
+    frames: List[_Frame] = field(default_factory=list)
+
+
+class RenderProfiler:
+    """Records the time taken to render and measure each type of renderable, when enabled
+    for a console. See :meth:`~rich.console.Console.profile` for usage.
+
+    Args:
+        console (Console): The console to profile.
+        dump (str, optional): Format of results to print to the console when profiling ends,
+            either "table", "json", or None to print nothing. Defaults to None.
+        get_time (Callable[[], float], optional): Callable that gets the current time in seconds.
+            Defaults to :func:`time.perf_counter`.
+    """
+
+    def __init__(
+        self,
+        console: "Console",
+        dump: Optional[Literal["table", "json"]] = None,
+        get_time: Callable[[], float] = perf_counter,
+    ) -> None:
+        self.console = console
+        self.dump = dump
+        self.get_time = get_time
+        self.stats: Dict[ProfilePath, RenderStats] = {}
+        self._lock = threading.Lock()
+        self._stack = _ThreadStack()
+
+    def __enter__(self) -> "RenderProfiler":
+        self.console._render_profiler = self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.console._render_profiler = None
+        if self.dump == "table":
+            self.console.print(self.get_table())
+        elif self.dump == "json":
+            self.console.out(self.to_json(), highlight=False)
+
+    def clear(self) -> None:
+        """Clear recorded statistics."""
+        with self._lock:
+            self.stats.clear()
+
+    def _get_frame(self, renderable: Any, parent: Optional[_Frame]) -> _Frame:
+        """Create a frame for a renderable, nested under the given frame or the current frame."""
+        name = type(renderable).__name__
+        if parent is not None:
+            return _Frame((*parent.path, name), parent, yielded=True)
+        frames = self._stack.frames
+        if frames:
+            return _Frame((*frames[-1].path, name), frames[-1])
+        return _Frame((name,))
+
+    def render(
+        self,
+        renderable: "RenderableType",
+        options: "ConsoleOptions",
+        parent: Optional[_Frame] = None,
+    ) -> Iterable[Segment]:
+        """Render a renderable while recording statistics. Called by :meth:`Console.render`.
+
+        Args:
+            renderable (RenderableType): Renderable to render.
+            options (ConsoleOptions): Console options.
+            parent (_Frame, optional): Frame of the renderable which yielded this renderable,
+                or None to nest under the renderable currently being rendered. Defaults to None.
+
+        Returns:
+            Iterable[Segment]: Rendered segments.
+        """
+        if options.max_width < 1:
+            # As Console.render, render nothing rather than risk a recursion error
+            return
+        frames = self._stack.frames
+        frame = self._get_frame(renderable, parent)
+        get_time = self.get_time
+        _Segment = Segment
+        push_frame = frames.append
+        pop_frame = frames.pop
+
+        try:
+            start = get_time()
+            push_frame(frame)
+            try:
+                iter_render = self.console._render_iter(renderable, options)
+            finally:
+                pop_frame()
+                frame.time += get_time() - start
+
+            child_options = options.reset_height()
+            while True:
+                start = get_time()
+                push_frame(frame)
+                try:
+                    render_output = next(iter_render)
+                except StopIteration:
+                    break
+                finally:
+                    pop_frame()
+                    frame.time += get_time() - start
+                if isinstance(render_output, _Segment):
+                    frame.segments += 1
+                    yield render_output
+                else:
+                    for segment in self.render(render_output, child_options, frame):
+                        frame.segments += 1
+                        yield segment
+        finally:
+            self._record(frame)
+
+    def measure(
+        self,
+        renderable: "RenderableType",
+        get_console_width: Callable[["Console", "ConsoleOptions"], "Measurement"],
+        options: "ConsoleOptions",
+    ) -> "Measurement":
+        """Measure a renderable while recording statistics. Called by :meth:`Measurement.get`.
+
+        Args:
+            renderable (RenderableType): Renderable being measured.
+            get_console_width (Callable): The renderable's ``__rich_measure__`` method.
+            options (ConsoleOptions): Console options.
+
+        Returns:
+            Measurement: The measurement.
+        """
+        frames = self._stack.frames
+        frame = self._get_frame(renderable, None)
+        start = self.get_time()
+        frames.append(frame)
+        try:
+            return get_console_width(self.console, options)
+        finally:
+            frames.pop()
+            elapsed = self.get_time() - start
+            if frame.parent is not None:
+                frame.parent.child_time += elapsed
+            with self._lock:
+                stats = self.stats.get(frame.path)
+                if stats is None:
+                    stats = self.stats[frame.path] = RenderStats(frame.path)
+                stats.measure_calls += 1
+                stats.measure_time += elapsed
+
+    def _record(self, frame: _Frame) -> None:
+        """Record the statistics for a completed render."""
+        parent = frame.parent
+        if parent is not None:
+            if frame.yielded:
+                # Time spent rendering yielded renderables isn't in the parent's time
+                parent.time += frame.time
+            parent.child_time += frame.time
+        with self._lock:
+            stats = self.stats.get(frame.path)
+            if stats is None:
+                stats = self.stats[frame.path] = RenderStats(frame.path)
+            stats.calls += 1
+            stats.time += frame.time
+            stats.child_time += frame.child_time
+            stats.segments += frame.segments
+
+    def iter_stats(self) -> Iterable[RenderStats]:
+        """Iterate over statistics in tree order, with the most expensive renderables first
+        at each level of nesting.
+
+        Returns:
+            Iterable[RenderStats]: Statistics, where each is followed by those nested within it.
+        """
+        with self._lock:
+            all_stats = list(self.stats.values())
+        children: Dict[ProfilePath, List[RenderStats]] = {}
+        for stats in all_stats:
+            children.setdefault(stats.path[:-1], []).append(stats)
+        for siblings in children.values():
+            siblings.sort(
+                key=lambda stats: stats.time + stats.measure_time, reverse=True
+            )
+        stack = [iter(children.get((), []))]
+        while stack:
+            for stats in stack[-1]:
+                yield stats
+                stack.append(iter(children.get(stats.path, [])))
+                break
+            else:
+                stack.pop()
+
+    def get_table(self) -> "Table":
+        """Get a table of render statistics, with nested renderables indented.
+
+        Returns:
+            Table: A table renderable.
+        """
+        from .table import Table
+        from .text import Text
+
+        table = Table(title="Render profile", header_style="bold")
+        table.add_column("Renderable", no_wrap=True)
+        table.add_column("Calls", justify="right")
+        table.add_column("Time (ms)", justify="right")
+        table.add_column("Self (ms)", justify="right")
+        table.add_column("Segments", justify="right")
+        table.add_column("Measures", justify="right")
+        table.add_column("Measure (ms)", justify="right")
+        for stats in self.iter_stats():
+            table.add_row(
+                Text("  " * (len(stats.path) - 1) + stats.name, style="repr.tag_name"),
+                str(stats.calls),
+                f"{stats.time * 1000:.2f}",
+                f"{stats.self_time * 1000:.2f}",
+                str(stats.segments),
+                str(stats.measure_calls),
+                f"{stats.measure_time * 1000:.2f}",
+            )
+        return table
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Get render statistics as JSON, as a list of root nodes with nested children.
+
+        Args:
+            indent (int, optional): Number of spaces to indent, or None for compact output. Defaults to 2.
+
+        Returns:
+            str: A JSON string.
+        """
+        roots: List[Dict[str, Any]] = []
+        nodes: Dict[ProfilePath, Dict[str, Any]] = {}
+        for stats in self.iter_stats():
+            node: Dict[str, Any] = {
+                "name": stats.name,
+                "calls": stats.calls,
+                "time": stats.time,
+                "self_time": stats.self_time,
+                "segments": stats.segments,
+                "measure_calls": stats.measure_calls,
+                "measure_time": stats.measure_time,
+                "children": [],
+            }
+            nodes[stats.path] = node
+            parent = nodes.get(stats.path[:-1])
+            (roots if parent is None else parent["children"]).append(node)
+        return json.dumps(roots, indent=indent)
+
+    def __rich__(self) -> "Table":
+        return self.get_table()
@@ -8,10 +8,10 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import timedelta
 from io import RawIOBase, UnsupportedOperation
-from math import ceil
-from mmap import mmap
+from math import ceil, exp
+from mmap import ACCESS_READ, mmap
 from operator import length_hint
-from os import PathLike, stat
+from os import PathLike, fstat, stat
 from threading import Event, RLock, Thread
 from types import TracebackType
 from typing import (
@@ -57,6 +57,8 @@ ProgressType = TypeVar("ProgressType")
 
 GetTimeCallable = Callable[[], float]
 
+SpeedEstimator = Literal["window", "ewma"]
+
 
 _I = typing.TypeVar("_I", TextIO, BinaryIO)
 
@@ -180,7 +182,11 @@ def track(
 
 
 class _Reader(RawIOBase, BinaryIO):
-    """A reader that tracks progress while it's being read from."""
+    """A reader that tracks progress while it's being read from.
+
+    If ``update_size`` is non-zero, progress is updated after that many bytes have been read
+    (or ``update_period`` seconds have passed), rather than after every read.
+    """
 
     def __init__(
         self,
@@ -188,12 +194,18 @@ class _Reader(RawIOBase, BinaryIO):
         progress: "Progress",
         task: TaskID,
         close_handle: bool = True,
+        update_size: int = 0,
+        update_period: float = 0.1,
     ) -> None:
         self.handle = handle
         self.progress = progress
         self.task = task
         self.close_handle = close_handle
+        self.update_size = update_size
+        self.update_period = update_period
         self._closed = False
+        self._pending = 0
+        self._update_time = progress.get_time() + update_period
 
     def __enter__(self) -> "_Reader":
         self.handle.__enter__()
@@ -211,10 +223,33 @@ class _Reader(RawIOBase, BinaryIO):
         return self
 
     def __next__(self) -> bytes:
-        line = next(self.handle)
-        self.progress.advance(self.task, advance=len(line))
+        try:
+            line = next(self.handle)
+        except StopIteration:
+            self._advance(0)
+            raise
+        self._advance(len(line))
         return line
 
+    def _advance(self, advance: int) -> None:
+        """Record bytes read, and update progress unless waiting for more bytes to be read."""
+        update_size = self.update_size
+        if update_size:
+            pending = self._pending + advance
+            get_time = self.progress.get_time
+            # A read of 0 bytes is the end of the file, so update
+            if advance and pending < update_size and get_time() < self._update_time:
+                self._pending = pending
+                return
+            self._pending = 0
+            self._update_time = get_time() + self.update_period
+            advance = pending
+        self._update(advance)
+
+    def _update(self, advance: int) -> None:
+        """Update progress with the number of bytes read since the last update."""
+        self.progress.advance(self.task, advance=advance)
+
     @property
     def closed(self) -> bool:
         return self._closed
@@ -244,31 +279,35 @@ class _Reader(RawIOBase, BinaryIO):
 
     def read(self, size: int = -1) -> bytes:
         block = self.handle.read(size)
-        self.progress.advance(self.task, advance=len(block))
+        self._advance(len(block))
         return block
 
     def readinto(self, b: Union[bytearray, memoryview, mmap]):  # type: ignore[no-untyped-def, override]
         n = self.handle.readinto(b)  # type: ignore[attr-defined]
-        self.progress.advance(self.task, advance=n)
+        self._advance(n)
         return n
 
     def readline(self, size: int = -1) -> bytes:  # type: ignore[override]
         line = self.handle.readline(size)
-        self.progress.advance(self.task, advance=len(line))
+        self._advance(len(line))
         return line
 
     def readlines(self, hint: int = -1) -> List[bytes]:
         lines = self.handle.readlines(hint)
-        self.progress.advance(self.task, advance=sum(map(len, lines)))
+        self._advance(sum(map(len, lines)))
         return lines
 
     def close(self) -> None:
+        if self._pending:
+            self._update(self._pending)
+            self._pending = 0
         if self.close_handle:
             self.handle.close()
         self._closed = True
 
     def seek(self, offset: int, whence: int = 0) -> int:
         pos = self.handle.seek(offset, whence)
+        self._pending = 0
         self.progress.update(self.task, completed=pos)
         return pos
 
@@ -282,6 +321,102 @@ class _Reader(RawIOBase, BinaryIO):
         raise UnsupportedOperation("writelines")
 
 
+class _MmapReader(_Reader):
+    """A reader of a memory-mapped file, which tracks progress from the position in the mapping."""
+
+    def __init__(
+        self,
+        handle: BinaryIO,
+        progress: "Progress",
+        task: TaskID,
+        close_handle: bool = True,
+        update_size: int = 0,
+        update_period: float = 0.1,
+    ) -> None:
+        super().__init__(
+            handle,
+            progress,
+            task,
+            close_handle=close_handle,
+            update_size=update_size,
+            update_period=update_period,
+        )
+        self.mapping = mmap(handle.fileno(), 0, access=ACCESS_READ)
+
+    def __next__(self) -> bytes:
+        line = self.mapping.readline()
+        self._advance(len(line))
+        if not line:
+            raise StopIteration
+        return line
+
+    def _update(self, advance: int) -> None:
+        self.progress.update(self.task, completed=self.mapping.tell())
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        block = self.mapping.read(size)
+        self._advance(len(block))
+        return block
+
+    def readinto(self, b: Union[bytearray, memoryview, mmap]):  # type: ignore[no-untyped-def, override]
+        mapping = self.mapping
+        position = mapping.tell()
+        with memoryview(b) as view, view.cast("B") as target:
+            size = min(target.nbytes, len(mapping) - position)
+            # Copy directly from the mapping, without an intermediate bytes object
+            with memoryview(mapping) as source:
+                target[:size] = source[position : position + size]
+        mapping.seek(position + size)
+        self._advance(size)
+        return size
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        mapping = self.mapping
+        position = mapping.tell()
+        line = mapping.readline()
+        if size is not None and 0 <= size < len(line):
+            line = line[:size]
+            mapping.seek(position + size)
+        self._advance(len(line))
+        return line
+
+    def readlines(self, hint: Optional[int] = -1) -> List[bytes]:
+        lines: List[bytes] = []
+        read_size = 0
+        readline = self.mapping.readline
+        while True:
+            line = readline()
+            if not line:
+                break
+            lines.append(line)
+            read_size += len(line)
+            if hint is not None and 0 < hint <= read_size:
+                break
+        self._advance(read_size)
+        return lines
+
+    def close(self) -> None:
+        if not self.mapping.closed:
+            if self._pending:
+                self._update(self._pending)
+                self._pending = 0
+            self.mapping.close()
+        super().close()
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        self.mapping.seek(offset, whence)  # type: ignore[arg-type]
+        pos = self.mapping.tell()
+        self._pending = 0
+        self.progress.update(self.task, completed=pos)
+        return pos
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.mapping.tell()
+
+
 class _ReadContext(ContextManager[_I], Generic[_I]):
     """A utility class to handle a context for both a reader and a progress."""
 
@@ -318,6 +453,8 @@ def wrap_file(
     finished_style: StyleType = "bar.finished",
     pulse_style: StyleType = "bar.pulse",
     disable: bool = False,
+    update_size: int = 0,
+    update_period: float = 0.1,
 ) -> ContextManager[BinaryIO]:
     """Read bytes from a file while tracking progress.
 
@@ -334,6 +471,10 @@ def wrap_file(
         finished_style (StyleType, optional): Style for a finished bar. Defaults to "bar.finished".
         pulse_style (StyleType, optional): Style for pulsing bars. Defaults to "bar.pulse".
         disable (bool, optional): Disable display of progress.
+        update_size (int, optional): Update progress after this many bytes have been read (or ``update_period``
+            seconds have passed), rather than after every read. Defaults to 0.
+        update_period (float, optional): With ``update_size``, the maximum time (in seconds) between updates.
+            Defaults to 0.1.
     Returns:
         ContextManager[BinaryIO]: A context manager yielding a progress reader.
 
@@ -364,7 +505,13 @@ def wrap_file(
         disable=disable,
     )
 
-    reader = progress.wrap_file(file, total=total, description=description)
+    reader = progress.wrap_file(
+        file,
+        total=total,
+        description=description,
+        update_size=update_size,
+        update_period=update_period,
+    )
     return _ReadContext(progress, reader)
 
 
@@ -389,6 +536,9 @@ def open(
     finished_style: StyleType = "bar.finished",
     pulse_style: StyleType = "bar.pulse",
     disable: bool = False,
+    update_size: int = 0,
+    update_period: float = 0.1,
+    memory_map: bool = False,
 ) -> ContextManager[TextIO]:
     pass
 
@@ -414,6 +564,9 @@ def open(
     finished_style: StyleType = "bar.finished",
     pulse_style: StyleType = "bar.pulse",
     disable: bool = False,
+    update_size: int = 0,
+    update_period: float = 0.1,
+    memory_map: bool = False,
 ) -> ContextManager[BinaryIO]:
     pass
 
@@ -438,6 +591,9 @@ def open(
     finished_style: StyleType = "bar.finished",
     pulse_style: StyleType = "bar.pulse",
     disable: bool = False,
+    update_size: int = 0,
+    update_period: float = 0.1,
+    memory_map: bool = False,
 ) -> Union[ContextManager[BinaryIO], ContextManager[TextIO]]:
     """Read bytes from a file while tracking progress.
 
@@ -460,6 +616,11 @@ def open(
         pulse_style (StyleType, optional): Style for pulsing bars. Defaults to "bar.pulse".
         disable (bool, optional): Disable display of progress.
         encoding (str, optional): The encoding to use when reading in text mode.
+        update_size (int, optional): Update progress after this many bytes have been read (or ``update_period``
+            seconds have passed), rather than after every read. Defaults to 0.
+        update_period (float, optional): With ``update_size``, the maximum time (in seconds) between updates.
+            Defaults to 0.1.
+        memory_map (bool, optional): Read from a memory-mapped copy of the file (``buffering`` is ignored). Defaults to False.
 
     Returns:
         ContextManager[BinaryIO]: A context manager yielding a progress reader.
@@ -500,6 +661,9 @@ def open(
         newline=newline,
         total=total,
         description=description,
+        update_size=update_size,
+        update_period=update_period,
+        memory_map=memory_map,
     )
     return _ReadContext(progress, reader)  # type: ignore[return-value, type-var]
 
@@ -980,6 +1144,16 @@ class Task:
     _lock: RLock = field(repr=False, default_factory=RLock)
     """Thread lock."""
 
+    _speed_estimator: SpeedEstimator = field(default="window", repr=False)
+    """Method used to estimate speed: "window" for the average over recent samples, or "ewma" for an exponentially weighted moving average."""
+
+    _progress_total: float = field(default=0.0, init=False, repr=False)
+    """Sum of completed steps in progress samples."""
+
+    _ewma_speed: Optional[float] = field(default=None, init=False, repr=False)
+    _ewma_time: Optional[float] = field(default=None, init=False, repr=False)
+    _ewma_completed: float = field(default=0.0, init=False, repr=False)
+
     def get_time(self) -> float:
         """float: Get the current time, in seconds."""
         return self._get_time()
@@ -1025,15 +1199,16 @@ class Task:
         if self.start_time is None:
             return None
         with self._lock:
+            if self._speed_estimator == "ewma":
+                return self._ewma_speed
             progress = self._progress
             if not progress:
                 return None
             total_time = progress[-1].timestamp - progress[0].timestamp
             if total_time == 0:
                 return None
-            iter_progress = iter(progress)
-            next(iter_progress)
-            total_completed = sum(sample.completed for sample in iter_progress)
+            # Steps completed at the first sample were before the period being measured
+            total_completed = self._progress_total - progress[0].completed
             speed = total_completed / total_time
             return speed
 
@@ -1051,9 +1226,56 @@ class Task:
         estimate = ceil(remaining / speed)
         return estimate
 
+    def _prune_samples(self, old_sample_time: float) -> None:
+        """Remove progress samples older than the given time."""
+        progress = self._progress
+        if progress and progress[0].timestamp < old_sample_time:
+            popleft = progress.popleft
+            progress_total = self._progress_total
+            while progress and progress[0].timestamp < old_sample_time:
+                progress_total -= popleft().completed
+            self._progress_total = progress_total if progress else 0.0
+
+    def _add_sample(
+        self, timestamp: float, completed: float, speed_estimate_period: float
+    ) -> None:
+        """Record steps completed, updating the speed estimate.
+
+        Args:
+            timestamp (float): Time the steps were completed.
+            completed (float): Number of steps completed.
+            speed_estimate_period (float): Period (in seconds) used to calculate the speed estimate.
+        """
+        progress = self._progress
+        if len(progress) == progress.maxlen:
+            self._progress_total -= progress.popleft().completed
+        progress.append(ProgressSample(timestamp, completed))
+        self._progress_total += completed
+
+        if self._speed_estimator == "ewma":
+            if self._ewma_time is None:
+                self._ewma_time = timestamp
+                return
+            self._ewma_completed += completed
+            elapsed = timestamp - self._ewma_time
+            if elapsed > 0:
+                speed = self._ewma_completed / elapsed
+                if self._ewma_speed is None:
+                    self._ewma_speed = speed
+                else:
+                    # Weight by elapsed time, so the estimate doesn't depend on how often steps are recorded
+                    weight = 1.0 - exp(-elapsed / speed_estimate_period)
+                    self._ewma_speed += (speed - self._ewma_speed) * weight
+                self._ewma_time = timestamp
+                self._ewma_completed = 0.0
+
     def _reset(self) -> None:
         """Reset progress."""
         self._progress.clear()
+        self._progress_total = 0.0
+        self._ewma_speed = None
+        self._ewma_time = None
+        self._ewma_completed = 0.0
         self.finished_time = None
         self.finished_speed = None
 
@@ -1066,12 +1288,20 @@ class Progress(JupyterMixin):
         auto_refresh (bool, optional): Enable auto refresh. If disabled, you will need to call `refresh()`.
         refresh_per_second (Optional[float], optional): Number of times per second to refresh the progress information or None to use default (10). Defaults to None.
         speed_estimate_period: (float, optional): Period (in seconds) used to calculate the speed estimate. Defaults to 30.
+        speed_estimator: (str, optional): How to estimate the speed of tasks: "window" for the average speed over
+            ``speed_estimate_period``, or "ewma" for an exponentially weighted moving average with a time constant
+            of ``speed_estimate_period``, which responds to changes in speed more smoothly. Defaults to "window".
         transient: (bool, optional): Clear the progress on exit. Defaults to False.
         redirect_stdout: (bool, optional): Enable redirection of stdout, so ``print`` may be used. Defaults to True.
         redirect_stderr: (bool, optional): Enable redirection of stderr. Defaults to True.
+        redirect_max_latency: (float, optional): Coalesce redirected output, so that lines are printed in a single batch
+            on each refresh, or when they have been waiting for this many seconds. Defaults to None, which prints lines as they are written.
         get_time: (Callable, optional): A callable that gets the current time, or None to use Console.get_time. Defaults to None.
         disable (bool, optional): Disable progress display. Defaults to False
         expand (bool, optional): Expand tasks table to fit width. Defaults to False.
+        adaptive_refresh (bool, optional): Only auto refresh when tasks have changed (or at least once a second, to
+            animate columns), and reduce the refresh rate when rendering is slow. Defaults to False.
+        shared_refresh (bool, optional): Auto refresh from a thread shared with other live displays. Defaults to False.
     """
 
     def __init__(
@@ -1081,17 +1311,22 @@ class Progress(JupyterMixin):
         auto_refresh: bool = True,
         refresh_per_second: float = 10,
         speed_estimate_period: float = 30.0,
+        speed_estimator: SpeedEstimator = "window",
         transient: bool = False,
         redirect_stdout: bool = True,
         redirect_stderr: bool = True,
+        redirect_max_latency: Optional[float] = None,
         get_time: Optional[GetTimeCallable] = None,
         disable: bool = False,
         expand: bool = False,
+        adaptive_refresh: bool = False,
+        shared_refresh: bool = False,
     ) -> None:
         assert refresh_per_second > 0, "refresh_per_second must be > 0"
         self._lock = RLock()
         self.columns = columns or self.get_default_columns()
         self.speed_estimate_period = speed_estimate_period
+        self.speed_estimator = speed_estimator
 
         self.disable = disable
         self.expand = expand
@@ -1104,7 +1339,10 @@ class Progress(JupyterMixin):
             transient=transient,
             redirect_stdout=redirect_stdout,
             redirect_stderr=redirect_stderr,
+            redirect_max_latency=redirect_max_latency,
             get_renderable=self.get_renderable,
+            adaptive_refresh=adaptive_refresh,
+            shared_refresh=shared_refresh,
         )
         self.get_time = get_time or self.console.get_time
         self.print = self.console.print
@@ -1240,6 +1478,8 @@ class Progress(JupyterMixin):
         *,
         task_id: Optional[TaskID] = None,
         description: str = "Reading...",
+        update_size: int = 0,
+        update_period: float = 0.1,
     ) -> BinaryIO:
         """Track progress file reading from a binary file.
 
@@ -1248,6 +1488,10 @@ class Progress(JupyterMixin):
             total (int, optional): Total number of bytes to read. This must be provided unless a task with a total is also given.
             task_id (TaskID): Task to track. Default is new task.
             description (str, optional): Description of task, if new task is created.
+            update_size (int, optional): Update progress after this many bytes have been read (or ``update_period``
+                seconds have passed), rather than after every read. Defaults to 0.
+            update_period (float, optional): With ``update_size``, the maximum time (in seconds) between updates.
+                Defaults to 0.1.
 
         Returns:
             BinaryIO: A readable file-like object in binary mode.
@@ -1273,7 +1517,14 @@ class Progress(JupyterMixin):
         else:
             self.update(task_id, total=total_bytes)
 
-        return _Reader(file, self, task_id, close_handle=False)
+        return _Reader(
+            file,
+            self,
+            task_id,
+            close_handle=False,
+            update_size=update_size,
+            update_period=update_period,
+        )
 
     @typing.overload
     def open(
@@ -1288,6 +1539,9 @@ class Progress(JupyterMixin):
         total: Optional[int] = None,
         task_id: Optional[TaskID] = None,
         description: str = "Reading...",
+        update_size: int = 0,
+        update_period: float = 0.1,
+        memory_map: bool = False,
     ) -> BinaryIO:
         pass
 
@@ -1304,6 +1558,9 @@ class Progress(JupyterMixin):
         total: Optional[int] = None,
         task_id: Optional[TaskID] = None,
         description: str = "Reading...",
+        update_size: int = 0,
+        update_period: float = 0.1,
+        memory_map: bool = False,
     ) -> TextIO:
         pass
 
@@ -1319,6 +1576,9 @@ class Progress(JupyterMixin):
         total: Optional[int] = None,
         task_id: Optional[TaskID] = None,
         description: str = "Reading...",
+        update_size: int = 0,
+        update_period: float = 0.1,
+        memory_map: bool = False,
     ) -> Union[BinaryIO, TextIO]:
         """Track progress while reading from a binary file.
 
@@ -1332,6 +1592,11 @@ class Progress(JupyterMixin):
             total (int, optional): Total number of bytes to read. If none given, os.stat(path).st_size is used.
             task_id (TaskID): Task to track. Default is new task.
             description (str, optional): Description of task, if new task is created.
+            update_size (int, optional): Update progress after this many bytes have been read (or ``update_period``
+                seconds have passed), rather than after every read. Defaults to 0.
+            update_period (float, optional): With ``update_size``, the maximum time (in seconds) between updates.
+                Defaults to 0.1.
+            memory_map (bool, optional): Read from a memory-mapped copy of the file (``buffering`` is ignored). Defaults to False.
 
         Returns:
             BinaryIO: A readable file-like object in binary mode.
@@ -1370,7 +1635,30 @@ class Progress(JupyterMixin):
 
         # open the file in binary mode,
         handle = io.open(file, "rb", buffering=buffering)
-        reader = _Reader(handle, self, task_id, close_handle=True)
+        reader: _Reader
+        # an empty file can't be mapped, but can be read as normal
+        if memory_map and fstat(handle.fileno()).st_size:
+            try:
+                reader = _MmapReader(
+                    handle,
+                    self,
+                    task_id,
+                    close_handle=True,
+                    update_size=update_size,
+                    update_period=update_period,
+                )
+            except BaseException:
+                handle.close()
+                raise
+        else:
+            reader = _Reader(
+                handle,
+                self,
+                task_id,
+                close_handle=True,
+                update_size=update_size,
+                update_period=update_period,
+            )
 
         # wrap the reader in a `TextIOWrapper` if text mode
         if mode in ("r", "rt"):
@@ -1397,6 +1685,7 @@ class Progress(JupyterMixin):
             task = self._tasks[task_id]
             if task.start_time is None:
                 task.start_time = self.get_time()
+        self.live.request_refresh()
 
     def stop_task(self, task_id: TaskID) -> None:
         """Stop a task.
@@ -1412,6 +1701,7 @@ class Progress(JupyterMixin):
             if task.start_time is None:
                 task.start_time = current_time
             task.stop_time = current_time
+        self.live.request_refresh()
 
     def update(
         self,
@@ -1456,14 +1746,10 @@ class Progress(JupyterMixin):
             update_completed = task.completed - completed_start
 
             current_time = self.get_time()
-            old_sample_time = current_time - self.speed_estimate_period
-            _progress = task._progress
-
-            popleft = _progress.popleft
-            while _progress and _progress[0].timestamp < old_sample_time:
-                popleft()
+            speed_estimate_period = self.speed_estimate_period
+            task._prune_samples(current_time - speed_estimate_period)
             if update_completed > 0:
-                _progress.append(ProgressSample(current_time, update_completed))
+                task._add_sample(current_time, update_completed, speed_estimate_period)
             if (
                 task.total is not None
                 and task.completed >= task.total
@@ -1473,6 +1759,8 @@ class Progress(JupyterMixin):
 
         if refresh:
             self.refresh()
+        else:
+            self.live.request_refresh()
 
     def reset(
         self,
@@ -1526,15 +1814,9 @@ class Progress(JupyterMixin):
             completed_start = task.completed
             task.completed += advance
             update_completed = task.completed - completed_start
-            old_sample_time = current_time - self.speed_estimate_period
-            _progress = task._progress
-
-            popleft = _progress.popleft
-            while _progress and _progress[0].timestamp < old_sample_time:
-                popleft()
-            while len(_progress) > 1000:
-                popleft()
-            _progress.append(ProgressSample(current_time, update_completed))
+            speed_estimate_period = self.speed_estimate_period
+            task._prune_samples(current_time - speed_estimate_period)
+            task._add_sample(current_time, update_completed, speed_estimate_period)
             if (
                 task.total is not None
                 and task.completed >= task.total
@@ -1542,6 +1824,7 @@ class Progress(JupyterMixin):
             ):
                 task.finished_time = task.elapsed
                 task.finished_speed = task.speed
+        self.live.request_refresh()
 
     def refresh(self) -> None:
         """Refresh (render) the progress information."""
@@ -1630,6 +1913,7 @@ class Progress(JupyterMixin):
                 fields=fields,
                 _get_time=self.get_time,
                 _lock=self._lock,
+                _speed_estimator=self.speed_estimator,
             )
             self._tasks[self._task_index] = task
             if start:
@@ -1648,6 +1932,7 @@ class Progress(JupyterMixin):
         """
         with self._lock:
             del self._tasks[task_id]
+        self.live.request_refresh()
 
 
 if __name__ == "__main__":  # pragma: no coverage
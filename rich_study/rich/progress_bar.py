@@ -3,7 +3,7 @@ from functools import lru_cache
 from time import monotonic
 from typing import Iterable, List, Optional
 
-from .color import Color, blend_rgb
+from .color import Color, blend_rgb_many
 from .color_triplet import ColorTriplet
 from .console import Console, ConsoleOptions, RenderResult
 from .jupyter import JupyterMixin
@@ -13,6 +13,11 @@ from .style import Style, StyleType
 
 # Number of characters before 'pulse' animation repeats
 PULSE_SIZE = 20
+# Amount of the background color in each character of the pulse animation
+PULSE_FADES = [
+    0.5 + math.cos(index / PULSE_SIZE * math.pi * 2) / 2.0
+    for index in range(PULSE_SIZE)
+]
 
 
 class ProgressBar(JupyterMixin):
@@ -66,9 +71,9 @@ class ProgressBar(JupyterMixin):
         completed = min(100, max(0.0, completed))
         return completed
 
+    @staticmethod
     @lru_cache(maxsize=16)
     def _get_pulse_segments(
-        self,
         fore_style: Style,
         back_style: Style,
         color_system: str,
@@ -100,19 +105,37 @@ class ProgressBar(JupyterMixin):
             if back_style.color
             else ColorTriplet(0, 0, 0)
         )
-        cos = math.cos
-        pi = math.pi
         _Segment = Segment
-        _Style = Style
+        from_color = Style.from_color
         from_triplet = Color.from_triplet
 
-        for index in range(PULSE_SIZE):
-            position = index / PULSE_SIZE
-            fade = 0.5 + cos(position * pi * 2) / 2.0
-            color = blend_rgb(fore_color, back_color, cross_fade=fade)
-            append(_Segment(bar, _Style(color=from_triplet(color))))
+        for color in blend_rgb_many(fore_color, back_color, PULSE_FADES):
+            append(_Segment(bar, from_color(from_triplet(color))))
         return segments
 
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _get_pulse_frames(
+        cls,
+        fore_style: Style,
+        back_style: Style,
+        color_system: str,
+        no_color: bool,
+        ascii: bool,
+        width: int,
+    ) -> List[List[Segment]]:
+        """Get the frames of a pulse animation.
+
+        Returns:
+            List[List[Segment]]: A list of segments for each offset in to the animation.
+        """
+        pulse_segments = cls._get_pulse_segments(
+            fore_style, back_style, color_system, no_color, ascii
+        )
+        segment_count = len(pulse_segments)
+        segments = pulse_segments * (int(width / segment_count) + 2)
+        return [segments[offset : offset + width] for offset in range(segment_count)]
+
     def update(self, completed: float, total: Optional[float] = None) -> None:
         """Update progress with new values.
 
@@ -141,17 +164,14 @@ class ProgressBar(JupyterMixin):
         fore_style = console.get_style(self.pulse_style, default="white")
         back_style = console.get_style(self.style, default="black")
 
-        pulse_segments = self._get_pulse_segments(
-            fore_style, back_style, console.color_system, console.no_color, ascii=ascii
+        pulse_frames = self._get_pulse_frames(
+            fore_style, back_style, console.color_system, console.no_color, ascii, width
         )
-        segment_count = len(pulse_segments)
         current_time = (
             monotonic() if self.animation_time is None else self.animation_time
         )
-        segments = pulse_segments * (int(width / segment_count) + 2)
-        offset = int(-current_time * 15) % segment_count
-        segments = segments[offset : offset + width]
-        yield from segments
+        offset = int(-current_time * 15) % len(pulse_frames)
+        yield from pulse_frames[offset]
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
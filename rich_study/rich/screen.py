@@ -43,10 +43,9 @@ class Screen:
         width, height = options.size
         style = console.get_style(self.style) if self.style else None
         render_options = options.update(width=width, height=height)
-        lines = console.render_lines(
+        lines = console.render_line_block(
             self.renderable or "", render_options, style=style, pad=True
-        )
-        lines = Segment.set_shape(lines, width, height, style=style)
+        ).set_shape(width, height, style=style)
         new_line = Segment("\n\r") if self.application_mode else Segment.line()
         for last, line in loop_last(lines):
             yield from line
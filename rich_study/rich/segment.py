@@ -1,5 +1,5 @@
+from bisect import bisect_right
 from enum import IntEnum
-from functools import lru_cache
 from itertools import filterfalse
 from logging import getLogger
 from operator import attrgetter
@@ -7,6 +7,7 @@ from typing import (
     TYPE_CHECKING,
     Dict,
     Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -17,10 +18,9 @@ from typing import (
 )
 
 from .cells import (
-    _is_single_cell_widths,
+    _get_cell_offsets,
     cached_cell_len,
     cell_len,
-    get_character_cell_size,
     set_cell_size,
 )
 from .repr import Result, rich_repr
@@ -106,55 +106,6 @@ class Segment(NamedTuple):
         """Check if the segment contains control codes."""
         return self.control is not None
 
-    @classmethod
-    @lru_cache(1024 * 16)
-    def _split_cells(cls, segment: "Segment", cut: int) -> Tuple["Segment", "Segment"]:
-        """Split a segment in to two at a given cell position.
-
-        Note that splitting a double-width character, may result in that character turning
-        into two spaces.
-
-        Args:
-            segment (Segment): A segment to split.
-            cut (int): A cell position to cut on.
-
-        Returns:
-            A tuple of two segments.
-        """
-        text, style, control = segment
-        _Segment = Segment
-        cell_length = segment.cell_length
-        if cut >= cell_length:
-            return segment, _Segment("", style, control)
-
-        cell_size = get_character_cell_size
-
-        pos = int((cut / cell_length) * len(text))
-
-        while True:
-            before = text[:pos]
-            cell_pos = cell_len(before)
-            out_by = cell_pos - cut
-            if not out_by:
-                return (
-                    _Segment(before, style, control),
-                    _Segment(text[pos:], style, control),
-                )
-            if out_by == -1 and cell_size(text[pos]) == 2:
-                return (
-                    _Segment(text[:pos] + " ", style, control),
-                    _Segment(" " + text[pos + 1 :], style, control),
-                )
-            if out_by == +1 and cell_size(text[pos - 1]) == 2:
-                return (
-                    _Segment(text[: pos - 1] + " ", style, control),
-                    _Segment(" " + text[pos:], style, control),
-                )
-            if cell_pos < cut:
-                pos += 1
-            else:
-                pos -= 1
-
     def split_cells(self, cut: int) -> Tuple["Segment", "Segment"]:
         """Split segment in to two segments at the specified column.
 
@@ -170,7 +121,8 @@ class Segment(NamedTuple):
         text, style, control = self
         assert cut >= 0
 
-        if _is_single_cell_widths(text):
+        # Strings record if they are ASCII when created, so only printable ASCII is scanned
+        if text.isascii() and text.isprintable():
             # Fast path with all 1 cell characters
             if cut >= len(text):
                 return self, Segment("", style, control)
@@ -179,7 +131,27 @@ class Segment(NamedTuple):
                 Segment(text[cut:], style, control),
             )
 
-        return self._split_cells(self, cut)
+        if control:
+            return self, Segment("", style, control)
+        offsets = _get_cell_offsets(text)
+        if cut >= offsets[-1]:
+            return self, Segment("", style, control)
+        if not cut:
+            # Zero width characters at the start belong to the right hand segment
+            return Segment("", style, control), self
+        # Index of the last character starting at or before the cut, so that zero width
+        # characters stay with the character they follow
+        pos = bisect_right(offsets, cut) - 1
+        if offsets[pos] == cut:
+            return (
+                Segment(text[:pos], style, control),
+                Segment(text[pos:], style, control),
+            )
+        # The cut is within a double width character, which is replaced with two spaces
+        return (
+            Segment(text[:pos] + " ", style, control),
+            Segment(" " + text[pos + 1 :], style, control),
+        )
 
     @classmethod
     def line(cls) -> "Segment":
@@ -296,10 +268,29 @@ class Segment(NamedTuple):
         Returns:
             Iterable[List[Segment]]: An iterable of lines of segments.
         """
+        for line, _line_length in cls._split_and_crop_lines(
+            segments, length, style, pad, include_new_lines
+        ):
+            yield line
+
+    @classmethod
+    def _split_and_crop_lines(
+        cls,
+        segments: Iterable["Segment"],
+        length: int,
+        style: Optional[Style],
+        pad: bool,
+        include_new_lines: bool,
+    ) -> Iterable[Tuple[List["Segment"], int]]:
+        """Split segments in to lines, and crop lines greater than a given length.
+
+        Returns:
+            Iterable[Tuple[List[Segment], int]]: An iterable of lines, and their cell lengths.
+        """
         line: List[Segment] = []
         append = line.append
 
-        adjust_line_length = cls.adjust_line_length
+        adjust_line_length = cls._adjust_line_length
         new_line_segment = cls("\n")
 
         for segment in segments:
@@ -310,17 +301,25 @@ class Segment(NamedTuple):
                     if _text:
                         append(cls(_text, segment_style))
                     if new_line:
+                        line_length = sum(segment.cell_length for segment in line)
                         cropped_line = adjust_line_length(
-                            line, length, style=style, pad=pad
+                            line, line_length, length, style, pad
                         )
                         if include_new_lines:
                             cropped_line.append(new_line_segment)
-                        yield cropped_line
+                        yield (
+                            cropped_line,
+                            length if pad or line_length > length else line_length,
+                        )
                         line.clear()
             else:
                 append(segment)
         if line:
-            yield adjust_line_length(line, length, style=style, pad=pad)
+            line_length = sum(segment.cell_length for segment in line)
+            yield (
+                adjust_line_length(line, line_length, length, style, pad),
+                length if pad or line_length > length else line_length,
+            )
 
     @classmethod
     def adjust_line_length(
@@ -342,6 +341,22 @@ class Segment(NamedTuple):
             List[Segment]: A line of segments with the desired length.
         """
         line_length = sum(segment.cell_length for segment in line)
+        return cls._adjust_line_length(line, line_length, length, style, pad)
+
+    @classmethod
+    def _adjust_line_length(
+        cls,
+        line: List["Segment"],
+        line_length: int,
+        length: int,
+        style: Optional[Style],
+        pad: bool,
+    ) -> List["Segment"]:
+        """Adjust a line with a known cell length to a given width.
+
+        Returns:
+            List[Segment]: A new line of segments.
+        """
         new_line: List[Segment]
 
         if line_length < length:
@@ -537,7 +552,11 @@ class Segment(NamedTuple):
 
         _Segment = Segment
         for segment in iter_segments:
-            if last_segment.style == segment.style and not segment.control:
+            style = segment.style
+            # Combined styles are shared, so are often the same object
+            if (
+                last_segment.style is style or last_segment.style == style
+            ) and not segment.control:
                 last_segment = _Segment(
                     last_segment.text + segment.text, last_segment.style
                 )
@@ -718,6 +737,217 @@ class SegmentLines:
                 yield from line
 
 
+class LineBlock:
+    """A block of lines of segments, with the cell length of each line, so that the block
+    may be shaped and aligned without measuring the segments again.
+
+    Methods which shape or align the block return a new block, and never modify the lines in
+    place, so lines may be shared with other blocks.
+
+    Args:
+        lines (List[List[Segment]]): Lines of segments (without new lines).
+        widths (List[int], optional): The cell length of each line, or None to measure the lines.
+            Defaults to None.
+    """
+
+    __slots__ = ["lines", "widths"]
+
+    def __init__(
+        self, lines: List[List[Segment]], widths: Optional[List[int]] = None
+    ) -> None:
+        self.lines = lines
+        self.widths = (
+            [Segment.get_line_length(line) for line in lines]
+            if widths is None
+            else widths
+        )
+
+    def __repr__(self) -> str:
+        return f"LineBlock({self.lines!r}, {self.widths!r})"
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __iter__(self) -> Iterator[List[Segment]]:
+        return iter(self.lines)
+
+    @classmethod
+    def from_segments(
+        cls,
+        segments: Iterable[Segment],
+        length: Optional[int] = None,
+        style: Optional[Style] = None,
+        pad: bool = True,
+    ) -> "LineBlock":
+        """Split segments in to a block of lines.
+
+        Args:
+            segments (Iterable[Segment]): An iterable of segments.
+            length (int, optional): Length to crop lines to, or None for no cropping. Defaults to None.
+            style (Style, optional): Style to use for any padding. Defaults to None.
+            pad (bool, optional): Pad lines that are less than `length`. Defaults to True.
+
+        Returns:
+            LineBlock: A block of lines.
+        """
+        if length is None:
+            return cls(list(Segment.split_lines(segments)))
+        lines: List[List[Segment]] = []
+        widths: List[int] = []
+        append_line = lines.append
+        append_width = widths.append
+        for line, width in Segment._split_and_crop_lines(
+            segments, length, style, pad, False
+        ):
+            append_line(line)
+            append_width(width)
+        return cls(lines, widths)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The width and height of the block, in cells."""
+        return (max(self.widths, default=0), len(self.lines))
+
+    def append(self, line: List[Segment], width: Optional[int] = None) -> None:
+        """Add a line to the end of the block.
+
+        Args:
+            line (List[Segment]): A line of segments.
+            width (int, optional): The cell length of the line, or None to measure it. Defaults to None.
+        """
+        self.lines.append(line)
+        self.widths.append(Segment.get_line_length(line) if width is None else width)
+
+    def crop_height(self, height: int) -> "LineBlock":
+        """Get a block with lines after a given height removed.
+
+        Args:
+            height (int): Maximum number of lines.
+
+        Returns:
+            LineBlock: A new block of lines.
+        """
+        return LineBlock(self.lines[:height], self.widths[:height])
+
+    def set_shape(
+        self,
+        width: int,
+        height: Optional[int] = None,
+        style: Optional[Style] = None,
+        new_lines: bool = False,
+    ) -> "LineBlock":
+        """Set the shape of the block, by cropping or padding lines.
+
+        Args:
+            width (int): Desired width.
+            height (int, optional): Desired height or None for no change.
+            style (Style, optional): Style of any padding added.
+            new_lines (bool, optional): Padded lines should include "\\n". Defaults to False.
+
+        Returns:
+            LineBlock: A new block of lines.
+        """
+        _height = len(self.lines) if height is None else height
+        adjust_line_length = Segment._adjust_line_length
+        shaped_lines = [
+            line
+            if line_width == width
+            else adjust_line_length(line, line_width, width, style, True)
+            for line, line_width in zip(self.lines[:_height], self.widths)
+        ]
+        if len(shaped_lines) < _height:
+            blank = Segment(" " * width + "\n" if new_lines else " " * width, style)
+            shaped_lines.extend([[blank]] * (_height - len(shaped_lines)))
+        return LineBlock(shaped_lines, [width] * len(shaped_lines))
+
+    def _pad_height(
+        self,
+        top: int,
+        bottom: int,
+        width: int,
+        style: Optional[Style],
+        new_lines: bool,
+    ) -> "LineBlock":
+        """Add blank lines above and below the block."""
+        blank = Segment(" " * width + "\n" if new_lines else " " * width, style)
+        return LineBlock(
+            [[blank]] * top + self.lines + [[blank]] * bottom,
+            [width] * top + self.widths + [width] * bottom,
+        )
+
+    def align_top(
+        self,
+        width: int,
+        height: int,
+        style: Optional[Style] = None,
+        new_lines: bool = False,
+    ) -> "LineBlock":
+        """Aligns lines to top (adds extra lines to bottom as required).
+
+        Args:
+            width (int): Width of blank lines.
+            height (int): Desired height.
+            style (Style, optional): Style of any padding added.
+            new_lines (bool, optional): Padded lines should include "\\n". Defaults to False.
+
+        Returns:
+            LineBlock: A new block of lines.
+        """
+        extra_lines = height - len(self.lines)
+        if extra_lines <= 0:
+            return self.crop_height(height)
+        return self._pad_height(0, extra_lines, width, style, new_lines)
+
+    def align_middle(
+        self,
+        width: int,
+        height: int,
+        style: Optional[Style] = None,
+        new_lines: bool = False,
+    ) -> "LineBlock":
+        """Aligns lines to middle (adds extra lines above and below as required).
+
+        Args:
+            width (int): Width of blank lines.
+            height (int): Desired height.
+            style (Style, optional): Style of any padding added.
+            new_lines (bool, optional): Padded lines should include "\\n". Defaults to False.
+
+        Returns:
+            LineBlock: A new block of lines.
+        """
+        extra_lines = height - len(self.lines)
+        if extra_lines <= 0:
+            return self.crop_height(height)
+        top_lines = extra_lines // 2
+        return self._pad_height(
+            top_lines, extra_lines - top_lines, width, style, new_lines
+        )
+
+    def align_bottom(
+        self,
+        width: int,
+        height: int,
+        style: Optional[Style] = None,
+        new_lines: bool = False,
+    ) -> "LineBlock":
+        """Aligns lines to bottom (adds extra lines above as required).
+
+        Args:
+            width (int): Width of blank lines.
+            height (int): Desired height.
+            style (Style, optional): Style of any padding added.
+            new_lines (bool, optional): Padded lines should include "\\n". Defaults to False.
+
+        Returns:
+            LineBlock: A new block of lines.
+        """
+        extra_lines = height - len(self.lines)
+        if extra_lines <= 0:
+            return self.crop_height(height)
+        return self._pad_height(extra_lines, 0, width, style, new_lines)
+
+
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
     from rich.syntax import Syntax
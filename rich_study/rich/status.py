@@ -18,6 +18,7 @@ class Status(JupyterMixin):
         spinner_style (StyleType, optional): Style of spinner. Defaults to "status.spinner".
         speed (float, optional): Speed factor for spinner animation. Defaults to 1.0.
         refresh_per_second (float, optional): Number of refreshes per second. Defaults to 12.5.
+        shared_refresh (bool, optional): Refresh from a thread shared with other live displays. Defaults to False.
     """
 
     def __init__(
@@ -29,6 +30,7 @@ class Status(JupyterMixin):
         spinner_style: StyleType = "status.spinner",
         speed: float = 1.0,
         refresh_per_second: float = 12.5,
+        shared_refresh: bool = False,
     ):
         self.status = status
         self.spinner_style = spinner_style
@@ -39,6 +41,7 @@ class Status(JupyterMixin):
             console=console,
             refresh_per_second=refresh_per_second,
             transient=True,
+            shared_refresh=shared_refresh,
         )
 
     @property
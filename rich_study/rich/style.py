@@ -1,12 +1,26 @@
 import sys
 from functools import lru_cache
 from operator import attrgetter
-from pickle import dumps, loads
+from pickle import dumps
 from random import randint
-from typing import Any, Dict, Iterable, List, Optional, Type, Union, cast
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from . import errors
-from .color import Color, ColorParseError, ColorSystem, blend_rgb
+from .color import Color, ColorParseError, ColorSystem, blend_rgb, gradient_rgb
+from .color_triplet import ColorTriplet
 from .repr import Result, rich_repr
 from .terminal_theme import DEFAULT_TERMINAL_THEME, TerminalTheme
 
@@ -17,6 +31,117 @@ _hash_getter = attrgetter(
 # Style instances and style definitions are often interchangeable
 StyleType = Union[str, "Style"]
 
+# Maps the hashes of two styles on to the style created by adding them
+_combine_cache: Dict[Tuple[int, int], "Style"] = {}
+
+# Maps the arguments of Style.gradient on to a strip of styles
+_gradient_cache: Dict[
+    Tuple[Tuple[Union[Color, str], ...], int, ColorSystem, bool], Tuple["Style", ...]
+] = {}
+
+
+def _tag_meta_value(value: Any) -> Any:
+    """Tag a meta value with its type, so that values which compare equal but have
+    different types (such as True, 1, and 1.0) aren't considered the same.
+    """
+    if type(value) is tuple:
+        return (tuple, tuple(_tag_meta_value(item) for item in value))
+    return (type(value), value)
+
+
+class _Meta:
+    """An immutable and hashable mapping of style meta data.
+
+    Args:
+        meta (Mapping[str, Any]): Meta data.
+    """
+
+    __slots__ = ["_meta", "_key", "_hash"]
+
+    _INTERN_CACHE_SIZE = 4096
+    """Maximum number of meta mappings interned by :meth:`intern`."""
+
+    def __init__(self, meta: Mapping[str, Any]) -> None:
+        self._meta = dict(meta)
+        key: Union[FrozenSet[Tuple[str, Any]], bytes]
+        try:
+            key = frozenset(
+                (name, _tag_meta_value(value)) for name, value in self._meta.items()
+            )
+            self._hash = hash(key)
+        except TypeError:
+            # Unhashable values are compared by their serialized form
+            key = dumps(sorted(self._meta.items()))
+            self._hash = hash(key)
+        self._key = key
+
+    @classmethod
+    def intern(cls, meta: Mapping[str, Any]) -> "_Meta":
+        """Get a shared meta mapping equal to the given meta data.
+
+        Args:
+            meta (Mapping[str, Any]): Meta data.
+
+        Returns:
+            _Meta: A meta mapping, which may be shared with other styles.
+        """
+        new_meta = cls(meta)
+        interned_meta = _meta_cache.get(new_meta)
+        if interned_meta is None:
+            if len(_meta_cache) >= cls._INTERN_CACHE_SIZE:
+                _meta_cache.clear()
+            interned_meta = _meta_cache[new_meta] = new_meta
+        return interned_meta
+
+    def merge(self, meta: "_Meta") -> "_Meta":
+        """Merge meta data, with values from the given meta taking precedence.
+
+        Args:
+            meta (_Meta): Meta data to merge.
+
+        Returns:
+            _Meta: Merged meta data.
+        """
+        return self.intern({**self._meta, **meta._meta})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._meta[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._meta)
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, _Meta):
+            return NotImplemented
+        return self._hash == other._hash and self._key == other._key
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Hashes of strings differ between processes, so recalculate on unpickle
+        return (_Meta, (self._meta,))
+
+    def __repr__(self) -> str:
+        return f"_Meta({self._meta!r})"
+
+    def copy(self) -> Dict[str, Any]:
+        """Get a dict containing the meta data.
+
+        Returns:
+            Dict[str, Any]: A new dict.
+        """
+        return self._meta.copy()
+
+
+# Interned meta mappings
+_meta_cache: Dict[_Meta, _Meta] = {}
+
 
 class _Bit:
     """A descriptor to get/set a style attribute bit."""
@@ -66,7 +191,7 @@ class Style:
     _set_attributes: int
     _hash: Optional[int]
     _null: bool
-    _meta: Optional[bytes]
+    _meta: Optional[_Meta]
 
     __slots__ = [
         "_color",
@@ -193,7 +318,7 @@ class Style:
         )
 
         self._link = link
-        self._meta = None if meta is None else dumps(meta)
+        self._meta = None if meta is None else _Meta.intern(meta)
         self._link_id = (
             f"{randint(0, 999999)}{hash(self._meta)}" if (link or meta) else ""
         )
@@ -229,6 +354,70 @@ class Style:
         style._hash = None
         return style
 
+    _GRADIENT_CACHE_SIZE = 256
+    """Maximum number of strips cached by :meth:`gradient`."""
+
+    @classmethod
+    def gradient(
+        cls,
+        colors: Sequence[Union[Color, str]],
+        width: int,
+        color_system: ColorSystem = ColorSystem.TRUECOLOR,
+        *,
+        background: bool = False,
+    ) -> Tuple["Style", ...]:
+        """Get a strip of styles with colors that fade through a sequence of colors.
+
+        Strips are cached, so rendering the same gradient again (for instance in each
+        frame of an animation) doesn't need to calculate the colors.
+
+        Args:
+            colors (Sequence[Union[Color, str]]): Colors, or color definitions, in the gradient.
+            width (int): Number of styles in the strip, typically one per cell.
+            color_system (ColorSystem, optional): Color system to downgrade colors to.
+                Defaults to ColorSystem.TRUECOLOR.
+            background (bool, optional): Set the background color rather than the foreground
+                color. Defaults to False.
+
+        Raises:
+            ValueError: If no colors were given.
+
+        Returns:
+            Tuple[Style, ...]: A style for each cell.
+        """
+        key = (tuple(colors), width, color_system, background)
+        strip = _gradient_cache.get(key)
+        if strip is None:
+            triplets = [
+                (
+                    Color.parse(color) if isinstance(color, str) else color
+                ).get_truecolor()
+                for color in colors
+            ]
+            last_index = max(1, width - 1)
+            positions = [index / last_index for index in range(width)]
+            from_triplet = Color.from_triplet
+            from_color = cls.from_color
+            # Neighbouring cells often have the same color once downgraded (compare
+            # numbers and triplets, as downgraded colors keep the original name)
+            styles: Dict[Tuple[Optional[int], Optional[ColorTriplet]], Style] = {}
+            new_strip: List[Style] = []
+            append = new_strip.append
+            for triplet in gradient_rgb(triplets, positions):
+                color = from_triplet(triplet).downgrade(color_system)
+                color_key = (color.number, color.triplet)
+                style = styles.get(color_key)
+                if style is None:
+                    style = styles[color_key] = (
+                        from_color(bgcolor=color) if background else from_color(color)
+                    )
+                append(style)
+            strip = tuple(new_strip)
+            if len(_gradient_cache) >= cls._GRADIENT_CACHE_SIZE:
+                _gradient_cache.clear()
+            _gradient_cache[key] = strip
+        return strip
+
     @classmethod
     def from_meta(cls, meta: Optional[Dict[str, Any]]) -> "Style":
         """Create a new style with meta data.
@@ -244,7 +433,7 @@ class Style:
         style._set_attributes = 0
         style._attributes = 0
         style._link = None
-        style._meta = dumps(meta)
+        style._meta = None if meta is None else _Meta.intern(meta)
         style._link_id = f"{randint(0, 999999)}{hash(style._meta)}"
         style._hash = None
         style._null = not (meta)
@@ -425,11 +614,15 @@ class Style:
             yield "meta", self.meta
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Style):
             return NotImplemented
         return self.__hash__() == other.__hash__()
 
     def __ne__(self, other: Any) -> bool:
+        if self is other:
+            return False
         if not isinstance(other, Style):
             return NotImplemented
         return self.__hash__() != other.__hash__()
@@ -468,7 +661,7 @@ class Style:
     @property
     def meta(self) -> Dict[str, Any]:
         """Get meta information (can not be changed after construction)."""
-        return {} if self._meta is None else cast(Dict[str, Any], loads(self._meta))
+        return {} if self._meta is None else self._meta.copy()
 
     @property
     def without_color(self) -> "Style":
@@ -725,12 +918,26 @@ class Style:
         text = text or str(self)
         sys.stdout.write(f"{self.render(text)}\n")
 
-    @lru_cache(maxsize=1024)
+    _COMBINE_CACHE_SIZE = 16384
+    """Maximum number of combined styles cached by :meth:`_add`."""
+
     def _add(self, style: Optional["Style"]) -> "Style":
         if style is None or style._null:
             return self
         if self._null:
             return style
+        # Styles are equal if their hashes are equal, so a pair of hashes identifies a combination
+        key = (self._hash or self.__hash__(), style._hash or style.__hash__())
+        combined_style = _combine_cache.get(key)
+        if combined_style is None:
+            combined_style = self._combine(style)
+            if len(_combine_cache) >= self._COMBINE_CACHE_SIZE:
+                _combine_cache.clear()
+            _combine_cache[key] = combined_style
+        return combined_style
+
+    def _combine(self, style: "Style") -> "Style":
+        """Create a new style by adding a non-null style to this non-null style."""
         new_style: Style = self.__new__(Style)
         new_style._ansi = None
         new_style._style_definition = None
@@ -744,7 +951,7 @@ class Style:
         new_style._link_id = style._link_id or self._link_id
         new_style._null = style._null
         if self._meta and style._meta:
-            new_style._meta = dumps({**self.meta, **style.meta})
+            new_style._meta = self._meta.merge(style._meta)
         else:
             new_style._meta = self._meta or style._meta
         new_style._hash = None
@@ -752,7 +959,7 @@ class Style:
 
     def __add__(self, style: Optional["Style"]) -> "Style":
         combined_style = self._add(style)
-        return combined_style.copy() if combined_style.link else combined_style
+        return combined_style.copy() if combined_style._link else combined_style
 
 
 NULL_STYLE = Style()
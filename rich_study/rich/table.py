@@ -20,7 +20,7 @@ from .jupyter import JupyterMixin
 from .measure import Measurement
 from .padding import Padding, PaddingDimensions
 from .protocol import is_renderable
-from .segment import Segment
+from .segment import LineBlock, Segment
 from .style import Style, StyleType
 from .text import Text, TextType
 
@@ -810,7 +810,7 @@ class Table(JupyterMixin):
                 else None
             )
             max_height = 1
-            cells: List[List[List[Segment]]] = []
+            cells: List[LineBlock] = []
             if header_row or footer_row:
                 row_style = Style.null()
             else:
@@ -826,44 +826,44 @@ class Table(JupyterMixin):
                     height=None,
                     highlight=column.highlight,
                 )
-                lines = console.render_lines(
+                lines = console._render_lines_cached(
                     cell.renderable,
                     render_options,
                     style=get_style(cell.style) + row_style,
                 )
                 max_height = max(max_height, len(lines))
-                cells.append(lines)
+                # Lines are padded to the width of the cell, so needn't be measured. The lines
+                # may be cached, but LineBlock never modifies lines in place.
+                cells.append(LineBlock(lines[:], [width] * len(lines)))
 
             row_height = max(len(cell) for cell in cells)
 
             def align_cell(
-                cell: List[List[Segment]],
+                cell: LineBlock,
                 vertical: "VerticalAlignMethod",
                 width: int,
                 style: Style,
-            ) -> List[List[Segment]]:
+            ) -> LineBlock:
                 if header_row:
                     vertical = "bottom"
                 elif footer_row:
                     vertical = "top"
 
                 if vertical == "top":
-                    return _Segment.align_top(cell, width, row_height, style)
+                    return cell.align_top(width, row_height, style)
                 elif vertical == "middle":
-                    return _Segment.align_middle(cell, width, row_height, style)
-                return _Segment.align_bottom(cell, width, row_height, style)
-
-            cells[:] = [
-                _Segment.set_shape(
-                    align_cell(
-                        cell,
-                        _cell.vertical,
-                        width,
-                        get_style(_cell.style) + row_style,
-                    ),
+                    return cell.align_middle(width, row_height, style)
+                return cell.align_bottom(width, row_height, style)
+
+            cell_lines = [
+                align_cell(
+                    cell,
+                    _cell.vertical,
                     width,
-                    max_height,
+                    get_style(_cell.style) + row_style,
                 )
+                .set_shape(width, max_height)
+                .lines
                 for width, _cell, cell, column in zip(widths, row_cell, cells, columns)
             ]
 
@@ -886,7 +886,7 @@ class Table(JupyterMixin):
                 for line_no in range(max_height):
                     if show_edge:
                         yield left
-                    for last_cell, rendered_cell in loop_last(cells):
+                    for last_cell, rendered_cell in loop_last(cell_lines):
                         yield from rendered_cell[line_no]
                         if not last_cell:
                             yield divider
@@ -895,7 +895,7 @@ class Table(JupyterMixin):
                     yield new_line
             else:
                 for line_no in range(max_height):
-                    for rendered_cell in cells:
+                    for rendered_cell in cell_lines:
                         yield from rendered_cell[line_no]
                     yield new_line
             if _box and first and show_header:
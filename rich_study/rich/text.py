@@ -1,5 +1,5 @@
 import re
-from functools import partial, reduce
+from functools import reduce
 from math import gcd
 from operator import itemgetter
 from typing import (
@@ -18,7 +18,7 @@ from typing import (
 
 from ._loop import loop_last
 from ._pick import pick_bool
-from ._wrap import divide_line
+from ._wrap import WordMeasures, divide_words, measure_words
 from .align import AlignMethod
 from .cells import cell_len, set_cell_size
 from .containers import Lines
@@ -139,6 +139,7 @@ class Text(JupyterMixin):
         "tab_size",
         "_spans",
         "_length",
+        "_wrap_cache",
     ]
 
     def __init__(
@@ -163,6 +164,7 @@ class Text(JupyterMixin):
         self.tab_size = tab_size
         self._spans: List[Span] = spans or []
         self._length: int = len(sanitized_text)
+        self._wrap_cache: Optional[_WrapCache] = None
 
     def __len__(self) -> int:
         return self._length
@@ -734,11 +736,15 @@ class Text(JupyterMixin):
             if end:
                 yield _Segment(end)
             return
-        get_style = partial(console.get_style, default=Style.null())
-
         enumerated_spans = list(enumerate(self._spans, 1))
-        style_map = {index: get_style(span.style) for index, span in enumerated_spans}
-        style_map[0] = get_style(self.style)
+        style_map = dict(
+            enumerate(
+                console.get_styles(
+                    [self.style, *(span.style for span in self._spans)],
+                    default=Style.null(),
+                )
+            )
+        )
 
         spans = [
             (0, False, 0),
@@ -1226,15 +1232,37 @@ class Text(JupyterMixin):
         wrap_overflow = overflow or self.overflow or DEFAULT_OVERFLOW
 
         no_wrap = pick_bool(no_wrap, self.no_wrap, False) or overflow == "ignore"
+        fold = wrap_overflow == "fold"
+
+        # Line break offsets only depend on the plain text, so may be reused between calls
+        wrap_cache = self._wrap_cache
+        if wrap_cache is None or not wrap_cache.is_valid(self.plain, tab_size):
+            wrap_cache = self._wrap_cache = _WrapCache(self.plain, tab_size)
+        # The cache may be shared between threads, so new entries are built locally and
+        # stored with a single assignment
+        line_words = wrap_cache.words
+        line_offsets = wrap_cache.offsets.get((width, fold))
+        new_line_words: List[WordMeasures] = []
+        new_line_offsets: List[List[int]] = []
 
         lines = Lines()
-        for line in self.split(allow_blank=True):
+        for line_index, line in enumerate(self.split(allow_blank=True)):
             if "\t" in line:
                 line.expand_tabs(tab_size)
             if no_wrap:
                 new_lines = Lines([line])
             else:
-                offsets = divide_line(str(line), width, fold=wrap_overflow == "fold")
+                if line_offsets is None:
+                    plain = line.plain
+                    if line_words is None:
+                        words = measure_words(plain)
+                        new_line_words.append(words)
+                    else:
+                        words = line_words[line_index]
+                    offsets = divide_words(plain, words, width, fold)
+                    new_line_offsets.append(offsets)
+                else:
+                    offsets = line_offsets[line_index]
                 new_lines = line.divide(offsets)
             for line in new_lines:
                 line.rstrip_end(width)
@@ -1245,6 +1273,10 @@ class Text(JupyterMixin):
             for line in new_lines:
                 line.truncate(width, overflow=wrap_overflow)
             lines.extend(new_lines)
+        if new_line_offsets:
+            if line_words is None:
+                wrap_cache.words = new_line_words
+            wrap_cache.add_offsets(width, fold, new_line_offsets)
         return lines
 
     def fit(self, width: int) -> Lines:
@@ -1333,6 +1365,41 @@ class Text(JupyterMixin):
         return new_text
 
 
+class _WrapCache:
+    """Word measurements and line break offsets for wrapping a Text, which remain valid
+    while its plain text is unchanged.
+
+    Args:
+        plain (str): Plain text of the Text.
+        tab_size (int): Tab size used to expand tabs.
+    """
+
+    __slots__ = ["plain", "tab_size", "words", "offsets"]
+
+    MAX_OFFSETS = 8
+    """Maximum number of widths to keep line break offsets for."""
+
+    def __init__(self, plain: str, tab_size: int) -> None:
+        self.plain = plain
+        self.tab_size = tab_size
+        self.words: Optional[List[WordMeasures]] = None
+        self.offsets: Dict[Tuple[int, bool], List[List[int]]] = {}
+
+    def is_valid(self, plain: str, tab_size: int) -> bool:
+        """Check if the cache applies to the given text."""
+        return tab_size == self.tab_size and plain == self.plain
+
+    def add_offsets(self, width: int, fold: bool, offsets: List[List[int]]) -> None:
+        """Store the line break offsets for each line, when wrapped to the given width."""
+        # Update a copy, so that concurrent wraps never see a partially updated cache
+        new_offsets = self.offsets.copy()
+        if len(new_offsets) >= self.MAX_OFFSETS:
+            # Discard the oldest
+            del new_offsets[next(iter(new_offsets))]
+        new_offsets[(width, fold)] = offsets
+        self.offsets = new_offsets
+
+
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
 
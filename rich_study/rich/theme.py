@@ -1,4 +1,5 @@
 import configparser
+from itertools import count
 from typing import IO, Dict, List, Mapping, Optional
 
 from .default_styles import DEFAULT_STYLES
@@ -73,6 +74,10 @@ class Theme:
             return cls.from_file(config_file, source=path, inherit=inherit)
 
 
+# Versions are shared by all stacks, so a version identifies both a stack and its contents
+_theme_stack_versions = count()
+
+
 class ThemeStackError(Exception):
     """Base exception for errors related to the theme stack."""
 
@@ -87,6 +92,8 @@ class ThemeStack:
     def __init__(self, theme: Theme) -> None:
         self._entries: List[Dict[str, Style]] = [theme.styles]
         self.get = self._entries[-1].get
+        self.version = next(_theme_stack_versions)
+        """Identifies the styles in the stack. Changes when a theme is pushed or popped, and is unique to each stack."""
 
     def push_theme(self, theme: Theme, inherit: bool = True) -> None:
         """Push a theme on the top of the stack.
@@ -101,6 +108,7 @@ class ThemeStack:
         )
         self._entries.append(styles)
         self.get = self._entries[-1].get
+        self.version = next(_theme_stack_versions)
 
     def pop_theme(self) -> None:
         """Pop (and discard) the top-most theme."""
@@ -108,6 +116,7 @@ class ThemeStack:
             raise ThemeStackError("Unable to pop base theme")
         self._entries.pop()
         self.get = self._entries[-1].get
+        self.version = next(_theme_stack_versions)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,4 +1,5 @@
-from typing import Iterator, List, Optional, Tuple
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ._loop import loop_first, loop_last
 from .console import Console, ConsoleOptions, RenderableType, RenderResult
@@ -7,6 +8,7 @@ from .measure import Measurement
 from .segment import Segment
 from .style import Style, StyleStack, StyleType
 from .styled import Styled
+from .text import Text
 
 GuideType = Tuple[str, str, str, str]
 
@@ -25,6 +27,15 @@ class Tree(JupyterMixin):
         expanded (bool, optional): Also display children. Defaults to True.
         highlight (bool, optional): Highlight renderable (if str). Defaults to False.
         hide_root (bool, optional): Hide the root node. Defaults to False.
+        load_children (Callable[[], Iterable[Tree]], optional): Callable which returns additional
+            children, called each time the tree is rendered or measured (and only if the children
+            are displayed). Defaults to None.
+        max_depth (int, optional): Maximum depth of nodes to display, or None for no maximum.
+            Deeper nodes are summarized with "...". Defaults to None.
+        max_children (int, optional): Maximum number of children to display for each node, or
+            None for no maximum. Remaining children are summarized with "...". Defaults to None.
+        summarize (bool, optional): Summarize the children of collapsed nodes with "...".
+            Defaults to False.
     """
 
     ASCII_GUIDES = ("    ", "|   ", "+-- ", "`-- ")
@@ -43,6 +54,10 @@ class Tree(JupyterMixin):
         expanded: bool = True,
         highlight: bool = False,
         hide_root: bool = False,
+        load_children: Optional[Callable[[], Iterable["Tree"]]] = None,
+        max_depth: Optional[int] = None,
+        max_children: Optional[int] = None,
+        summarize: bool = False,
     ) -> None:
         self.label = label
         self.style = style
@@ -51,6 +66,10 @@ class Tree(JupyterMixin):
         self.expanded = expanded
         self.highlight = highlight
         self.hide_root = hide_root
+        self.load_children = load_children
+        self.max_depth = max_depth
+        self.max_children = max_children
+        self.summarize = summarize
 
     def add(
         self,
@@ -60,6 +79,7 @@ class Tree(JupyterMixin):
         guide_style: Optional[StyleType] = None,
         expanded: bool = True,
         highlight: Optional[bool] = False,
+        load_children: Optional[Callable[[], Iterable["Tree"]]] = None,
     ) -> "Tree":
         """Add a child tree.
 
@@ -69,6 +89,8 @@ class Tree(JupyterMixin):
             guide_style (StyleType, optional): Style of the guide lines. Defaults to "tree.line".
             expanded (bool, optional): Also display children. Defaults to True.
             highlight (Optional[bool], optional): Highlight renderable (if str). Defaults to False.
+            load_children (Callable[[], Iterable[Tree]], optional): Callable which returns additional
+                children, when they are displayed. Defaults to None.
 
         Returns:
             Tree: A new child Tree, which may be further modified.
@@ -79,10 +101,61 @@ class Tree(JupyterMixin):
             guide_style=self.guide_style if guide_style is None else guide_style,
             expanded=expanded,
             highlight=self.highlight if highlight is None else highlight,
+            load_children=load_children,
         )
         self.children.append(node)
         return node
 
+    def _iter_children(self, node: "Tree", depth: int) -> Iterator["Tree"]:
+        """Iterate over the children of a node to display, with the limits set on this tree.
+
+        Args:
+            node (Tree): A node within this tree.
+            depth (int): Depth of the node, where the root has a depth of 0.
+
+        Returns:
+            Iterator[Tree]: Child nodes, followed by a node summarizing any which are hidden.
+        """
+        load_children = node.load_children
+        if not node.children and load_children is None:
+            return
+        # The number of children isn't known without loading them
+        child_count = len(node.children) if load_children is None else None
+        if not node.expanded:
+            if self.summarize:
+                yield self._make_summary(child_count)
+            return
+        if self.max_depth is not None and depth >= self.max_depth:
+            yield self._make_summary(child_count)
+            return
+
+        children: Iterable[Tree] = node.children
+        if load_children is not None:
+            children = chain(children, load_children())
+        max_children = self.max_children
+        if max_children is None:
+            yield from children
+            return
+        iter_children = iter(children)
+        yield from islice(iter_children, max_children)
+        if child_count is None:
+            if next(iter_children, None) is not None:
+                yield self._make_summary(None)
+        elif child_count > max_children:
+            yield self._make_summary(child_count - max_children)
+
+    def _make_summary(self, hidden_count: Optional[int]) -> "Tree":
+        """Make a node to summarize hidden children.
+
+        Args:
+            hidden_count (Optional[int]): Number of hidden children, or None if not known.
+
+        Returns:
+            Tree: A tree node.
+        """
+        summary = "..." if hidden_count is None else f"... +{hidden_count}"
+        return Tree(Text(summary, style="tree.ellipsis"))
+
     def __rich_console__(
         self, console: "Console", options: "ConsoleOptions"
     ) -> "RenderResult":
@@ -98,14 +171,21 @@ class Tree(JupyterMixin):
 
         _Segment = Segment
 
+        guide_cache: Dict[Tuple[int, Style], Segment] = {}
+
         def make_guide(index: int, style: Style) -> Segment:
             """Make a Segment for a level of the guide lines."""
-            if options.ascii_only:
-                line = self.ASCII_GUIDES[index]
-            else:
-                guide = 1 if style.bold else (2 if style.underline2 else 0)
-                line = self.TREE_GUIDES[0 if options.legacy_windows else guide][index]
-            return _Segment(line, style)
+            guide_segment = guide_cache.get((index, style))
+            if guide_segment is None:
+                if options.ascii_only:
+                    line = self.ASCII_GUIDES[index]
+                else:
+                    guide = 1 if style.bold else (2 if style.underline2 else 0)
+                    line = self.TREE_GUIDES[0 if options.legacy_windows else guide][
+                        index
+                    ]
+                guide_segment = guide_cache[(index, style)] = _Segment(line, style)
+            return guide_segment
 
         levels: List[Segment] = [make_guide(CONTINUE, guide_style)]
         push(iter(loop_last([self])))
@@ -114,7 +194,29 @@ class Tree(JupyterMixin):
         style_stack = StyleStack(get_style(self.style))
         remove_guide_styles = Style(bold=False, underline2=False)
 
-        depth = 0
+        # Guides are repeated for every line, so cache the styled prefixes
+        prefix_cache: Dict[Tuple[Tuple[Segment, ...], Style], List[Segment]] = {}
+        options_cache: Dict[int, ConsoleOptions] = {}
+
+        def render_prefix(prefix: List[Segment], style: Style) -> List[Segment]:
+            """Apply the background of a node to the guides which prefix a line."""
+            key = (tuple(prefix), style.background_style)
+            segments = prefix_cache.get(key)
+            if segments is None:
+                segments = prefix_cache[key] = list(
+                    _Segment.apply_style(prefix, key[1], post_style=remove_guide_styles)
+                )
+            return segments
+
+        def get_label_options(prefix: List[Segment]) -> ConsoleOptions:
+            """Get options to render a label, with the width remaining after the guides."""
+            width = options.max_width - sum(level.cell_length for level in prefix)
+            label_options = options_cache.get(width)
+            if label_options is None:
+                label_options = options_cache[width] = options.update(
+                    width=width, highlight=self.highlight, height=None
+                )
+            return label_options
 
         while stack:
             stack_node = pop()
@@ -132,28 +234,20 @@ class Tree(JupyterMixin):
             if last:
                 levels[-1] = make_guide(END, levels[-1].style or null_style)
 
+            depth = len(levels) - 1
             guide_style = guide_style_stack.current + get_style(node.guide_style)
             style = style_stack.current + get_style(node.style)
             prefix = levels[(2 if self.hide_root else 1) :]
             renderable_lines = console.render_lines(
                 Styled(node.label, style),
-                options.update(
-                    width=options.max_width
-                    - sum(level.cell_length for level in prefix),
-                    highlight=self.highlight,
-                    height=None,
-                ),
+                get_label_options(prefix),
                 pad=options.justify is not None,
             )
 
             if not (depth == 0 and self.hide_root):
                 for first, line in loop_first(renderable_lines):
                     if prefix:
-                        yield from _Segment.apply_style(
-                            prefix,
-                            style.background_style,
-                            post_style=remove_guide_styles,
-                        )
+                        yield from render_prefix(prefix, style)
                     yield from line
                     yield new_line
                     if first and prefix:
@@ -161,17 +255,17 @@ class Tree(JupyterMixin):
                             SPACE if last else CONTINUE, prefix[-1].style or null_style
                         )
 
-            if node.expanded and node.children:
+            iter_children = iter(loop_last(self._iter_children(node, depth)))
+            first_child = next(iter_children, None)
+            if first_child is not None:
                 levels[-1] = make_guide(
                     SPACE if last else CONTINUE, levels[-1].style or null_style
                 )
-                levels.append(
-                    make_guide(END if len(node.children) == 1 else FORK, guide_style)
-                )
+                # The guide is replaced with END for the last child
+                levels.append(make_guide(FORK, guide_style))
                 style_stack.push(get_style(node.style))
                 guide_style_stack.push(get_style(node.guide_style))
-                push(iter(loop_last(node.children)))
-                depth += 1
+                push(chain([first_child], iter_children))
 
     def __rich_measure__(
         self, console: "Console", options: "ConsoleOptions"
@@ -195,8 +289,10 @@ class Tree(JupyterMixin):
             indent = level * 4
             minimum = max(min_measure + indent, minimum)
             maximum = max(max_measure + indent, maximum)
-            if tree.expanded and tree.children:
-                push(iter(tree.children))
+            iter_children = self._iter_children(tree, level)
+            first_child = next(iter_children, None)
+            if first_child is not None:
+                push(chain([first_child], iter_children))
                 level += 1
         return Measurement(minimum, maximum)
 
@@ -92,6 +92,22 @@ def test_get_pulse_segments():
     assert segments == expected
 
 
+def test_pulse_frames_cached():
+    console = Console(
+        width=20, height=10, color_system="truecolor", force_terminal=True
+    )
+    options = console.options
+    first = list(
+        ProgressBar(pulse=True, animation_time=1).__rich_console__(console, options)
+    )
+    second = list(
+        ProgressBar(pulse=True, animation_time=1).__rich_console__(console, options)
+    )
+    assert first == second
+    assert len(first) == 20
+    assert all(a is b for a, b in zip(first, second))
+
+
 if __name__ == "__main__":
     bar = ProgressBar(completed=11, width=50)
     bar_render = render(bar)
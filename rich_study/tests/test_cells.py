@@ -1,7 +1,7 @@
 import string
 
 from rich import cells
-from rich.cells import _is_single_cell_widths, chop_cells
+from rich.cells import _get_cell_offsets, _is_single_cell_widths, chop_cells
 
 
 def test_cell_len_long_string():
@@ -79,3 +79,14 @@ def test_is_single_cell_widths() -> None:
 
     for character in "わさび":
         assert not _is_single_cell_widths(character)
+
+
+def test_get_cell_offsets(monkeypatch) -> None:
+    assert list(_get_cell_offsets("")) == [0]
+    assert list(_get_cell_offsets("a早́b")) == [0, 1, 3, 3, 4]
+    assert _get_cell_offsets("a早b") is _get_cell_offsets("a早b")
+
+    monkeypatch.setattr(cells, "_CELL_OFFSETS_CACHE_SIZE", 2)
+    for text in ("foo", "bar", "baz"):
+        _get_cell_offsets(text)
+    assert len(cells._cell_offsets_cache) <= 2
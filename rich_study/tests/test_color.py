@@ -1,5 +1,7 @@
 from rich.color import (
     blend_rgb,
+    blend_rgb_many,
+    gradient_rgb,
     parse_rgb_hex,
     Color,
     ColorParseError,
@@ -185,3 +187,30 @@ def test_blend_rgb() -> None:
     assert blend_rgb(
         ColorTriplet(10, 20, 30), ColorTriplet(30, 40, 50)
     ) == ColorTriplet(20, 30, 40)
+
+
+def test_blend_rgb_many() -> None:
+    color1 = ColorTriplet(10, 20, 30)
+    color2 = ColorTriplet(30, 40, 50)
+    cross_fades = [0.0, 0.25, 0.5, 1.0]
+    assert blend_rgb_many(color1, color2, cross_fades) == [
+        blend_rgb(color1, color2, cross_fade) for cross_fade in cross_fades
+    ]
+
+
+def test_gradient_rgb() -> None:
+    red = ColorTriplet(255, 0, 0)
+    green = ColorTriplet(0, 255, 0)
+    blue = ColorTriplet(0, 0, 255)
+    assert gradient_rgb([red, green, blue], [-1, 0, 0.25, 0.5, 0.75, 1, 2]) == [
+        red,
+        red,
+        ColorTriplet(127, 127, 0),
+        green,
+        ColorTriplet(0, 127, 127),
+        blue,
+        blue,
+    ]
+    assert gradient_rgb([red], [0, 0.5, 1]) == [red, red, red]
+    with pytest.raises(ValueError):
+        gradient_rgb([], [0])
@@ -66,6 +66,47 @@ def test_render():
     assert render() == expected
 
 
+def _render_columns(columns: Columns, width: int = 100) -> str:
+    console = Console(file=io.StringIO(), width=width, legacy_windows=False)
+    console.print(columns)
+    return console.file.getvalue()
+
+
+def test_stream_matches_table():
+    options = [
+        {},
+        {"expand": True},
+        {"column_first": True},
+        {"column_first": True, "right_to_left": True},
+        {"equal": True, "expand": True},
+        {"width": 16},
+        {"padding": (1, 2)},
+    ]
+    for kwargs in options:
+        expected = _render_columns(Columns(COLUMN_DATA, **kwargs))
+        result = _render_columns(Columns(COLUMN_DATA, stream=True, **kwargs))
+        assert result == expected, kwargs
+
+
+def test_column_count():
+    columns = Columns()
+    assert columns._get_column_count([], 80, 1) == 0
+    assert columns._get_column_count([10] * 3, 80, 1) == 3
+    assert columns._get_column_count([10] * 20, 31, 1) == 2
+    assert columns._get_column_count([80, 1, 1], 80, 1) == 1
+    # The widest item in a later row limits the column count
+    assert columns._get_column_count([5, 5, 5, 5, 30], 40, 1) == 2
+
+
+def test_many_renderables():
+    names = [f"item {index}" for index in range(1000)]
+    result = _render_columns(Columns(names))
+    lines = result.splitlines()
+    assert len(lines) == 91
+    assert lines[0].startswith("item 0  ")
+    assert lines[-1].rstrip().endswith("item 999")
+
+
 if __name__ == "__main__":
     result = render()
     print(result)
@@ -4,7 +4,7 @@ import os
 import subprocess
 import sys
 import tempfile
-from typing import Optional, Tuple, Type, Union
+from typing import List, Optional, Tuple, Type, Union
 from unittest import mock
 
 import pytest
@@ -17,7 +17,9 @@ from rich.console import (
     Console,
     ConsoleDimensions,
     ConsoleOptions,
+    RenderResult,
     ScreenUpdate,
+    _insert_new_line_start,
     group,
 )
 from rich.control import Control
@@ -30,6 +32,7 @@ from rich.segment import Segment
 from rich.status import Status
 from rich.style import Style
 from rich.text import Text
+from rich.theme import Theme
 
 os.get_terminal_size
 
@@ -361,6 +364,112 @@ def test_get_style_error() -> None:
         console.get_style("foo bar")
 
 
+def test_get_style_cache() -> None:
+    from rich.theme import Theme
+
+    console = Console()
+    style = console.get_style("repr.number")
+    assert console.get_style("repr.number") is style
+    with console.use_theme(Theme({"repr.number": "bold magenta"})):
+        assert console.get_style("repr.number") == Style(bold=True, color="magenta")
+    assert console.get_style("repr.number") is style
+    # Link styles are copied, so that links have different ids
+    link_style = console.get_style("link https://example.org")
+    assert link_style.link == "https://example.org"
+    assert console.get_style("link https://example.org")._link_id != link_style._link_id
+
+
+def test_get_style_cache_size() -> None:
+    console = Console()
+    console._STYLE_CACHE_SIZE = 10
+    for index in range(25):
+        assert console.get_style(f"color({index})") == Style(color=f"color({index})")
+    assert len(console._style_cache[1]) <= 10
+
+
+def test_get_styles() -> None:
+    console = Console()
+    bold = Style(bold=True)
+    styles = console.get_styles(
+        ["red", bold, "link https://example.org", "not a style"], default="blue"
+    )
+    assert styles == [
+        Style(color="red"),
+        bold,
+        Style(link="https://example.org"),
+        Style(color="blue"),
+    ]
+    with pytest.raises(errors.MissingStyle):
+        console.get_styles(["red", "not a style"])
+
+
+def test_render_lines_cached() -> None:
+    console = Console(width=20)
+    lines = console.render_lines_cached("[b]Hello[/b] World", style=Style(italic=True))
+    assert lines == console.render_lines("[b]Hello[/b] World", style=Style(italic=True))
+    assert (
+        console.render_lines_cached("[b]Hello[/b] World", style=Style(italic=True))
+        is lines
+    )
+    assert console.render_lines_cached("[b]Hello[/b] World") is not lines
+    options = console.options.update_width(5)
+    assert len(console.render_lines_cached("[b]Hello[/b] World", options)) == 2
+    with console.use_theme(Theme({"repr.number": "red"})):
+        assert (
+            console.render_lines_cached("[b]Hello[/b] World", style=Style(italic=True))
+            is not lines
+        )
+
+
+def test_render_lines_cached_version() -> None:
+    class Versioned:
+        def __init__(self) -> None:
+            self.text = "foo"
+            self.version = 0
+            self.renders = 0
+
+        def __rich_version__(self) -> int:
+            return self.version
+
+        def __rich_console__(
+            self, console: Console, options: ConsoleOptions
+        ) -> RenderResult:
+            self.renders += 1
+            yield self.text
+
+    console = Console(width=10)
+    versioned = Versioned()
+    lines = console.render_lines_cached(versioned)
+    assert console.render_lines_cached(versioned) is lines
+    assert versioned.renders == 1
+    versioned.text = "bar"
+    versioned.version += 1
+    assert console.render_lines_cached(versioned) == [
+        [Segment("bar"), Segment(" " * 7)]
+    ]
+    assert versioned.renders == 2
+
+    # Renderables without a version are always rendered
+    text = Text("foo")
+    assert console.render_lines_cached(text) == console.render_lines(text)
+    assert not console._lines_cache.get((id(text), 10, None, None, True))
+
+
+def test_render_lines_cached_size() -> None:
+    console = Console(width=10)
+    console._LINES_CACHE_SIZE = 4
+    foo = console.render_lines_cached("foo")
+    console.render_lines_cached("bar\nbar")
+    assert console.render_lines_cached("foo") is foo
+    # Discards the least recently used render ("bar\nbar") to make room
+    console.render_lines_cached("baz\nbaz")
+    assert [key[0] for key in console._lines_cache] == ["foo", "baz\nbaz"]
+    assert console._lines_cache_size == 3
+    # Renders with more lines than the cache can hold aren't cached
+    console.render_lines_cached("egg\n" * 5)
+    assert [key[0] for key in console._lines_cache] == ["foo", "baz\nbaz"]
+
+
 def test_render_error() -> None:
     console = Console()
     with pytest.raises(errors.NotRenderableError):
@@ -863,6 +972,106 @@ def test_print_newline_start() -> None:
     assert result == "Foo\n\nFoo\nbar\n\n"
 
 
+class WriteCountingIO(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: List[str] = []
+
+    def write(self, text: str) -> int:
+        if text:
+            self.writes.append(text)
+        return super().write(text)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"style": "bold red"},
+        {"new_line_start": True},
+        {"crop": False},
+        {"soft_wrap": True},
+    ],
+)
+def test_print_stream(kwargs) -> None:
+    from rich.table import Table
+
+    def make_console() -> Console:
+        return Console(
+            file=WriteCountingIO(),
+            width=30,
+            color_system="truecolor",
+            force_terminal=True,
+            legacy_windows=False,
+            _environ={},
+        )
+
+    table = Table("Index", "Name")
+    for index in range(50):
+        table.add_row(str(index), f"[green]row {index}[/green] " * 5)
+    objects = ("Hello", table, Text("x" * 100, style="blue"))
+
+    console = make_console()
+    console.print(*objects, **kwargs)
+    stream_console = make_console()
+    stream_console._STREAM_BUFFER_SIZE = 50
+    stream_console.print(*objects, stream=True, **kwargs)
+    assert stream_console.file.getvalue() == console.file.getvalue()
+    assert len(console.file.writes) == 1
+    # Output is written as it is rendered
+    assert len(stream_console.file.writes) > 10
+
+
+def test_print_stream_buffered() -> None:
+    console = Console(file=WriteCountingIO(), width=20, legacy_windows=False)
+    console._STREAM_BUFFER_SIZE = 10
+    with console:
+        console.print("foo\n" * 100, stream=True)
+        assert console.file.writes == []
+    assert console.file.writes == ["foo\n" * 100 + "\n"]
+
+
+def test_print_stream_record() -> None:
+    console = Console(file=io.StringIO(), width=20, record=True, legacy_windows=False)
+    console._STREAM_BUFFER_SIZE = 10
+    console.print("foo\n" * 100, stream=True)
+    assert console.export_text() == "foo\n" * 100 + "\n"
+
+
+def test_print_stream_new_line_start() -> None:
+    console = Console(width=80, height=25)
+    console.begin_capture()
+    console.print("Foo", new_line_start=True, stream=True)
+    console.print("Foo\nbar\n", new_line_start=True, stream=True)
+    result = console.end_capture()
+    assert result == "Foo\n\nFoo\nbar\n\n"
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        [],
+        ["", ""],
+        ["Foo"],
+        ["Foo", "\n"],
+        ["Foo\n", "bar"],
+        ["Foo", "\nbar"],
+        ["\n", "\n"],
+        ["Foo\r", "\n"],
+        ["Foo\r", "\n", "bar"],
+        ["Foo\r", "\n", "\n"],
+        ["Foo\r", "", "bar"],
+        ["Foo\u2028", "bar"],
+        ["Foo", "", "bar", "\n", "", "baz", "\n"],
+    ],
+)
+def test_insert_new_line_start(texts: List[str]) -> None:
+    segments = [Segment(text) for text in texts]
+    result = list(_insert_new_line_start(iter(segments)))
+    expected_new_line = len("".join(texts).splitlines()) > 1
+    assert result == ([Segment.line()] if expected_new_line else []) + segments
+
+
 def test_is_terminal_broken_file() -> None:
     console = Console()
 
@@ -1127,3 +1336,117 @@ def test_tty_compatible() -> None:
     assert not console.is_terminal
     # Should not have auto-detected
     assert not console.file.called_isatty
+
+
+def test_import_is_lazy() -> None:
+    """Check that importing the console doesn't load subsystems that are only needed on demand."""
+    lazy_modules = [
+        "rich._emoji_codes",
+        "rich._export_format",
+        "rich.markup",
+        "rich.pager",
+        "rich.pretty",
+        "rich.scope",
+        "rich.syntax",
+        "pygments",
+    ]
+    code = (
+        "import sys, rich.console, rich.logging\n"
+        f"print([name for name in {lazy_modules!r} if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_module_attributes() -> None:
+    from rich import console as console_module
+    from rich._export_format import CONSOLE_SVG_FORMAT
+    from rich.pretty import Pretty
+
+    assert console_module.CONSOLE_SVG_FORMAT is CONSOLE_SVG_FORMAT
+    assert console_module.Pretty is Pretty
+    with pytest.raises(AttributeError):
+        console_module.does_not_exist
+
+
+def test_print_after_lazy_import() -> None:
+    console = Console(file=io.StringIO(), width=40, color_system=None)
+    console.print(":thumbs_up: [bold]Hello[/bold]", {"foo": [1, 2]})
+    assert console.file.getvalue() == "👍 Hello\n{'foo': [1, 2]}\n"
+
+    # Lazily loaded functions are kept after the first print
+    from rich import console as console_module
+    from rich.markup import render
+    from rich.pretty import Pretty, is_expandable
+
+    assert console_module._render_markup is render
+    assert console_module._pretty == (Pretty, is_expandable)
+
+
+def test_iter_write_batches() -> None:
+    from rich.console import _iter_write_batches
+
+    def batches(text: str, max_size: int) -> List[str]:
+        return [text[start:end] for start, end in _iter_write_batches(text, max_size)]
+
+    assert batches("", 10) == []
+    assert batches("foo\nbar\n", 10) == ["foo\nbar\n"]
+    assert batches("foo\nbar\nbaz\n", 10) == ["foo\nbar\n", "baz\n"]
+    assert batches("foo\nbarbazegg\nspam", 5) == ["foo\n", "barbazegg\n", "spam"]
+    assert batches("foobarbaz", 5) == ["foobarbaz"]
+
+
+@pytest.mark.parametrize("isatty", [True, False])
+def test_windows_large_write(isatty: bool) -> None:
+    writes: List[str] = []
+
+    class File(io.StringIO):
+        def write(self, text: str) -> int:
+            writes.append(text)
+            return super().write(text)
+
+        def isatty(self) -> bool:
+            return isatty
+
+    console = Console(file=File(), legacy_windows=False, color_system=None)
+    text = "\n".join(f"line {index:04d}" for index in range(2000))
+    with mock.patch("rich.console.WINDOWS", new=True):
+        console.print(text)
+    assert console.file.getvalue() == text + "\n"
+    if isatty:
+        assert len(writes) > 1
+        assert max(len(write) for write in writes) <= 32 * 1024 // 4
+        assert all(write.endswith("\n") for write in writes)
+    else:
+        assert len(writes) == 1
+
+
+def test_render_buffer_style_codes() -> None:
+    console = Console(
+        file=io.StringIO(), force_terminal=True, color_system="truecolor", _environ={}
+    )
+    link = Style(link="https://example.org")
+    segments = [
+        Segment("foo", Style(bold=True)),
+        Segment("", Style(italic=True)),
+        Segment("bar", Style(color="red")),
+        Segment("baz", link),
+        Segment("foo", Style(bold=True)),
+        Segment("egg"),
+    ]
+    expected = "".join(
+        segment.style.render(segment.text, color_system=console._color_system)
+        if segment.style
+        else segment.text
+        for segment in segments
+    )
+    assert console._render_buffer(segments) == expected
+    assert console._render_buffer(segments) == expected
+    assert link not in console._style_codes
+    assert Style(bold=True) in console._style_codes
@@ -1,5 +1,6 @@
 import pytest
 
+from rich._emoji_replace import _get_emoji_index, get_emoji
 from rich.emoji import Emoji, NoEmoji
 
 from .render import render
@@ -35,3 +36,30 @@ def test_variant():
 def test_variant_non_default():
     render_result = render(Emoji("warning", variant="emoji"))
     assert render_result == "⚠" + "\uFE0F"
+
+
+def test_get_emoji():
+    assert get_emoji("pile_of_poo") == "💩"
+    assert get_emoji("+1") == "👍"
+    with pytest.raises(KeyError):
+        get_emoji("ambivalent_bunny")
+    with pytest.raises(KeyError):
+        get_emoji("zzzzzzzz")
+
+
+def test_emoji_table_sorted():
+    names, emoji = _get_emoji_index()
+    assert names == sorted(names)
+    assert len(names) == len(emoji)
+
+
+def test_emoji_dict():
+    from rich._emoji_codes import EMOJI
+
+    assert EMOJI["pile_of_poo"] == "💩"
+    assert len(EMOJI) == len(_get_emoji_index()[0])
+
+
+def test_replace_no_emoji_code():
+    text = "no emoji codes here"
+    assert Emoji.replace(text) is text
@@ -1,5 +1,6 @@
 import io
 import sys
+import time
 
 import pytest
 
@@ -35,3 +36,65 @@ def test_new_lines():
     assert file.getvalue() == "-\n"
     file_proxy.flush()
     assert file.getvalue() == "-\n-\n"
+
+
+def test_coalesce():
+    file = io.StringIO()
+    console = Console(file=file)
+    file_proxy = FileProxy(console, file, max_latency=60)
+    assert file_proxy.max_latency == 60
+    file_proxy.write("foo\n")
+    file_proxy.write("bar\nbaz")
+    assert file.getvalue() == ""
+    assert file_proxy.flush_lines()
+    assert file.getvalue() == "foo\nbar\n"
+    assert not file_proxy.flush_lines()
+    file_proxy.flush()
+    assert file.getvalue() == "foo\nbar\nbaz\n"
+
+
+def test_coalesce_max_latency():
+    file = io.StringIO()
+    console = Console(file=file)
+    file_proxy = FileProxy(console, file, max_latency=0)
+    file_proxy.write("foo\n")
+    assert file.getvalue() == "foo\n"
+
+
+def test_coalesce_flush():
+    file = io.StringIO()
+    console = Console(file=file)
+    file_proxy = FileProxy(console, file, max_latency=60)
+    file_proxy.write("foo\nbar\n")
+    assert file.getvalue() == ""
+    file_proxy.flush()
+    assert file.getvalue() == "foo\nbar\n"
+
+
+def test_coalesce_timer():
+    file = io.StringIO()
+    console = Console(file=file)
+    file_proxy = FileProxy(console, file, max_latency=0.05)
+    file_proxy.write("foo\n")
+    assert file.getvalue() == ""
+    # Lines are printed once they have waited max_latency, without further writes
+    for _ in range(100):
+        if file.getvalue():
+            break
+        time.sleep(0.01)
+    assert file.getvalue() == "foo\n"
+    assert not file_proxy.flush_lines()
+
+
+def test_coalesce_with():
+    file = io.StringIO()
+    console = Console(file=file)
+    stdout_proxy = FileProxy(console, file, max_latency=60)
+    stderr_proxy = FileProxy(console, file, max_latency=60, coalesce_with=stdout_proxy)
+    stdout_proxy.write("foo\n")
+    stderr_proxy.write("bar\n")
+    stdout_proxy.write("baz\n")
+    assert file.getvalue() == ""
+    assert stderr_proxy.flush_lines()
+    assert file.getvalue() == "foo\nbar\nbaz\n"
+    assert not stdout_proxy.flush_lines()
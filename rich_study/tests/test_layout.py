@@ -5,6 +5,8 @@ import pytest
 from rich.console import Console
 from rich.layout import Layout, NoSplitter
 from rich.panel import Panel
+from rich.pretty import Pretty
+from rich.segment import Segment
 
 
 def test_no_layout():
@@ -67,6 +69,119 @@ def test_render():
     assert result == expected
 
 
+def make_dashboard(render_workers=None):
+    layout = Layout(name="root", render_workers=render_workers)
+    layout.split_column(Layout(name="top"), Layout(name="bottom"))
+    layout["top"].split_row(
+        *[Layout(Panel(f"top {index}"), name=f"top{index}") for index in range(3)]
+    )
+    layout["bottom"].split_row(Layout(name="left"), Layout(name="right"))
+    layout["left"].update(Panel(Pretty(list(range(20)))))
+    return layout
+
+
+def test_render_workers():
+    console = Console(width=60, color_system=None)
+    with console.capture() as capture:
+        console.print(make_dashboard(), height=20)
+    expected = capture.get()
+
+    layout = make_dashboard(render_workers=4)
+    for _ in range(2):
+        with console.capture() as capture:
+            console.print(layout, height=20)
+        assert capture.get() == expected
+    assert layout._executor is not None
+
+    layout.render_workers = 2
+    with console.capture() as capture:
+        console.print(layout, height=20)
+    assert capture.get() == expected
+
+
+def test_close():
+    console = Console(width=60, color_system=None)
+    with console.capture() as capture:
+        console.print(make_dashboard(), height=20)
+    expected = capture.get()
+
+    with make_dashboard(render_workers=2) as layout:
+        with console.capture() as capture:
+            console.print(layout, height=20)
+        assert capture.get() == expected
+        executor = layout._executor
+        assert executor is not None
+    assert layout._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+    # Rendering after close starts a new pool
+    with console.capture() as capture:
+        console.print(layout, height=20)
+    assert capture.get() == expected
+    assert layout._executor is not None
+    layout.close()
+    layout.close()
+    assert layout._executor is None
+
+
+def test_render_workers_cached_lines():
+    class Versioned:
+        def __init__(self, index):
+            self.index = index
+
+        def __rich_version__(self):
+            return self.index
+
+        def __rich_console__(self, console, options):
+            for line in console.render_lines_cached(
+                f"[b]cell {self.index}", options, pad=False
+            ):
+                yield from line
+                yield Segment.line()
+
+    def make_layout(render_workers=None):
+        layout = Layout(render_workers=render_workers)
+        layout.split_row(
+            *[
+                Layout(Panel(Versioned(index % 3)))
+                if index % 2
+                else Layout(Panel(f"{index}"))
+                for index in range(8)
+            ]
+        )
+        return layout
+
+    console = Console(width=80, color_system=None)
+    console._LINES_CACHE_SIZE = 4
+    with console.capture() as capture:
+        console.print(make_layout(), height=5)
+    expected = capture.get()
+
+    with make_layout(render_workers=8) as layout:
+        for _ in range(20):
+            with console.capture() as capture:
+                console.print(layout, height=5)
+            assert capture.get() == expected
+    assert console._lines_cache_size == sum(
+        max(1, len(lines)) for _, _, lines in console._lines_cache.values()
+    )
+    assert 0 < console._lines_cache_size <= 4
+
+
+def test_render_workers_error():
+    class BrokenRenderable:
+        def __rich_console__(self, console, options):
+            raise ValueError("broken")
+
+    layout = make_dashboard(render_workers=2)
+    layout["right"].update(BrokenRenderable())
+    console = Console(width=60, color_system=None)
+    with pytest.raises(ValueError):
+        with console.capture():
+            console.print(layout, height=20)
+
+
 def test_tree():
     layout = Layout(name="root")
     layout.split(Layout("foo", size=2), Layout("bar", name="bar"))
@@ -98,3 +213,76 @@ def test_refresh_screen():
     print(repr(result))
     expected = "\x1b[1;1H\x1b[34m╭─\x1b[0m\x1b[34m \x1b[0m\x1b[32m'foo'\x1b[0m\x1b[34m─╮\x1b[0m\x1b[2;1H\x1b[34m│\x1b[0m \x1b[1;35mLayout\x1b[0m \x1b[34m│\x1b[0m\x1b[3;1H\x1b[34m│\x1b[0m \x1b[1m(\x1b[0m      \x1b[34m│\x1b[0m\x1b[4;1H\x1b[34m│\x1b[0m     \x1b[33mna\x1b[0m \x1b[34m│\x1b[0m\x1b[5;1H\x1b[34m╰────────╯\x1b[0m"
     assert result == expected
+
+
+class CountRenders:
+    def __init__(self, text):
+        self.text = text
+        self.renders = 0
+
+    def __rich_console__(self, console, options):
+        self.renders += 1
+        yield self.text
+
+
+def test_cache_renders():
+    foo = CountRenders("foo")
+    bar = CountRenders("bar")
+    layout = Layout(cache_renders=True)
+    layout.split_row(Layout(foo, name="foo"), Layout(bar, name="bar"))
+    console = Console(width=20, height=5, color_system=None)
+
+    def render():
+        with console.capture() as capture:
+            console.print(layout)
+        return capture.get()
+
+    first = render()
+    assert render() == first
+    assert (foo.renders, bar.renders) == (1, 1)
+
+    foo.text = "baz"
+    layout["foo"].invalidate()
+    assert render() != first
+    assert (foo.renders, bar.renders) == (2, 1)
+
+    layout["bar"].update(CountRenders("egg"))
+    assert "egg" in render()
+    assert (foo.renders, bar.renders) == (2, 1)
+
+    # Changing the size renders everything again
+    console.width = 30
+    render()
+    assert (foo.renders, bar.renders) == (3, 1)
+
+
+def test_cache_renders_disabled():
+    foo = CountRenders("foo")
+    layout = Layout(foo)
+    console = Console(width=20, height=5, color_system=None)
+    for _ in range(2):
+        with console.capture():
+            console.print(layout)
+    assert foo.renders == 2
+
+
+def test_refresh_changed():
+    layout = Layout()
+    layout.split_row(Layout("foo", name="foo"), Layout("bar", name="bar"))
+    console = Console(force_terminal=True, width=20, height=2, _environ={})
+    with console.screen():
+        with console.capture() as capture:
+            refreshed = layout.refresh_changed(console)
+        assert refreshed == [layout["foo"], layout["bar"]]
+        assert capture.get() == (
+            "\x1b[1;1Hfoo       \x1b[2;1H          \x1b[1;11Hbar       \x1b[2;11H          "
+        )
+
+        with console.capture() as capture:
+            assert layout.refresh_changed(console) == []
+        assert capture.get() == ""
+
+        layout["bar"].update("baz")
+        with console.capture() as capture:
+            assert layout.refresh_changed(console) == [layout["bar"]]
+        assert capture.get() == "\x1b[1;11Hbaz       \x1b[2;11H          "
@@ -1,10 +1,13 @@
 # encoding=utf-8
+import re
+import sys
+import threading
 import time
 from typing import Optional
 
 # import pytest
 from rich.console import Console
-from rich.live import Live
+from rich.live import Live, RefreshDriver, get_refresh_driver
 from rich.text import Text
 
 
@@ -143,6 +146,135 @@ def test_growing_display_console_redirect() -> None:
     )
 
 
+def test_redirect_coalesce() -> None:
+    console = create_capture_console()
+    console.begin_capture()
+    with Live(
+        "live", console=console, auto_refresh=False, redirect_max_latency=60
+    ) as live:
+        for step in range(100):
+            print(f"Line {step}")
+        live.refresh()
+        for step in range(100, 200):
+            print(f"Line {step}")
+    output = console.end_capture()
+    assert re.findall(r"Line \d+", output) == [f"Line {step}" for step in range(200)]
+    # The live display is redrawn once per batch, rather than once per line
+    assert output.count("live") == 3
+
+
+def test_redirect_coalesce_order() -> None:
+    console = create_capture_console()
+    console.begin_capture()
+    with Live("live", console=console, auto_refresh=False, redirect_max_latency=60):
+        for step in range(10):
+            print(f"Line {step}", file=sys.stderr if step % 2 else sys.stdout)
+    output = console.end_capture()
+    assert re.findall(r"Line \d+", output) == [f"Line {step}" for step in range(10)]
+
+
+def test_adaptive_refresh() -> None:
+    console = create_capture_console()
+    with Live(
+        "live", console=console, refresh_per_second=100, adaptive_refresh=True
+    ) as live:
+        refresh_count = len(live._refresh_times)
+        # Nothing has changed, so the display isn't refreshed
+        time.sleep(0.1)
+        assert len(live._refresh_times) == refresh_count
+        live.update("changed")
+        for _ in range(50):
+            if len(live._refresh_times) > refresh_count:
+                break
+            time.sleep(0.01)
+        assert len(live._refresh_times) == refresh_count + 1
+        assert not live._refresh_requested.is_set()
+
+
+def test_refresh_metrics() -> None:
+    console = create_capture_console()
+    with Live("live", console=console, auto_refresh=False) as live:
+        assert live.fps == 0.0
+        for _ in range(5):
+            live.refresh()
+        assert live.fps > 0
+        assert live.render_time > 0
+
+
+def test_get_refresh_interval() -> None:
+    live = Live(refresh_per_second=10, adaptive_refresh=True)
+    assert live.get_refresh_interval() == 0.1
+    # Back off when rendering is slow
+    live._render_time = 0.5
+    assert live.get_refresh_interval() == 1.0
+    live.adaptive_refresh = False
+    assert live.get_refresh_interval() == 0.1
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    start = time.monotonic()
+    while not condition():
+        if time.monotonic() - start > timeout:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_shared_refresh() -> None:
+    driver = get_refresh_driver()
+    lives = [
+        Live(
+            f"live {index}",
+            console=create_capture_console(),
+            refresh_per_second=50,
+            shared_refresh=True,
+        )
+        for index in range(3)
+    ]
+    for live in lives:
+        live.start()
+    try:
+        assert driver.lives == lives
+        assert all(live._refresh_thread is None for live in lives)
+        assert wait_for(lambda: all(len(live._refresh_times) >= 3 for live in lives))
+        threads = [
+            thread for thread in threading.enumerate() if thread.name == "rich-refresh"
+        ]
+        assert len(threads) == 1
+    finally:
+        for live in lives:
+            live.stop()
+    assert driver.lives == []
+    # The thread exits when there is nothing to refresh
+    assert wait_for(lambda: driver._thread is None)
+
+
+def test_shared_refresh_error() -> None:
+    class BrokenLive(Live):
+        def _refresh(self) -> None:
+            raise ValueError("broken")
+
+    driver = RefreshDriver()
+    broken = BrokenLive(console=create_capture_console(), refresh_per_second=50)
+    live = Live("live", console=create_capture_console(), refresh_per_second=50)
+    for display in (broken, live):
+        display._refresh_driver = driver
+        driver.register(display)
+    errors = []
+    excepthook = sys.excepthook
+    sys.excepthook = lambda *exc_info: errors.append(exc_info[1])
+    try:
+        assert wait_for(lambda: driver.lives == [live])
+        refresh_count = len(live._refresh_times)
+        assert wait_for(lambda: len(live._refresh_times) > refresh_count)
+    finally:
+        sys.excepthook = excepthook
+        driver.unregister(live)
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+    assert broken._refresh_driver is None
+
+
 def test_growing_display_file_console() -> None:
     console = create_capture_console(force_terminal=False)
     console.begin_capture()
@@ -1,4 +1,7 @@
-from rich._palettes import STANDARD_PALETTE
+import random
+
+from rich._palettes import EIGHT_BIT_PALETTE, STANDARD_PALETTE, WINDOWS_PALETTE
+from rich.palette import Palette
 from rich.table import Table
 
 
@@ -6,3 +9,42 @@ def test_rich_cast():
     table = STANDARD_PALETTE.__rich__()
     assert isinstance(table, Table)
     assert table.row_count == 16
+
+
+def test_match():
+    assert STANDARD_PALETTE.match((0, 0, 0)) == 0
+    assert STANDARD_PALETTE.match((255, 0, 0)) == 1
+    assert STANDARD_PALETTE.match((255, 255, 255)) == 15
+    assert WINDOWS_PALETTE.match((128, 128, 128)) == 8
+
+
+def test_match_lookup():
+    """Check the lookup table agrees with a search of the whole palette."""
+    rng = random.Random(42)
+    colors = [
+        (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        for _ in range(5000)
+    ]
+    # Colors at the corners of lookup table cells
+    colors.extend(
+        (red, green, blue)
+        for red in (0, 7, 8, 247, 248, 255)
+        for green in (0, 127, 128)
+        for blue in (0, 63, 64, 255)
+    )
+    for palette in (STANDARD_PALETTE, WINDOWS_PALETTE):
+        all_colors = range(len(palette._colors))
+        for color in colors:
+            assert palette.match(color) == palette._match_colors(color, all_colors)
+
+
+def test_match_outside_lookup():
+    palette = Palette([(0, 0, 0), (255, 255, 255)])
+    assert palette.match((300, 300, 300)) == 1
+    assert palette.match((-10, 0, 0)) == 0
+
+
+def test_match_large_palette():
+    # Too many colors for the lookup table
+    assert EIGHT_BIT_PALETTE.match((255, 0, 0)) == 9
+    assert EIGHT_BIT_PALETTE._lookup is None
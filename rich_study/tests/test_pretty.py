@@ -460,6 +460,51 @@ def test_max_depth_rich_repr() -> None:
     )
 
 
+def test_max_nodes() -> None:
+    data = {"foo": [1, 2, 3], "bar": [4, 5, 6]}
+    assert pretty_repr(data, max_nodes=1) == "{... +2}"
+    assert pretty_repr(data, max_nodes=4) == "{'foo': [1, 2, ... +1], ... +1}"
+    assert pretty_repr(data, max_nodes=9) == repr(data)
+    assert pretty_repr(data, max_nodes=None) == repr(data)
+
+
+def test_max_nodes_dataclass() -> None:
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    assert pretty_repr([Point(1, 2), Point(3, 4)], max_nodes=4) == (
+        "[Point(x=1, y=2), ... +1]"
+    )
+    assert pretty_repr(Point(1, 2), max_nodes=2) == "Point(x=1, ...)"
+
+
+def test_max_nodes_large_container() -> None:
+    data = dict.fromkeys(range(1_000_000))
+    result = pretty_repr(data, max_nodes=3, max_width=100)
+    assert result == "{0: None, 1: None, ... +999998}"
+
+
+def test_deeply_nested() -> None:
+    data: List[Any] = []
+    node = data
+    for _ in range(sys.getrecursionlimit() * 2):
+        node.append([])
+        node = node[0]
+    depth = sys.getrecursionlimit() * 2
+    assert pretty_repr(data, max_width=depth * 4) == "[" * (depth + 1) + "]" * (
+        depth + 1
+    )
+
+
+def test_pretty_max_nodes() -> None:
+    console = Console(width=80, color_system=None)
+    with console.capture() as capture:
+        console.print(Pretty(list(range(100)), max_nodes=4))
+    assert capture.get() == "[0, 1, 2, ... +97]\n"
+
+
 def test_max_depth_attrs() -> None:
     @attr.define
     class Foo:
@@ -0,0 +1,130 @@
+import json
+
+from rich.console import Console, Group
+from rich.panel import Panel
+from rich.profiler import RenderProfiler
+from rich.table import Table
+from rich.text import Text
+
+
+def make_renderable():
+    table = Table("foo", "bar")
+    table.add_row(Panel("Hello"), Text("World"))
+    return Panel(Group(table, "baz"))
+
+
+def test_profile_output_unchanged():
+    console = Console(width=40, color_system=None)
+    with console.capture() as capture:
+        console.print(make_renderable())
+    expected = capture.get()
+    with console.capture() as capture:
+        with console.profile():
+            console.print(make_renderable())
+    assert capture.get() == expected
+    assert console._render_profiler is None
+
+
+def test_profile_stats():
+    console = Console(width=40, color_system=None)
+    with console.capture():
+        with console.profile() as profiler:
+            console.print(make_renderable())
+            console.print(make_renderable())
+    stats = profiler.stats
+    assert stats[("Panel",)].calls == 2
+    assert stats[("Panel", "Padding", "Group")].calls == 2
+    assert stats[("Panel", "Padding", "Group", "str")].calls == 2
+    table_stats = stats[("Panel", "Padding", "Group", "Table")]
+    assert table_stats.calls == 2
+    assert table_stats.segments > 0
+    # Table cells are measured then rendered
+    cell_stats = stats[("Panel", "Padding", "Group", "Table", "Padding")]
+    assert cell_stats.measure_calls == 8
+    assert cell_stats.calls == 8
+    root = stats[("Panel",)]
+    assert root.segments >= table_stats.segments
+    assert root.time >= table_stats.time
+    assert root.self_time <= root.time
+
+
+def test_profile_time():
+    console = Console(width=40, color_system=None)
+    time = 0.0
+
+    def get_time():
+        nonlocal time
+        time += 1.0
+        return time
+
+    with console.capture():
+        with RenderProfiler(console, get_time=get_time) as profiler:
+            console.print(Group("foo"))
+    group_stats = profiler.stats[("Group",)]
+    str_stats = profiler.stats[("Group", "str")]
+    assert group_stats.time == group_stats.child_time + group_stats.self_time
+    assert group_stats.child_time == str_stats.time
+    assert str_stats.self_time == str_stats.time
+
+
+def test_profile_zero_width():
+    console = Console(width=40, color_system=None)
+    options = console.options.update_width(0)
+    expected = list(console.render(make_renderable(), options))
+    assert expected == []
+    with console.profile() as profiler:
+        assert list(console.render(make_renderable(), options)) == expected
+        assert list(profiler.render(make_renderable(), options)) == expected
+    assert profiler.stats == {}
+
+
+def test_iter_stats_tree_order():
+    console = Console(width=40, color_system=None)
+    with console.capture():
+        with console.profile() as profiler:
+            console.print(make_renderable())
+    paths = [stats.path for stats in profiler.iter_stats()]
+    assert paths[0] == ("Panel",)
+    assert sorted(paths) == sorted(profiler.stats)
+    for index, path in enumerate(paths[1:], 1):
+        # Parents always precede their children
+        assert path[:-1] in paths[:index]
+
+
+def test_to_json():
+    console = Console(width=40, color_system=None)
+    with console.capture():
+        with console.profile() as profiler:
+            console.print(make_renderable())
+    roots = json.loads(profiler.to_json())
+    assert [root["name"] for root in roots] == ["Panel"]
+    assert roots[0]["calls"] == 1
+    assert roots[0]["children"][0]["name"] == "Padding"
+
+
+def test_dump_table():
+    console = Console(width=100, color_system=None)
+    with console.capture() as capture:
+        with console.profile(dump="table"):
+            console.print("Hello")
+    output = capture.get()
+    assert "Render profile" in output
+    assert "Text" in output
+
+
+def test_dump_json():
+    console = Console(width=100, color_system=None)
+    with console.capture() as capture:
+        with console.profile(dump="json"):
+            console.print("Hello")
+    output = capture.get()
+    assert json.loads(output.split("\n", 1)[1])[0]["name"] == "Text"
+
+
+def test_clear():
+    console = Console(width=40, color_system=None)
+    with console.capture():
+        with console.profile() as profiler:
+            console.print("Hello")
+            profiler.clear()
+    assert profiler.stats == {}
@@ -26,6 +26,7 @@ from rich.progress import (
     TimeRemainingColumn,
     TotalFileSizeColumn,
     TransferSpeedColumn,
+    _MmapReader,
     _TrackThread,
     track,
 )
@@ -527,6 +528,22 @@ def test_progress_max_refresh() -> None:
     )
 
 
+def test_adaptive_refresh_requests() -> None:
+    progress = Progress(auto_refresh=False, adaptive_refresh=True)
+    assert progress.live.adaptive_refresh
+    refresh_requested = progress.live._refresh_requested
+    task_id = progress.add_task("foo", total=10)
+    for method, args in [
+        (progress.advance, (task_id,)),
+        (progress.update, (task_id,)),
+        (progress.stop_task, (task_id,)),
+        (progress.remove_task, (task_id,)),
+    ]:
+        refresh_requested.clear()
+        method(*args)
+        assert refresh_requested.is_set()
+
+
 def test_live_is_started_if_progress_is_enabled() -> None:
     progress = Progress(auto_refresh=False, disable=False)
 
@@ -602,6 +619,102 @@ def test_open_text_mode() -> None:
         os.remove(filename)
 
 
+def test_open_update_size() -> None:
+    progress = Progress(auto_refresh=False, get_time=lambda: 0.0)
+    advances = []
+    progress_advance = progress.advance
+
+    def advance(task_id: TaskID, advance: float = 1) -> None:
+        advances.append(advance)
+        progress_advance(task_id, advance)
+
+    progress.advance = advance  # type: ignore[method-assign]
+
+    fd, filename = tempfile.mkstemp()
+    with os.fdopen(fd, "wb") as f:
+        total = f.write(b"".join(b"line %03d\n" % index for index in range(100)))
+    try:
+        with progress.open(filename, "rb", update_size=200) as f:
+            lines = list(f)
+        assert len(lines) == 100
+        task = progress.tasks[0]
+        assert task.completed == total
+        # Updates are batched, and end of file is always reported
+        assert advances == [207] * 4 + [72]
+    finally:
+        os.remove(filename)
+
+
+def test_wrap_file_update_period() -> None:
+    time = 0.0
+    progress = Progress(auto_refresh=False, get_time=lambda: time)
+    file = io.BytesIO(b"line\n" * 10)
+    reader = progress.wrap_file(file, total=50, update_size=1000, update_period=2)
+    task = progress.tasks[0]
+    reader.readline()
+    assert task.completed == 0
+    time = 1.0
+    reader.readline()
+    assert task.completed == 0
+    # Pending bytes are reported once update_period has passed
+    time = 2.0
+    reader.readline()
+    assert task.completed == 15
+    reader.readline()
+    assert task.completed == 15
+    time = 4.0
+    reader.readline()
+    assert task.completed == 25
+
+
+def test_open_mmap() -> None:
+    progress = Progress(auto_refresh=False)
+    fd, filename = tempfile.mkstemp()
+    with os.fdopen(fd, "wb") as f:
+        f.write(b"Hello\nWorld\nfoo\nbar\n")
+    try:
+        with progress.open(filename, "rb", memory_map=True) as f:
+            assert isinstance(f, _MmapReader)
+            task = progress.tasks[0]
+            assert next(f) == b"Hello\n"
+            assert task.completed == 6
+            buffer = bytearray(3)
+            assert f.readinto(buffer) == 3
+            assert buffer == b"Wor"
+            assert f.readline(1) == b"l"
+            assert f.readline() == b"d\n"
+            assert task.completed == 12
+            assert f.readlines() == [b"foo\n", b"bar\n"]
+            assert task.completed == 20
+            assert f.read() == b""
+            assert f.seek(6) == 6
+            assert task.completed == 6
+            assert f.read(5) == b"World"
+            assert f.tell() == 11
+            assert list(f) == [b"\n", b"foo\n", b"bar\n"]
+            assert f.readinto(buffer) == 0
+        assert f.closed
+        assert f.mapping.closed
+
+        with progress.open(filename, "r", memory_map=True) as text_file:
+            assert text_file.readlines() == ["Hello\n", "World\n", "foo\n", "bar\n"]
+        assert text_file.closed
+    finally:
+        os.remove(filename)
+
+
+def test_open_mmap_empty() -> None:
+    progress = Progress(auto_refresh=False)
+    fd, filename = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        with progress.open(filename, "rb", memory_map=True) as f:
+            assert not isinstance(f, _MmapReader)
+            assert f.read() == b""
+    finally:
+        os.remove(filename)
+
+
 def test_wrap_file() -> None:
     fd, filename = tempfile.mkstemp()
     with os.fdopen(fd, "wb") as f:
@@ -660,6 +773,56 @@ def test_task_progress_column_speed() -> None:
     assert speed_text.plain == "8.9×10⁶ it/s"
 
 
+def test_task_speed_running_total() -> None:
+    time = 0.0
+    progress = Progress(
+        get_time=lambda: time, auto_refresh=False, speed_estimate_period=300
+    )
+    task_id = progress.add_task("foo")
+    task = progress.tasks[0]
+    for step in range(3000):
+        time += 0.1 + step % 7 * 0.05
+        if step % 5:
+            progress.advance(task_id, step % 3)
+        else:
+            progress.update(task_id, advance=step % 4)
+        samples = list(task._progress)
+        assert task._progress_total == sum(sample.completed for sample in samples)
+        if len(samples) > 1:
+            assert task.speed == pytest.approx(
+                sum(sample.completed for sample in samples[1:])
+                / (samples[-1].timestamp - samples[0].timestamp)
+            )
+    progress.reset(task_id)
+    assert task._progress_total == 0
+    assert task.speed is None
+
+
+def test_task_speed_ewma() -> None:
+    time = 0.0
+    progress = Progress(
+        get_time=lambda: time,
+        auto_refresh=False,
+        speed_estimate_period=10,
+        speed_estimator="ewma",
+    )
+    task_id = progress.add_task("foo", total=1000)
+    task = progress.tasks[0]
+    assert task.speed is None
+    for _ in range(100):
+        time += 0.5
+        progress.advance(task_id, 5)
+    assert task.speed == pytest.approx(10)
+    assert task.time_remaining == 50
+    # The estimate moves towards the new speed
+    for _ in range(20):
+        time += 0.5
+        progress.advance(task_id, 10)
+    assert 10 < task.speed < 20
+    progress.reset(task_id)
+    assert task.speed is None
+
+
 if __name__ == "__main__":
     _render = render_progress()
     print(_render)
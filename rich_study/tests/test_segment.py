@@ -3,7 +3,7 @@ from io import StringIO
 import pytest
 
 from rich.cells import cell_len
-from rich.segment import ControlType, Segment, SegmentLines, Segments
+from rich.segment import ControlType, LineBlock, Segment, SegmentLines, Segments
 from rich.style import Style
 
 
@@ -320,6 +320,31 @@ def test_split_cells_doubles() -> None:
         assert cell_len(right.text) == test.cell_length - position
 
 
+def test_split_cells_zero_width() -> None:
+    """Check that zero width characters stay with the preceding character."""
+    segment = Segment("e\u0301早x", Style(bold=True))
+    assert segment.split_cells(1) == (
+        Segment("e\u0301", Style(bold=True)),
+        Segment("早x", Style(bold=True)),
+    )
+    assert segment.split_cells(2) == (
+        Segment("e\u0301 ", Style(bold=True)),
+        Segment(" x", Style(bold=True)),
+    )
+    assert segment.split_cells(4) == (segment, Segment("", Style(bold=True)))
+
+
+def test_split_cells_zero_width_start() -> None:
+    segment = Segment("\u200d😀本")
+    assert segment.split_cells(0) == (Segment(""), segment)
+    assert Segment("\u200d").split_cells(0) == (Segment("\u200d"), Segment(""))
+
+
+def test_split_cells_control() -> None:
+    control = Segment("早\t", None, [(ControlType.BELL,)])
+    assert control.split_cells(1) == (control, Segment("", None, control.control))
+
+
 def test_split_cells_single() -> None:
     """Check that split cells splits on cell positions with all single width characters."""
     test = Segment("A" * 20)
@@ -378,3 +403,64 @@ def test_align_bottom():
         [Segment("   ", Style())],
         [Segment("X")],
     ]
+
+
+def test_line_block_from_segments():
+    segments = [Segment("foo\nbar baz\n"), Segment("💩", Style(bold=True))]
+    block = LineBlock.from_segments(segments, 5)
+    assert block.lines == list(
+        Segment.split_and_crop_lines(segments, 5, include_new_lines=False)
+    )
+    assert block.widths == [5, 5, 5]
+    assert block.shape == (5, 3)
+    block = LineBlock.from_segments(segments, 5, pad=False)
+    assert block.widths == [3, 5, 2]
+    block = LineBlock.from_segments(segments)
+    assert block.lines == list(Segment.split_lines(segments))
+    assert block.widths == [3, 7, 2]
+    assert LineBlock([]).shape == (0, 0)
+
+
+def test_line_block_set_shape():
+    block = LineBlock([[Segment("Hello")], [Segment("foo")]])
+    assert block.widths == [5, 3]
+    shaped = block.set_shape(4, 3)
+    assert shaped.lines == [
+        [Segment("Hell")],
+        [Segment("foo"), Segment(" ")],
+        [Segment("    ")],
+    ]
+    assert shaped.widths == [4, 4, 4]
+    assert block.set_shape(5).lines[0] is block.lines[0]
+    assert block.set_shape(3, 1).lines == [[Segment("Hel")]]
+
+
+def test_line_block_align():
+    block = LineBlock([[Segment("X")]])
+    style = Style(bold=True)
+    for method in ("align_top", "align_middle", "align_bottom"):
+        aligned = getattr(block, method)(3, 3, style)
+        assert aligned.lines == getattr(Segment, method)(block.lines, 3, 3, style)
+        assert aligned.widths == [
+            1 if line == [Segment("X")] else 3 for line in aligned
+        ]
+        assert getattr(block, method)(3, 0, style).lines == []
+
+
+def test_line_block_append():
+    block = LineBlock([[Segment("foo")]]).crop_height(1)
+    block.append([Segment("foo bar")])
+    assert block.shape == (7, 2)
+    assert list(block) == [[Segment("foo")], [Segment("foo bar")]]
+    assert len(block.crop_height(1)) == 1
+
+
+def test_line_block_shares_lines() -> None:
+    lines = [[Segment("foo")], [Segment("ba"), Segment("r")]]
+    block = LineBlock(lines, [3, 3])
+    shaped = block.set_shape(3, 3).align_top(3, 4)
+    assert shaped.lines[0] is lines[0]
+    assert shaped.lines[1] is lines[1]
+    block.set_shape(2)
+    block.set_shape(4)
+    assert lines == [[Segment("foo")], [Segment("ba"), Segment("r")]]
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from rich import errors
@@ -170,6 +172,32 @@ def test_add():
     assert Style(color="red") + None == Style(color="red")
 
 
+def test_add_shares_combined_styles():
+    combined = Style(color="red") + Style(bold=True)
+    # Equal styles combine to the same object
+    assert Style(color="red") + Style(bold=True) is combined
+    assert Style(bold=True) + Style(color="red") == combined
+    linked = Style(color="red") + Style(link="https://example.org")
+    assert linked.link == "https://example.org"
+    # Links get a new id each time
+    assert (
+        Style(color="red") + Style(link="https://example.org")
+    )._link_id != linked._link_id
+
+
+def test_add_cache_size(monkeypatch):
+    from rich import style
+
+    monkeypatch.setattr(Style, "_COMBINE_CACHE_SIZE", 10)
+    monkeypatch.setattr(style, "_combine_cache", {})
+    red = Style(color="red")
+    for index in range(25):
+        assert red + Style(bgcolor=Color.from_ansi(index)) == Style(
+            color="red", bgcolor=Color.from_ansi(index)
+        )
+    assert len(style._combine_cache) <= 10
+
+
 def test_iadd():
     style = Style(color="red")
     style += Style(bold=True)
@@ -220,6 +248,62 @@ def test_meta():
     assert repr(style) == "Style(bold=True, meta={'foo': 'bar', 'egg': 'baz'})"
 
 
+def test_meta_shared():
+    style1 = Style(meta={"foo": "bar", "egg": 1})
+    style2 = Style.from_meta({"egg": 1, "foo": "bar"})
+    assert style1._meta is style2._meta
+    assert style1 == style2
+    assert style1.meta is not style2.meta
+
+
+def test_meta_unhashable():
+    style = Style(meta={"foo": ["bar"]})
+    assert style == Style(meta={"foo": ["bar"]})
+    assert style != Style(meta={"foo": ["baz"]})
+    assert (style + Style(meta={"egg": {"baz": 1}})).meta == {
+        "foo": ["bar"],
+        "egg": {"baz": 1},
+    }
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        (True, 1, 1.0),
+        ((True,), (1,), (1.0,)),
+        ([True], [1], [1.0]),
+    ],
+)
+def test_meta_equal_values_of_different_types(values):
+    styles = [Style(meta={"x": value}) for value in values]
+    for style, value in zip(styles, values):
+        assert style.meta["x"] == value
+        assert type(style.meta["x"]) is type(value)
+    assert styles[0] != styles[1]
+    assert styles[1] != styles[2]
+    assert styles[0] != styles[2]
+    combined = Style(meta={"x": 1}) + Style(meta={"y": True})
+    assert type(combined.meta["y"]) is bool
+
+
+def test_meta_combine_not_serialized(monkeypatch):
+    style1 = Style(bold=True, meta={"foo": "bar"})
+    style2 = Style(meta={"foo": "baz", "egg": 1})
+
+    def dumps(obj):
+        raise AssertionError("meta should not be serialized")
+
+    monkeypatch.setattr("rich.style.dumps", dumps)
+    combined = style1 + style2
+    assert combined.meta == {"foo": "baz", "egg": 1}
+    assert hash(combined) == hash(Style(bold=True, meta={"foo": "baz", "egg": 1}))
+
+
+def test_meta_pickle():
+    style = Style(bold=True, meta={"foo": "bar"})
+    assert pickle.loads(pickle.dumps(style)) == style
+
+
 def test_from_meta():
     style = Style.from_meta({"foo": "bar"})
     assert style.color is None
@@ -265,3 +349,25 @@ def test_clear_meta_and_links_clears_hash():
 
     clear_style = style.clear_meta_and_links()
     assert clear_style._hash is None
+
+
+def test_gradient():
+    strip = Style.gradient(["#ff0000", "#0000ff"], 5)
+    assert [style.color.triplet for style in strip] == [
+        (255, 0, 0),
+        (191, 0, 63),
+        (127, 0, 127),
+        (63, 0, 191),
+        (0, 0, 255),
+    ]
+    assert Style.gradient(["#ff0000", "#0000ff"], 5) is strip
+    background_strip = Style.gradient(["#ff0000", "#0000ff"], 5, background=True)
+    assert background_strip[0] == Style(bgcolor="#ff0000")
+
+
+def test_gradient_downgrade():
+    strip = Style.gradient(["red", "blue"], 20, ColorSystem.STANDARD)
+    assert len(strip) == 20
+    assert all(style.color.type == ColorType.STANDARD for style in strip)
+    # Cells with the same downgraded color share a style
+    assert len({id(style) for style in strip}) == len(set(strip)) < 20
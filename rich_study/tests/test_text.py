@@ -1,9 +1,12 @@
 import re
 from io import StringIO
-from typing import List
+from threading import Barrier, Thread, get_ident
+from time import sleep
+from typing import Dict, List
 
 import pytest
 
+from rich import _wrap
 from rich.console import Console, Group
 from rich.measure import Measurement
 from rich.style import Style
@@ -553,6 +556,82 @@ def test_wrap_long_words():
     ]
 
 
+def test_wrap_cache():
+    console = Console()
+    text = Text("foo bar baz\negg\tspam")
+    assert [line.plain for line in text.wrap(console, 7)] == [
+        "foo bar",
+        "baz",
+        "egg    ",
+        "spam",
+    ]
+    wrap_args = [
+        (3, {}),
+        (7, {}),
+        (3, {"overflow": "crop"}),
+        (7, {"tab_size": 4}),
+        (16, {"tab_size": 4}),
+    ]
+    # Wrap twice, the second time with cached offsets
+    for width, kwargs in wrap_args * 2:
+        expected = Text(text.plain).wrap(console, width, **kwargs)
+        assert text.wrap(console, width, **kwargs)._lines == expected._lines
+
+
+def test_wrap_cache_invalidated():
+    console = Console()
+    text = Text("foo bar")
+    assert [line.plain for line in text.wrap(console, 4)] == ["foo ", "bar"]
+    text.append(" baz")
+    assert [line.plain for line in text.wrap(console, 4)] == ["foo ", "bar ", "baz"]
+    text.plain = "hello world"
+    assert [line.plain for line in text.wrap(console, 4)] == [
+        "hell",
+        "o ",
+        "worl",
+        "d",
+    ]
+
+
+def test_wrap_cache_threads(monkeypatch):
+    console = Console()
+    text = Text("foo bar\negg spam baz\na b c d e f g")
+    expected = [line.plain for line in Text(text.plain).wrap(console, 7)]
+
+    # Make two threads measure the first line at the same time, then have the second
+    # thread store its measurements while the first is measuring the last line
+    barrier = Barrier(2, timeout=5)
+    roles: Dict[int, int] = {}
+
+    def measure_words(plain):
+        thread_id = get_ident()
+        if plain == "foo bar" and len(roles) < 2:
+            roles[thread_id] = barrier.wait()
+            if roles[thread_id]:
+                sleep(0.1)
+        elif plain == "a b c d e f g" and roles.get(thread_id) == 0:
+            sleep(0.2)
+        return _wrap.measure_words(plain)
+
+    monkeypatch.setattr("rich.text.measure_words", measure_words)
+    # Create the cache, without measuring any words
+    text.wrap(console, 7, no_wrap=True)
+    results: List[List[str]] = []
+
+    def wrap() -> None:
+        results.append([line.plain for line in text.wrap(console, 7)])
+
+    threads = [Thread(target=wrap) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected, expected]
+    assert [line.plain for line in text.wrap(console, 4)] == [
+        line.plain for line in Text(text.plain).wrap(console, 4)
+    ]
+
+
 def test_wrap_long_words_2():
     # https://github.com/Textualize/rich/issues/2273
     text = Text("Hello, World...123")
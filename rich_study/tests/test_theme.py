@@ -51,3 +51,15 @@ def test_theme_stack():
     assert stack.get("warning") == Style.parse("red")
     with pytest.raises(ThemeStackError):
         stack.pop_theme()
+
+
+def test_theme_stack_version():
+    stack = ThemeStack(Theme())
+    other_stack = ThemeStack(Theme())
+    assert stack.version != other_stack.version
+    versions = {stack.version}
+    stack.push_theme(Theme({"warning": "red"}))
+    versions.add(stack.version)
+    stack.pop_theme()
+    versions.add(stack.version)
+    assert len(versions) == 3
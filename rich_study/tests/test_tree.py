@@ -143,3 +143,59 @@ def test_tree_measure():
     console = Console()
     measurement = Measurement.get(console, console.options, tree)
     assert measurement == Measurement(12, 20)
+
+
+def render_tree(tree: Tree) -> str:
+    console = Console(color_system=None, width=20)
+    console.begin_capture()
+    console.print(tree)
+    return console.end_capture()
+
+
+def test_render_max_children():
+    tree = Tree("foo", max_children=2)
+    for index in range(5):
+        tree.add(f"bar{index}")
+    assert render_tree(tree) == "foo\n├── bar0\n├── bar1\n└── ... +3\n"
+
+
+def test_render_max_depth():
+    tree = Tree("foo", max_depth=1)
+    tree.add("bar").add("baz").add("egg")
+    tree.add("qux")
+    assert render_tree(tree) == "foo\n├── bar\n│   └── ... +1\n└── qux\n"
+
+
+def test_render_summarize():
+    tree = Tree("foo")
+    bar = tree.add("bar", expanded=False)
+    bar.add("baz")
+    bar.add("qux")
+    assert render_tree(tree) == "foo\n└── bar\n"
+    tree.summarize = True
+    assert render_tree(tree) == "foo\n└── bar\n    └── ... +2\n"
+
+
+def test_render_load_children():
+    calls = []
+
+    def load_children():
+        calls.append(1)
+        for index in range(1000):
+            yield Tree(f"bar{index}")
+
+    tree = Tree("foo", load_children=load_children, max_children=2)
+    tree.add("baz", expanded=False, load_children=load_children)
+    assert render_tree(tree) == "foo\n├── baz\n├── bar0\n└── ...\n"
+    assert len(calls) == 1
+    tree.max_children = None
+    assert render_tree(tree).count("\n") == 1002
+
+
+def test_tree_measure_max_depth():
+    tree = Tree("foo", max_depth=1)
+    tree.add("bar").add("mushroom risotto")
+    console = Console()
+    measurement = Measurement.get(console, console.options, tree)
+    # Measures the summary ("... +1") rather than the hidden node
+    assert measurement == Measurement(11, 14)
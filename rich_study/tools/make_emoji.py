@@ -8,5 +8,29 @@ from emoji.unicode_codes import EMOJI_ALIAS_UNICODE
 
 emoji = {k.lower().strip(":"): v for k, v in EMOJI_ALIAS_UNICODE.items()}
 
-with open("_emoji_codes.py", "wt") as f:
-    f.write("EMOJI=" + str(emoji))
+TEMPLATE = '''\
+"""Emoji names and characters, generated by tools/make_emoji.py.
+
+Stored as a single string of lines, sorted by name, as it loads much faster than a dict.
+Use :func:`rich._emoji_replace.get_emoji` to look up an emoji by name.
+"""
+
+from typing import Any
+
+EMOJI_TABLE = """\\
+{table}"""
+
+
+def __getattr__(name: str) -> Any:
+    # Build the dict that this module used to define, for backwards compatibility
+    if name == "EMOJI":
+        fields = EMOJI_TABLE.split()
+        emoji = globals()["EMOJI"] = dict(zip(fields[::2], fields[1::2]))
+        return emoji
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+'''
+
+table = "".join(f"{name} {emoji[name]}\n" for name in sorted(emoji))
+
+with open("_emoji_codes.py", "wt", encoding="utf-8") as f:
+    f.write(TEMPLATE.format(table=table))
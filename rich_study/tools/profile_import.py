@@ -0,0 +1,41 @@
+"""
+Measure the time taken to import rich.console in a fresh interpreter.
+
+Exits with a non-zero return code if the median time exceeds a budget, e.g.
+
+    python tools/profile_import.py --budget 60
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CODE = """\
+from time import perf_counter
+start = perf_counter()
+import {module}
+print(perf_counter() - start)
+"""
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--module", default="rich.console", help="module to import")
+parser.add_argument("--runs", type=int, default=20, help="number of imports to time")
+parser.add_argument("--budget", type=float, default=None, help="budget in ms")
+args = parser.parse_args()
+
+times = [
+    float(
+        subprocess.check_output(
+            [sys.executable, "-c", CODE.format(module=args.module)], text=True
+        )
+    )
+    * 1000
+    for _ in range(args.runs)
+]
+median = statistics.median(times)
+print(f"import {args.module}: median {median:.1f}ms, min {min(times):.1f}ms")
+if args.budget is not None and median > args.budget:
+    print(f"over budget of {args.budget:.1f}ms")
+    sys.exit(1)